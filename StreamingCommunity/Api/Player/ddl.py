@@ -3,14 +3,11 @@
 import logging
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 
 
 # Variable
@@ -46,7 +43,7 @@ class VideoSource:
             - str: The response content if successful, None otherwise.
         """
         try:
-            response = httpx.get(
+            response = session_registry.get(
                 url=url, 
                 headers=self.headers, 
                 cookies=self.cookie,
@@ -72,7 +69,7 @@ class VideoSource:
             text = self.make_request(self.url)
 
             if text:
-                soup = BeautifulSoup(text, "html.parser")
+                soup = get_soup(text)
                 source = soup.find("source")
 
                 if source:
@@ -7,12 +7,13 @@ import logging
 # External libraries
 import httpx
 import jsbeautifier
-from bs4 import BeautifulSoup
 
 
 # Internal utilities
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 
 
 # Variable
@@ -40,11 +41,11 @@ class VideoSource:
         try:
 
             # Send a GET request to the initial URL
-            response = httpx.get(self.url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
+            response = session_registry.get(self.url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
             response.raise_for_status()
 
             # Extract the redirect URL from the HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = get_soup(response.text)
             self.redirect_url = soup.find("div", id="iframen1").get("data-src")
             logging.info(f"Redirect URL: {self.redirect_url}")
 
@@ -65,11 +66,11 @@ class VideoSource:
         try:
 
             # Send a GET request to the redirect URL
-            response = httpx.get(self.redirect_url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
+            response = session_registry.get(self.redirect_url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
             response.raise_for_status()
 
             # Extract the Maxstream URL from the HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = get_soup(response.text)
             maxstream_url = soup.find("a")
             
             if maxstream_url is None:
@@ -84,14 +85,14 @@ class VideoSource:
 
                 # Make request to stayonline api
                 data = {'id': self.redirect_url.split("/")[-2], 'ref': ''}
-                response = httpx.post('https://stayonline.pro/ajax/linkEmbedView.php', headers=headers, data=data)
+                response = session_registry.post('https://stayonline.pro/ajax/linkEmbedView.php', headers=headers, data=data)
                 response.raise_for_status()
                 uprot_url = response.json()['data']['value']
 
                 # Retry getting maxtstream url
-                response = httpx.get(uprot_url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
+                response = session_registry.get(uprot_url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = get_soup(response.text)
                 maxstream_url = soup.find("a").get("href")
                 
             else:
@@ -117,9 +118,9 @@ class VideoSource:
         try:
             
             # Send a GET request to the Maxstream URL
-            response = httpx.get(self.maxstream_url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
+            response = session_registry.get(self.maxstream_url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
             response.raise_for_status() 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = get_soup(response.text)
 
             # Iterate over all script tags in the HTML
             for script in soup.find_all("script"):
@@ -5,7 +5,6 @@ import logging
 
 
 # External libraries
-import httpx
 import jsbeautifier
 from bs4 import BeautifulSoup
 
@@ -13,6 +12,8 @@ from bs4 import BeautifulSoup
 # Internal utilities
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 
 
 # Variable
@@ -32,7 +33,6 @@ class VideoSource:
             'accept-language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7',
             'User-Agent': get_headers()
         }
-        self.client = httpx.Client()
         self.url = url
 
     def make_request(self, url: str) -> str:
@@ -47,7 +47,7 @@ class VideoSource:
         """
 
         try:
-            response = self.client.get(
+            response = session_registry.get(
                 url=url, 
                 headers=self.headers, 
                 follow_redirects=True, 
@@ -72,7 +72,7 @@ class VideoSource:
         """
 
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = get_soup(html_content)
             return soup
         
         except Exception as e:
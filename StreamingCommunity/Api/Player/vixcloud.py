@@ -5,13 +5,10 @@ import logging
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_iframe_src, get_body_scripts
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util._jsonConfig import config_manager
 from .Helper.Vixcloud.util import WindowVideo, WindowParameter, StreamsCollection
@@ -63,16 +60,15 @@ class VideoSource:
         try:
 
             # Make a request to get iframe source
-            response = httpx.get(
+            response = session_registry.get(
                 url=f"https://{self.base_name}.{self.domain}/iframe/{self.media_id}", 
                 params=params, 
                 timeout=max_timeout
             )
             response.raise_for_status()
 
-            # Parse response with BeautifulSoup to get iframe source
-            soup = BeautifulSoup(response.text, "html.parser")
-            self.iframe_src = soup.find("iframe").get("src")
+            # Get iframe source
+            self.iframe_src = get_iframe_src(response.text)
 
         except Exception as e:
             logging.error(f"Error getting iframe source: {e}")
@@ -112,7 +108,7 @@ class VideoSource:
 
                 # Make a request to get content
                 try:
-                    response = httpx.get(
+                    response = session_registry.get(
                         url=self.iframe_src, 
                         headers=self.headers, 
                         timeout=max_timeout
@@ -123,9 +119,8 @@ class VideoSource:
                     logging.error(f"Failed to get vixcloud contente with error: {e}")
                     sys.exit(0)
 
-                # Parse response with BeautifulSoup to get content
-                soup = BeautifulSoup(response.text, "html.parser")
-                script = soup.find("body").find("script").text
+                # First script of the body holds the video information
+                script = get_body_scripts(response.text)[0]
 
                 # Parse script to get video information
                 self.parse_script(script_text=script)
@@ -186,7 +181,7 @@ class VideoSource:
 
         # API request to get video details
         video_api_url = f'https://{self.base_name}.{self.domain}/api/video/{scws_id}'
-        response = httpx.get(video_api_url, headers=headers)
+        response = session_registry.get(video_api_url, headers=headers)
 
         if response.status_code == 200:
             response_json = response.json()
@@ -196,7 +191,7 @@ class VideoSource:
             console.print(f"[cyan]Available resolutions: [red]{[str(track['quality']) for track in video_tracks]}")
 
             # Request download link generation for each track
-            download_response = httpx.post(
+            download_response = session_registry.post(
                 url=f'https://{self.base_name}.{self.domain}/api/download/generate_link?scws_id={track["video_id"]}&rendition={track["quality"]}',
                 headers={
                     'referer': url_to_download,
@@ -246,7 +241,7 @@ class VideoSourceAnime(VideoSource):
         """
         try:
 
-            response = httpx.get(
+            response = session_registry.get(
                 url=f"https://www.{self.base_name}.{self.domain}/embed-url/{episode_id}", 
                 headers=self.headers, 
                 timeout=max_timeout
@@ -258,13 +253,13 @@ class VideoSourceAnime(VideoSource):
             self.iframe_src = embed_url
 
             # Fetch video content using embed URL
-            video_response = httpx.get(embed_url)
+            video_response = session_registry.get(embed_url)
             video_response.raise_for_status()
 
-            # Parse response with BeautifulSoup to get content of the scriot
-            soup = BeautifulSoup(video_response.text, "html.parser")
-            script = soup.find("body").find("script").text
-            self.src_mp4 = soup.find("body").find_all("script")[1].text.split(" = ")[1].replace("'", "")
+            # Get content of the scripts of the body
+            scripts = get_body_scripts(video_response.text)
+            script = scripts[0]
+            self.src_mp4 = scripts[1].split(" = ")[1].replace("'", "")
 
             return script
         
@@ -23,6 +23,14 @@ _engineDownload = "tor"
 from .costant import SITE_NAME
 
 
+def process_search_result(select_title):
+    """
+    Download the title selected in the search results, also the entry point of the global search.
+    """
+    # Download title
+    download_title(select_title)
+
+
 def search(string_to_search: str = None, get_onylDatabase: bool = False):
     """
     Main function of the application for film and series.
@@ -41,9 +49,7 @@ def search(string_to_search: str = None, get_onylDatabase: bool = False):
 
         # Select title from list
         select_title = run_get_select_title()
-
-        # Download title
-        download_title(select_title)
+        process_search_result(select_title)
 
     else:
         console.print(f"\n[red]Nothing matching was found for[white]: [purple]{string_to_search}")
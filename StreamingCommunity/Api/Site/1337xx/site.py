@@ -1,14 +1,11 @@
 # 02.07.24
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 from StreamingCommunity.Util.table import TVShowManager
 
 
@@ -47,7 +44,7 @@ def title_search(word_to_search: str) -> int:
 
     # Construct the full site URL and load the search page
     try:
-        response = httpx.get(
+        response = session_registry.get(
             url=f"https://{SITE_NAME}.{domain_to_use}/search/{word_to_search}/1/", 
             headers={'user-agent': get_headers()}, 
             follow_redirects=True,
@@ -59,7 +56,7 @@ def title_search(word_to_search: str) -> int:
         console.print(f"Site: {SITE_NAME}, request search error: {e}")
 
     # Create soup and find table
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = get_soup(response.text)
 
     for tr in soup.find_all('tr'):
         try:
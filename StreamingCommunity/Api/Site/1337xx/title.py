@@ -3,16 +3,13 @@
 import os
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util.os import os_manager
 from StreamingCommunity.Util.message import start_message
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 from StreamingCommunity.Lib.Downloader import TOR_downloader
 
 
@@ -44,7 +41,7 @@ def download_title(select_title: MediaItem):
 
     # Make request to page with magnet
     full_site_name = f"{SITE_NAME}.{DOMAIN_NOW}"
-    response = httpx.get(
+    response = session_registry.get(
         url="https://" + full_site_name + select_title.url, 
         headers={
             'user-agent': get_headers()
@@ -53,7 +50,7 @@ def download_title(select_title: MediaItem):
     )
 
     # Create soup and find table
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = get_soup(response.text)
     final_url = soup.find("a", class_="torrentdown1").get("href")
 
     # Tor manager
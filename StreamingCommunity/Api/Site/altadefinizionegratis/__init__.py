@@ -24,6 +24,14 @@ _engineDownload = "hls"
 from .costant import SITE_NAME, TELEGRAM_BOT
 
 
+def process_search_result(select_title):
+    """
+    Download the title selected in the search results, also the entry point of the global search.
+    """
+    # Download only film
+    download_film(select_title)
+
+
 def search(string_to_search: str = None, get_onylDatabase: bool = False):
     """
     Main function of the application for film and series.
@@ -61,9 +69,7 @@ def search(string_to_search: str = None, get_onylDatabase: bool = False):
 
         # Select title from list
         select_title = run_get_select_title()
-
-        # Download only film
-        download_film(select_title)
+        process_search_result(select_title)
 
     else:
         if TELEGRAM_BOT:
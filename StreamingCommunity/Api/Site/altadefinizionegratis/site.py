@@ -1,14 +1,11 @@
 # 26.05.24
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 from StreamingCommunity.Util.table import TVShowManager
 
 
@@ -54,10 +51,8 @@ def title_search(title_search: str) -> int:
         domain_to_use, base_url = search_domain(SITE_NAME, f"https://{SITE_NAME}.{DOMAIN_NOW}")
         
     # Send request to search for title
-    client = httpx.Client()
-
     try:
-        response = client.get(
+        response = session_registry.get(
             url=f"https://{SITE_NAME}.{domain_to_use}/?story={title_search.replace(' ', '+')}&do=search&subaction=search&titleonly=3", 
             headers={'User-Agent': get_headers()},
             timeout=max_timeout
@@ -69,7 +64,7 @@ def title_search(title_search: str) -> int:
         raise
 
     # Create soup and find table
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = get_soup(response.text)
 
     # Inizializza la lista delle scelte
     if TELEGRAM_BOT:
@@ -24,6 +24,17 @@ _engineDownload = "mp4"
 from .costant import SITE_NAME, TELEGRAM_BOT
 
 
+def process_search_result(select_title):
+    """
+    Download the title selected in the search results, also the entry point of the global search.
+    """
+    if select_title.type == 'Movie' or select_title.type == 'OVA':
+        download_film(select_title)
+
+    else:
+        download_series(select_title)
+
+
 def search(string_to_search: str = None, get_onylDatabase: bool = False):
 
     if TELEGRAM_BOT:
@@ -59,12 +70,7 @@ def search(string_to_search: str = None, get_onylDatabase: bool = False):
 
         # Select title from list (type: TV \ Movie \ OVA)
         select_title = run_get_select_title()
-
-        if select_title.type == 'Movie' or select_title.type == 'OVA':
-            download_film(select_title)
-
-        else:
-            download_series(select_title)
+        process_search_result(select_title)
             
     else:
         if TELEGRAM_BOT:
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import threading
 import logging
 
 
@@ -16,7 +17,7 @@ from StreamingCommunity.TelegramHelp.session import get_session, updateScriptId,
 
 # Logic class
 from .util.ScrapeSerie import ScrapeSerieAnime
-from StreamingCommunity.Api.Template.Util import manage_selection
+from StreamingCommunity.Api.Template.Util import manage_selection, EpisodeScheduler, EpisodeSlot
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -30,12 +31,13 @@ KILL_HANDLER = bool(False)
 
 
 
-def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_source: VideoSourceAnime) -> tuple[str,bool]:
+def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_source: VideoSourceAnime, episode_slot: EpisodeSlot = None) -> tuple[str,bool]:
     """
     Downloads the selected episode.
 
     Parameters:
         - index_select (int): Index of the episode to download.
+        - episode_slot (EpisodeSlot): Set when the episode downloads next to others, see EpisodeScheduler.
 
     Return:
         - str: output path
@@ -49,9 +51,10 @@ def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_so
 
     if obj_episode is not None:
 
-        start_message()
-        console.print(f"[yellow]Download:  [red]EP_{obj_episode.number} \n")
-        console.print("[cyan]You can safely stop the download with [bold]Ctrl+c[bold] [cyan] \n")
+        if episode_slot is None:
+            start_message()
+            console.print(f"[yellow]Download:  [red]EP_{obj_episode.number} \n")
+            console.print("[cyan]You can safely stop the download with [bold]Ctrl+c[bold] [cyan] \n")
         
         if TELEGRAM_BOT:
             bot.send_message(f"Download in corso:\nTitolo:{scrape_serie.series_name}\nEpisodio: {obj_episode.number}", None)
@@ -77,20 +80,28 @@ def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_so
         # Create output folder
         os_manager.create_path(mp4_path)                                                            
 
+        # Set by MP4_downloader on Ctrl+C, shared with the other episodes when they download in parallel
+        stop_event = episode_slot.stop_event if episode_slot is not None else threading.Event()
+
         # Start downloading
         r_proc = MP4_downloader(
             url=str(video_source.src_mp4).strip(),
-            path=os.path.join(mp4_path, title_name)
+            path=os.path.join(mp4_path, title_name),
+            bar_position=episode_slot.bar_position if episode_slot is not None else None,
+            stop_event=stop_event,
+            label=episode_slot.label if episode_slot is not None else None
         )
         
         if r_proc != None:
             console.print("[green]Result: ")
             console.print(r_proc)
 
-        return os.path.join(mp4_path, title_name)
+        stopped = stop_event.is_set()
+        return os.path.join(mp4_path, title_name), stopped
 
     else:
         logging.error(f"Skip index: {index_select} cant find info with api.")
+        return None, False
 
 
 def download_series(select_title: MediaItem):
@@ -132,17 +143,24 @@ def download_series(select_title: MediaItem):
     # Manage user selection
     list_episode_select = manage_selection(last_command, episoded_count)
 
+    # Information of every selected episode, a request for each window instead of each episode
+    scrape_serie.load_episodes([i_episode - 1 for i_episode in list_episode_select])
+
     # Download selected episodes
     if len(list_episode_select) == 1 and last_command != "*":
         download_episode(list_episode_select[0]-1, scrape_serie, video_source)[0]
 
-    # Download all other episodes selecter
+    # Download all other episodes selecter, PARALLEL_EPISODES at a time
     else:
-        kill_handler=bool(False)
-        for i_episode in list_episode_select:
-            if kill_handler:
-                break
-            kill_handler= download_episode(i_episode-1, scrape_serie, video_source)[1]
+        scheduler = EpisodeScheduler()
+
+        def download(i_episode: int, episode_slot: EpisodeSlot) -> tuple[str,bool]:
+
+            # Each episode running in parallel needs its own source
+            episode_source = VideoSourceAnime(SITE_NAME) if episode_slot is not None else video_source
+            return download_episode(i_episode-1, scrape_serie, episode_source, episode_slot)
+
+        scheduler.run(list_episode_select, download, lambda i_episode: f"EP_{i_episode}")
 	
     if TELEGRAM_BOT:
         bot.send_message(f"Finito di scaricare tutte le serie e episodi", None)
@@ -3,16 +3,13 @@
 import logging
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.table import TVShowManager
 from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_meta_content
 
 
 # Logic class
@@ -42,26 +39,14 @@ def get_token(site_name: str, domain: str) -> dict:
     """
 
     # Send a GET request to the specified URL composed of the site name and domain
-    response = httpx.get(
+    response = session_registry.get(
         url=f"https://www.{site_name}.{domain}", 
         timeout=max_timeout
     )
     response.raise_for_status()
 
-    # Initialize variables to store CSRF token
-    find_csrf_token = None
-    
-    # Parse the HTML response using BeautifulSoup
-    soup = BeautifulSoup(response.text, "html.parser")
-    
-    # Loop through all meta tags in the HTML response
-    for html_meta in soup.find_all("meta"):
-
-        # Check if the meta tag has a 'name' attribute equal to "csrf-token"
-        if html_meta.get('name') == "csrf-token":
-
-            # If found, retrieve the content of the meta tag, which is the CSRF token
-            find_csrf_token = html_meta.get('content')
+    # Retrieve the content of the meta tag named "csrf-token"
+    find_csrf_token = get_meta_content(response.text, "csrf-token")
 
     logging.info(f"Extract: ('animeunity_session': {response.cookies['animeunity_session']}, 'csrf_token': {find_csrf_token})")
     return {
@@ -138,7 +123,7 @@ def title_search(title: str) -> int:
 
     # Send a POST request to the API endpoint for live search
     try:
-        response = httpx.post(
+        response = session_registry.post(
             url=f'https://www.{SITE_NAME}.{domain_to_use}/livesearch', 
             cookies=cookies, 
             headers=headers, 
@@ -1,20 +1,21 @@
 # 01.03.24
 
 import logging
-
-
-# External libraries
-import httpx
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
 
 
 # Internal utilities
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Api.Player.Helper.Vixcloud.util import EpisodeManager, Episode
 
 
 # Variable
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
+EPISODE_INFO_WINDOW = 120
+EPISODE_INFO_WORKERS = 4
 
 
 
@@ -34,6 +35,8 @@ class ScrapeSerieAnime():
     def setup(self, version: str = None, media_id: int = None, series_name: str = None):
         self.version = version
         self.media_id = media_id
+        self.episodes_count = None
+        self.episodes: Dict[int, Episode] = {}
 
         if series_name is not None:
             self.is_series = True
@@ -49,7 +52,7 @@ class ScrapeSerieAnime():
         """
         try:
 
-            response = httpx.get(
+            response = session_registry.get(
                 url=f"https://www.{self.base_name}.{self.domain}/info_api/{self.media_id}/", 
                 headers=self.headers, 
                 timeout=max_timeout
@@ -57,15 +60,74 @@ class ScrapeSerieAnime():
             response.raise_for_status()
 
             # Parse JSON response and return episode count
-            return response.json()["episodes_count"]
+            self.episodes_count = response.json()["episodes_count"]
+            return self.episodes_count
         
         except Exception as e:
             logging.error(f"Error fetching episode count: {e}")
             return None
     
+    def get_info_episodes(self, start: int, end: int) -> List[Episode]:
+        """
+        Fetch information for a range of episodes with a single request.
+
+        Args:
+            start (int): Zero-based index of the first episode
+            end (int): Zero-based index after the last episode
+
+        Returns:
+            List[Episode]: Episodes from start to end - 1
+
+        Raises:
+            ValueError: If the API does not return exactly the requested episodes, they could not be matched to their index
+        """
+        response = session_registry.get(
+            url=f"https://www.{self.base_name}.{self.domain}/info_api/{self.media_id}/{start}", 
+            headers=self.headers, 
+            params={"start_range": start, "end_range": end}, 
+            timeout=max_timeout
+        )
+        response.raise_for_status()
+
+        json_episodes = response.json()["episodes"]
+        if len(json_episodes) != end - start:
+            raise ValueError(f"got {len(json_episodes)} episodes instead of {end - start}")
+
+        return [Episode(json_data) for json_data in json_episodes]
+
+    def load_episodes(self, indexes: Iterable[int]) -> None:
+        """
+        Fetch in windows of EPISODE_INFO_WINDOW, concurrently, the information of the episodes not loaded yet.
+
+        Args:
+            indexes (Iterable[int]): Zero-based indexes of the episodes that will be downloaded
+        """
+        windows = sorted({index // EPISODE_INFO_WINDOW for index in indexes if index not in self.episodes})
+        if not windows:
+            return
+
+        def load_window(window: int) -> None:
+            start = window * EPISODE_INFO_WINDOW
+            end = start + EPISODE_INFO_WINDOW
+            if self.episodes_count is not None:
+                end = min(end, self.episodes_count)
+
+            try:
+                for offset, episode in enumerate(self.get_info_episodes(start, end)):
+                    self.episodes[start + offset] = episode
+
+            # Left unfilled, get_info_episode falls back to one request per episode
+            except Exception as e:
+                logging.error(f"Error fetching episodes {start}-{end}: {e}")
+
+        with ThreadPoolExecutor(max_workers=min(EPISODE_INFO_WORKERS, len(windows))) as executor:
+            list(executor.map(load_window, windows))
+
+        logging.info(f"Loaded information of {len(self.episodes)} episodes with {len(windows)} requests")
+
     def get_info_episode(self, index_ep: int) -> Episode:
         """
-        Fetch detailed information for a specific episode.
+        Fetch detailed information for a specific episode, from the episodes already loaded when possible.
         
         Args:
             index_ep (int): Zero-based index of the target episode
@@ -73,6 +135,9 @@ class ScrapeSerieAnime():
         Returns:
             Episode: Detailed episode information
         """
+        if index_ep in self.episodes:
+            return self.episodes[index_ep]
+
         try:
 
             params = {
@@ -80,7 +145,7 @@ class ScrapeSerieAnime():
                 "end_range": index_ep + 1
             }
 
-            response = httpx.get(
+            response = session_registry.get(
                 url=f"https://www.{self.base_name}.{self.domain}/info_api/{self.media_id}/{index_ep}", 
                 headers=self.headers, 
                 params=params, 
@@ -1,13 +1,10 @@
 # 03.07.24
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 from StreamingCommunity.Util.table import TVShowManager
 
 
@@ -44,7 +41,7 @@ def title_search(word_to_search: str) -> int:
     if not disable_searchDomain:
         domain_to_use, base_url = search_domain(SITE_NAME, f"https://{SITE_NAME}.{DOMAIN_NOW}")
 
-    response = httpx.get(
+    response = session_registry.get(
         url=f"https://{SITE_NAME}.{domain_to_use}/?s={word_to_search}",
         headers={'user-agent': get_headers()},
         timeout=max_timeout
@@ -52,7 +49,7 @@ def title_search(word_to_search: str) -> int:
     response.raise_for_status()
 
     # Create soup and find table
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = get_soup(response.text)
 
     for div in soup.find_all("div", class_ = "card-content"):
         try:
@@ -22,6 +22,18 @@ _engineDownload = "mp4"
 from .costant import SITE_NAME
 
 
+def process_search_result(select_title):
+    """
+    Download the title selected in the search results, also the entry point of the global search.
+    """
+    # Download only film
+    if "Serie TV" in str(select_title.type):
+        download_thread(select_title)
+
+    else:
+        logging.error(f"Not supported: {select_title.type}")
+
+
 def search(string_to_search: str = None, get_onylDatabase: bool = False):
     """
     Main function of the application for film and series.
@@ -41,13 +53,7 @@ def search(string_to_search: str = None, get_onylDatabase: bool = False):
 
         # Select title from list
         select_title = run_get_select_title()
-
-        # Download only film
-        if "Serie TV" in str(select_title.type):
-            download_thread(select_title)
-
-        else:
-            logging.error(f"Not supported: {select_title.type}")
+        process_search_result(select_title)
 
     else:
         console.print(f"\n[red]Nothing matching was found for[white]: [purple]{string_to_search}")
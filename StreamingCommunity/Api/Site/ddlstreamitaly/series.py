@@ -2,6 +2,7 @@
 
 import os
 import sys
+import threading
 from urllib.parse import urlparse
 
 
@@ -15,7 +16,7 @@ from StreamingCommunity.Lib.Downloader import MP4_downloader
 
 # Logic class
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
-from StreamingCommunity.Api.Template.Util import manage_selection, map_episode_title, validate_episode_selection
+from StreamingCommunity.Api.Template.Util import manage_selection, map_episode_title, validate_episode_selection, EpisodeScheduler, EpisodeSlot
 
 
 # Player
@@ -28,24 +29,26 @@ from .costant import SERIES_FOLDER
 
 
 
-def download_video(index_episode_selected: int, scape_info_serie: GetSerieInfo, video_source: VideoSource) -> tuple[str,bool]:
+def download_video(index_episode_selected: int, scape_info_serie: GetSerieInfo, video_source: VideoSource, episode_slot: EpisodeSlot = None) -> tuple[str,bool]:
     """
     Download a single episode video.
 
     Parameters:
         - tv_name (str): Name of the TV series.
         - index_episode_selected (int): Index of the selected episode.
+        - episode_slot (EpisodeSlot): Set when the episode downloads next to others, see EpisodeScheduler.
 
     Return:
         - str: output path
         - bool: kill handler status
     """
-    start_message()
-
     # Get info about episode
     obj_episode = scape_info_serie.list_episodes[index_episode_selected - 1]
-    console.print(f"[yellow]Download: [red]{obj_episode.get('name')}\n")
-    console.print(f"[cyan]You can safely stop the download with [bold]Ctrl+c[bold] [cyan] \n")
+
+    if episode_slot is None:
+        start_message()
+        console.print(f"[yellow]Download: [red]{obj_episode.get('name')}\n")
+        console.print(f"[cyan]You can safely stop the download with [bold]Ctrl+c[bold] [cyan] \n")
 
     # Define filename and path for the downloaded video
     title_name = os_manager.get_sanitize_file(
@@ -65,18 +68,25 @@ def download_video(index_episode_selected: int, scape_info_serie: GetSerieInfo,
     # Parse start page url
     parsed_url = urlparse(obj_episode.get('url'))
 
+    # Set by MP4_downloader on Ctrl+C, shared with the other episodes when they download in parallel
+    stop_event = episode_slot.stop_event if episode_slot is not None else threading.Event()
+
     # Start download
     r_proc = MP4_downloader(
         url=master_playlist, 
         path=os.path.join(mp4_path, title_name),
         referer=f"{parsed_url.scheme}://{parsed_url.netloc}/",
+        bar_position=episode_slot.bar_position if episode_slot is not None else None,
+        stop_event=stop_event,
+        label=episode_slot.label if episode_slot is not None else None
     )
     
     if r_proc != None:
         console.print("[green]Result: ")
         console.print(r_proc)
 
-    return os.path.join(mp4_path, title_name)
+    stopped = stop_event.is_set()
+    return os.path.join(mp4_path, title_name), stopped
 
 
 def download_thread(dict_serie: MediaItem):
@@ -105,12 +115,16 @@ def download_thread(dict_serie: MediaItem):
         console.print(f"[red]{str(e)}")
         return
 
-    # Download selected episodes
-    kill_handler = bool(False)
-    for i_episode in list_episode_select:
-        if kill_handler:
-            break
-        kill_handler = download_video(i_episode, scape_info_serie, video_source)[1]
+    # Download selected episodes, PARALLEL_EPISODES at a time
+    scheduler = EpisodeScheduler()
+
+    def download(i_episode: int, episode_slot: EpisodeSlot) -> tuple[str,bool]:
+
+        # Each episode running in parallel needs its own source
+        episode_source = VideoSource() if episode_slot is not None else video_source
+        return download_video(i_episode, scape_info_serie, episode_source, episode_slot)
+
+    scheduler.run(list_episode_select, download, lambda i_episode: f"EP_{i_episode}")
 
 
 def display_episodes_list(obj_episode_manager) -> str:
@@ -3,15 +3,12 @@
 import logging
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 from StreamingCommunity.Util.table import TVShowManager
 
 
@@ -50,7 +47,7 @@ def title_search(word_to_search: str) -> int:
 
     # Send request to search for titles
     try:
-        response = httpx.get(
+        response = session_registry.get(
             url=f"https://{SITE_NAME}.{domain_to_use}/search/?&q={word_to_search}&quick=1&type=videobox_video&nodes=11", 
             headers={'user-agent': get_headers()},
             timeout=max_timeout
@@ -61,7 +58,7 @@ def title_search(word_to_search: str) -> int:
         console.print(f"Site: {SITE_NAME}, request search error: {e}")
 
     # Create soup and find table
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = get_soup(response.text)
     table_content = soup.find('ol', class_="ipsStream")
 
     if table_content:
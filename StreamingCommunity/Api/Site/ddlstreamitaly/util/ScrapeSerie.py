@@ -5,14 +5,11 @@ import logging
 from typing import List, Dict
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 
 
 # Logic class
@@ -50,7 +47,7 @@ class GetSerieInfo:
         """
 
         try:
-            response = httpx.get(f"{self.url}?area=online", cookies=self.cookies, headers=self.headers, timeout=max_timeout)
+            response = session_registry.get(f"{self.url}?area=online", cookies=self.cookies, headers=self.headers, timeout=max_timeout)
             response.raise_for_status()
 
         except Exception as e:
@@ -58,7 +55,7 @@ class GetSerieInfo:
             sys.exit(0)
 
         # Parse HTML content of the page
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = get_soup(response.text)
 
         # Get tv name 
         self.tv_name = soup.find("span", class_= "ipsType_break").get_text(strip=True)
@@ -21,6 +21,14 @@ _engineDownload = "hls"
 from .costant import SITE_NAME
 
 
+def process_search_result(select_title):
+    """
+    Download the title selected in the search results, also the entry point of the global search.
+    """
+    # Download only film
+    download_series(select_title)
+
+
 def search(string_to_search: str = None, get_onylDatabase: bool = False):
     """
     Main function of the application for film and series.
@@ -40,9 +48,7 @@ def search(string_to_search: str = None, get_onylDatabase: bool = False):
 
         # Select title from list
         select_title = run_get_select_title()
-
-        # Download only film
-        download_series(select_title)
+        process_search_result(select_title)
 
     else:
         console.print(f"\n[red]Nothing matching was found for[white]: [purple]{string_to_search}")
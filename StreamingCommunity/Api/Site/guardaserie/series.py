@@ -12,7 +12,7 @@ from StreamingCommunity.Lib.Downloader import HLS_Downloader
 
 
 # Logic class
-from StreamingCommunity.Api.Template.Util import manage_selection, map_episode_title, dynamic_format_number, validate_selection, validate_episode_selection
+from StreamingCommunity.Api.Template.Util import manage_selection, map_episode_title, dynamic_format_number, validate_selection, validate_episode_selection, EpisodeScheduler, EpisodeSlot
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -26,7 +26,7 @@ from .costant import SERIES_FOLDER
 
 
 
-def download_video(index_season_selected: int, index_episode_selected: int, scape_info_serie: GetSerieInfo) -> str:
+def download_video(index_season_selected: int, index_episode_selected: int, scape_info_serie: GetSerieInfo, episode_slot: EpisodeSlot = None) -> tuple[str,bool]:
     """
     Download a single episode video.
 
@@ -34,17 +34,21 @@ def download_video(index_season_selected: int, index_episode_selected: int, scap
         - tv_name (str): Name of the TV series.
         - index_season_selected (int): Index of the selected season.
         - index_episode_selected (int): Index of the selected episode.
+        - episode_slot (EpisodeSlot): Set when the episode downloads next to others, see EpisodeScheduler.
 
     Return:
         - str: output path
+        - bool: kill handler status
     """
-    start_message()
     index_season_selected = dynamic_format_number(index_season_selected)
 
     # Get info about episode
     obj_episode = scape_info_serie.list_episodes[index_episode_selected - 1]
-    console.print(f"[yellow]Download: [red]{index_season_selected}:{index_episode_selected} {obj_episode.get('name')}\n")
-    console.print(f"[cyan]You can safely stop the download with [bold]Ctrl+c[bold] [cyan] \n")
+
+    if episode_slot is None:
+        start_message()
+        console.print(f"[yellow]Download: [red]{index_season_selected}:{index_episode_selected} {obj_episode.get('name')}\n")
+        console.print(f"[cyan]You can safely stop the download with [bold]Ctrl+c[bold] [cyan] \n")
 
     # Define filename and path for the downloaded video
     mp4_name = f"{map_episode_title(scape_info_serie.tv_name, index_season_selected, index_episode_selected, obj_episode.get('name'))}.mp4"
@@ -57,10 +61,17 @@ def download_video(index_season_selected: int, index_episode_selected: int, scap
     master_playlist = video_source.get_playlist()
     
     # Download the film using the m3u8 playlist, and output filename
-    r_proc = HLS_Downloader(
+    downloader = HLS_Downloader(
         m3u8_url=master_playlist, 
-        output_path=os.path.join(mp4_path, mp4_name)
-    ).start()
+        output_path=os.path.join(mp4_path, mp4_name),
+        worker_budget=episode_slot.worker_budget if episode_slot is not None else None,
+        bar_position=episode_slot.bar_position if episode_slot is not None else None,
+        label=episode_slot.label if episode_slot is not None else None
+    )
+    if episode_slot is not None:
+        episode_slot.register(downloader)
+
+    r_proc = downloader.start()
 
             
     if "error" in r_proc.keys():
@@ -87,14 +98,20 @@ def download_episode(scape_info_serie: GetSerieInfo, index_season_selected: int,
     list_dict_episode = scape_info_serie.get_episode_number(index_season_selected)
     episodes_count = len(list_dict_episode)
 
+    # Episodes run PARALLEL_EPISODES at a time, one after another by default
+    scheduler = EpisodeScheduler(rows_per_episode=HLS_Downloader.get_bar_rows())
+    season_label = f"S{dynamic_format_number(index_season_selected)}"
+
+    def download(i_episode: int, episode_slot: EpisodeSlot) -> tuple[str,bool]:
+        return download_video(index_season_selected, i_episode, scape_info_serie, episode_slot)
+
+    def get_label(i_episode: int) -> str:
+        return f"{season_label}E{dynamic_format_number(i_episode)}"
+
     if download_all:
 
         # Download all episodes without asking
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scape_info_serie)
-
-            if stopped:
-                break
+        scheduler.run(list(range(1, episodes_count + 1)), download, get_label)
 
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
@@ -111,11 +128,7 @@ def download_episode(scape_info_serie: GetSerieInfo, index_season_selected: int,
             return
 
         # Download selected episodes
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scape_info_serie)
-
-            if stopped:
-                break
+        scheduler.run(list_episode_select, download, get_label)
 
 
 def download_series(dict_serie: MediaItem) -> None:
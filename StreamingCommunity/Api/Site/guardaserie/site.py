@@ -1,14 +1,11 @@
 # 09.06.24
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 from StreamingCommunity.Util.table import TVShowManager
 
 
@@ -47,7 +44,7 @@ def title_search(word_to_search: str) -> int:
 
     # Send request to search for titles
     try:
-        response = httpx.get(
+        response = session_registry.get(
             url=f"https://guardaserie.{domain_to_use}/?story={word_to_search}&do=search&subaction=search", 
             headers={'user-agent': get_headers()}, 
             timeout=max_timeout
@@ -58,7 +55,7 @@ def title_search(word_to_search: str) -> int:
         console.print(f"Site: {SITE_NAME}, request search error: {e}")
 
     # Create soup and find table
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = get_soup(response.text)
     table_content = soup.find('div', class_="mlnew-list")
 
     for serie_div in table_content.find_all('div', class_='mlnew'):
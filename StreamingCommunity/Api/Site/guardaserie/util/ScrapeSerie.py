@@ -4,13 +4,10 @@ import logging
 from typing import List, Dict
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 
 
 # Logic class
@@ -40,11 +37,11 @@ class GetSerieInfo:
         try:
 
             # Make an HTTP request to the series URL
-            response = httpx.get(self.url, headers=self.headers, timeout=15)
+            response = session_registry.get(self.url, headers=self.headers, timeout=15)
             response.raise_for_status()
 
             # Parse HTML content of the page
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = get_soup(response.text)
 
             # Find the container of seasons
             table_content = soup.find('div', class_="tt_season")
@@ -75,11 +72,11 @@ class GetSerieInfo:
         try:
 
             # Make an HTTP request to the series URL
-            response = httpx.get(self.url, headers=self.headers, timeout=15)
+            response = session_registry.get(self.url, headers=self.headers, timeout=15)
             response.raise_for_status()
 
             # Parse HTML content of the page
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = get_soup(response.text)
 
             # Find the container of episodes for the specified season
             table_content = soup.find('div', class_="tab-pane", id=f"season-{n_season}")
@@ -5,14 +5,11 @@ import asyncio
 from typing import List, Dict, Optional
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 from StreamingCommunity.Util.console import console
 
 
@@ -46,12 +43,12 @@ class IlCorsaroNeroScraper:
         """
         try:
             console.print(f"[cyan]Fetching url[white]: [red]{url}")
-            async with httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=max_timeout) as client:
-                response = await client.get(url)
-                
-                # If the request was successful, return the HTML content
-                response.raise_for_status()
-                return response.text
+            client = session_registry.get_async_client(url)
+            response = await client.get(url, headers=self.headers, follow_redirects=True, timeout=max_timeout)
+            
+            # If the request was successful, return the HTML content
+            response.raise_for_status()
+            return response.text
             
         except Exception as e:
             logging.error(f"Error fetching from {url}: {e}")
@@ -62,7 +59,7 @@ class IlCorsaroNeroScraper:
         Parse the HTML content and extract torrent details.
         """
         torrents = []
-        soup = BeautifulSoup(html, "html.parser")
+        soup = get_soup(html)
         table = soup.find("tbody")
         
         for row in table.find_all("tr"):
@@ -93,7 +90,7 @@ class IlCorsaroNeroScraper:
         if not response_html:
             return None
         
-        soup = BeautifulSoup(response_html, "html.parser")
+        soup = get_soup(response_html)
         links = soup.find_all("a")
 
         # Find and return the magnet link
@@ -108,30 +105,37 @@ class IlCorsaroNeroScraper:
         Search for torrents based on the query string.
         """
         all_torrents = []
-        
-        # Loop through each page
-        for page in range(self.max_page):
-            url = f'{self.base_url}search?q={query}&page={page}'
 
-            html = await self.fetch_url(url)
-            if not html:
-                console.print(f"[bold red]No HTML content for page {page}[/bold red]")
-                break
+        try:
+            
+            # Loop through each page
+            for page in range(self.max_page):
+                url = f'{self.base_url}search?q={query}&page={page}'
+
+                html = await self.fetch_url(url)
+                if not html:
+                    console.print(f"[bold red]No HTML content for page {page}[/bold red]")
+                    break
+
+                torrents = self.parse_torrents(html)
+                if not torrents:
+                    console.print(f"[bold red]No torrents found on page {page}[/bold red]")
+                    break
+
+                # Use asyncio.gather to fetch all real URLs concurrently
+                tasks = [self.fetch_real_url(result['url']) for result in torrents]
+                real_urls = await asyncio.gather(*tasks)
 
-            torrents = self.parse_torrents(html)
-            if not torrents:
-                console.print(f"[bold red]No torrents found on page {page}[/bold red]")
-                break
+                # Attach real URLs to the torrent data
+                for i, result in enumerate(torrents):
+                    result['url'] = real_urls[i]
 
-            # Use asyncio.gather to fetch all real URLs concurrently
-            tasks = [self.fetch_real_url(result['url']) for result in torrents]
-            real_urls = await asyncio.gather(*tasks)
+                all_torrents.extend(torrents)
 
-            # Attach real URLs to the torrent data
-            for i, result in enumerate(torrents):
-                result['url'] = real_urls[i]
+        finally:
 
-            all_torrents.extend(torrents)
+            # Every search runs in its own asyncio.run, the clients must not outlive it
+            await session_registry.aclose_async_clients()
 
         return all_torrents
 
@@ -5,16 +5,13 @@ import sys
 import logging
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util.os import os_manager
 from StreamingCommunity.Util.message import start_message
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_soup
 from StreamingCommunity.Lib.Downloader import HLS_Downloader
 
 
@@ -49,7 +46,7 @@ def download_film(movie_details: Json_film) -> str:
     # Make request to main site
     try:
         url = f"https://{SITE_NAME}.{DOMAIN_NOW}/set-movie-a/{movie_details.imdb_id}"
-        response = httpx.get(url, headers={'User-Agent': get_headers()})
+        response = session_registry.get(url, headers={'User-Agent': get_headers()})
         response.raise_for_status()
 
     except:
@@ -61,7 +58,7 @@ def download_film(movie_details: Json_film) -> str:
         raise
 
     # Extract supervideo url
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = get_soup(response.text)
     player_links = soup.find("ul", class_ = "_player-mirrors").find_all("li")
     supervideo_url = "https:" + player_links[0].get("data-link")
 
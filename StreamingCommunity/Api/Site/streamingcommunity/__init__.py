@@ -25,6 +25,21 @@ _engineDownload = "hls"
 from .costant import SITE_NAME, TELEGRAM_BOT
 
 
+def process_search_result(select_title, site_version: str = None):
+    """
+    Download the title selected in the search results, also the entry point of the global search.
+
+    Parameters:
+        - select_title (MediaItem): The selected title.
+        - site_version (str): Version of the site, else the one stored in the title by the search.
+    """
+    if select_title.type == 'tv':
+        download_series(select_title, site_version or select_title.version)
+    
+    else:
+        download_film(select_title)
+
+
 def search(string_to_search: str = None, get_onylDatabase: bool = False):
     """
     Main function of the application for film and series.
@@ -55,20 +70,17 @@ def search(string_to_search: str = None, get_onylDatabase: bool = False):
     site_version, domain = get_version_and_domain()
     len_database = title_search(quote_plus(string_to_search), domain)
 
-    # Return list of elements
+    # Return list of elements, each one keeps the version its series download needs
     if get_onylDatabase:
+        for media in media_search_manager.media_list:
+            media.version = site_version
         return media_search_manager
     
     if len_database > 0:
 
         # Select title from list
         select_title = run_get_select_title()
-        
-        if select_title.type == 'tv':
-            download_series(select_title, site_version)
-        
-        else:
-            download_film(select_title)
+        process_search_result(select_title, site_version)
     
     else:
         console.print(f"\n[red]Nothing matching was found for[white]: [purple]{string_to_search}")
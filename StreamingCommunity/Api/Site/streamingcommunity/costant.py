@@ -18,4 +18,5 @@ if config_manager.get_bool("DEFAULT", "add_siteName"):
     SERIES_FOLDER = os.path.join(ROOT_PATH, SITE_NAME, config_manager.get('DEFAULT', 'serie_folder_name'))
     MOVIE_FOLDER = os.path.join(ROOT_PATH, SITE_NAME, config_manager.get('DEFAULT', 'movie_folder_name'))
 
-TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
\ No newline at end of file
+TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
+EPISODE_LOOKAHEAD = config_manager.get_int('M3U8_DOWNLOAD', 'episode_lookahead')
\ No newline at end of file
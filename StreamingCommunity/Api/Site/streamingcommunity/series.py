@@ -2,6 +2,9 @@
 
 import os
 import sys
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 
 # Internal utilities
@@ -15,7 +18,7 @@ from StreamingCommunity.TelegramHelp.session import get_session, updateScriptId,
 
 # Logic class
 from .util.ScrapeSerie import ScrapeSerie
-from StreamingCommunity.Api.Template.Util import manage_selection, map_episode_title, dynamic_format_number, validate_selection, validate_episode_selection
+from StreamingCommunity.Api.Template.Util import manage_selection, map_episode_title, dynamic_format_number, validate_selection, validate_episode_selection, EpisodeScheduler, EpisodeSlot
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -24,28 +27,74 @@ from StreamingCommunity.Api.Player.vixcloud import VideoSource
 
 
 # Variable
-from .costant import SITE_NAME, SERIES_FOLDER, TELEGRAM_BOT
+from .costant import SITE_NAME, SERIES_FOLDER, TELEGRAM_BOT, EPISODE_LOOKAHEAD
 
 
-def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: ScrapeSerie, video_source: VideoSource) -> tuple[str,bool]:
+def resolve_episode(index_episode_selected: int, scrape_serie: ScrapeSerie, media_id: int) -> str:
+    """
+    Resolve the master playlist of an episode with its own VideoSource, so it can run in background.
+
+    Parameters:
+        - index_episode_selected (int): Index of the episode.
+        - media_id (int): Id of the title.
+
+    Return:
+        - str: master playlist url
+    """
+    obj_episode = scrape_serie.episode_manager.get(index_episode_selected - 1)
+
+    video_source = VideoSource(SITE_NAME, True)
+    video_source.setup(media_id)
+    video_source.get_iframe(obj_episode.id)
+    video_source.get_content()
+    master_playlist = video_source.get_playlist()
+
+    # Fetched and parsed now, the download starts from the playlist cache
+    HLS_Downloader.prefetch(master_playlist)
+    return master_playlist
+
+def finalize_video(downloader: HLS_Downloader) -> Dict:
+    """
+    Merge a downloaded episode, removing the output on error.
+    """
+    r_proc = downloader.finalize()
+
+    if "error" in r_proc.keys():
+        try:
+            os.remove(r_proc['path'])
+        except:
+            pass
+
+    return r_proc
+
+def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: ScrapeSerie, video_source: VideoSource, master_playlist: str = None, merge_executor: ThreadPoolExecutor = None, merges: List[Tuple[int, Future]] = None, episode_slot: EpisodeSlot = None, clear_screen: bool = True) -> tuple[str,bool]:
     """
     Download a single episode video.
 
     Parameters:
         - index_season_selected (int): Index of the selected season.
         - index_episode_selected (int): Index of the selected episode.
+        - master_playlist (str): Playlist already resolved in background, resolved here if None.
+        - merge_executor (ThreadPoolExecutor): When set, the merge runs there while the caller moves to the next episode.
+        - merges (list): Receives the (episode, future) of the merge submitted to merge_executor, the caller reports its result.
+        - episode_slot (EpisodeSlot): Set when the episode downloads next to others, see EpisodeScheduler.
+        - clear_screen (bool): Print the start message, False while the merge of the previous episode is still printing.
 
     Return:
         - str: output path
         - bool: kill handler status
     """
-    start_message()
     index_season_selected = dynamic_format_number(index_season_selected)
 
     # Get info about episode
     obj_episode = scrape_serie.episode_manager.get(index_episode_selected - 1)
-    console.print(f"[yellow]Download: [red]{index_season_selected}:{index_episode_selected} {obj_episode.name}")
-    print()
+
+    # The screen belongs to the progress bars of every episode
+    if episode_slot is None:
+        if clear_screen:
+            start_message()
+        console.print(f"[yellow]Download: [red]{index_season_selected}:{index_episode_selected} {obj_episode.name}")
+        print()
 
     if TELEGRAM_BOT:
         bot = get_bot_instance()
@@ -66,15 +115,30 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
     mp4_path = os.path.join(SERIES_FOLDER, scrape_serie.series_name, f"S{index_season_selected}")
 
     # Retrieve scws and if available master playlist
-    video_source.get_iframe(obj_episode.id)
-    video_source.get_content()
-    master_playlist = video_source.get_playlist()
+    if master_playlist is None:
+        video_source.get_iframe(obj_episode.id)
+        video_source.get_content()
+        master_playlist = video_source.get_playlist()
     
     # Download the episode
-    r_proc = HLS_Downloader(
+    downloader = HLS_Downloader(
         m3u8_url=master_playlist,
-        output_path=os.path.join(mp4_path, mp4_name)
-    ).start()
+        output_path=os.path.join(mp4_path, mp4_name),
+        worker_budget=episode_slot.worker_budget if episode_slot is not None else None,
+        bar_position=episode_slot.bar_position if episode_slot is not None else None,
+        label=episode_slot.label if episode_slot is not None else None
+    )
+    if episode_slot is not None:
+        episode_slot.register(downloader)
+
+    if merge_executor is not None:
+        r_proc = downloader.download()
+        if r_proc is None:
+            merges.append((index_episode_selected, merge_executor.submit(finalize_video, downloader)))
+            return downloader.path_manager.output_path, False
+
+    else:
+        r_proc = downloader.start()
 	
     if "error" in r_proc.keys():
         try:
@@ -84,6 +148,91 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
 
     return r_proc['path'], r_proc['stopped']
 
+def download_episodes_pipelined(index_season_selected: int, list_episode_select: list, scrape_serie: ScrapeSerie, video_source: VideoSource) -> None:
+    """
+    Download episodes one after another, resolving the next EPISODE_LOOKAHEAD playlists in background
+    and merging each episode while the next one downloads.
+
+    Parameters:
+        - index_season_selected (int): Index of the selected season.
+        - list_episode_select (list): Indexes of the episodes to download.
+    """
+    if EPISODE_LOOKAHEAD <= 0:
+        for i_episode in list_episode_select:
+            path, stopped = download_video(index_season_selected, i_episode, scrape_serie, video_source)
+
+            if stopped:
+                break
+        return
+
+    resolved: Dict[int, Future] = {}
+    merges: List[Tuple[int, Future]] = []
+
+    # A single merge worker: FFmpeg runs at most once next to the download
+    with ThreadPoolExecutor(max_workers=EPISODE_LOOKAHEAD, thread_name_prefix="resolve") as resolver, \
+         ThreadPoolExecutor(max_workers=1, thread_name_prefix="merge") as merger:
+
+        for position, i_episode in enumerate(list_episode_select):
+
+            # Keep the next episodes resolving, bounded so their tokens do not expire before use
+            for next_episode in list_episode_select[position:position + 1 + EPISODE_LOOKAHEAD]:
+                if next_episode not in resolved:
+                    resolved[next_episode] = resolver.submit(resolve_episode, next_episode, scrape_serie, video_source.media_id)
+
+            try:
+                master_playlist = resolved.pop(i_episode).result()
+            except Exception as e:
+                console.print(f"[red]Cant resolve episode {i_episode}: {e}")
+                continue
+
+            merge_pending = any(not future.done() for _, future in merges)
+            path, stopped = download_video(index_season_selected, i_episode, scrape_serie, video_source, master_playlist, merger, merges, clear_screen=not merge_pending)
+
+            if stopped:
+                for future in resolved.values():
+                    future.cancel()
+                break
+
+    report_merges(merges)
+
+def report_merges(merges: List[Tuple[int, Future]]) -> None:
+    """
+    Print the merges that failed in background, their output has been removed by finalize_video.
+
+    Parameters:
+        - merges (list): (episode, future) of every merge, all of them completed.
+    """
+    for i_episode, future in merges:
+        try:
+            r_proc = future.result()
+        except Exception as e:
+            logging.error(f"Merge of episode {i_episode} failed", exc_info=True)
+            console.print(f"[red]Merge of episode {i_episode} failed: {e}")
+            continue
+
+        if "error" in r_proc.keys():
+            console.print(f"[red]Merge of episode {i_episode} failed: {r_proc['error']}")
+
+def download_episodes(index_season_selected: int, list_episode_select: list, scrape_serie: ScrapeSerie, video_source: VideoSource) -> None:
+    """
+    Download episodes PARALLEL_EPISODES at a time, else one after another through the pipeline.
+
+    Parameters:
+        - index_season_selected (int): Index of the selected season.
+        - list_episode_select (list): Indexes of the episodes to download.
+    """
+    scheduler = EpisodeScheduler(rows_per_episode=HLS_Downloader.get_bar_rows())
+    if not scheduler.is_parallel:
+        download_episodes_pipelined(index_season_selected, list_episode_select, scrape_serie, video_source)
+        return
+
+    def download(i_episode: int, episode_slot: EpisodeSlot) -> tuple[str,bool]:
+        master_playlist = resolve_episode(i_episode, scrape_serie, video_source.media_id)
+        return download_video(index_season_selected, i_episode, scrape_serie, video_source, master_playlist, episode_slot=episode_slot)
+
+    season_label = f"S{dynamic_format_number(index_season_selected)}"
+    scheduler.run(list_episode_select, download, lambda i_episode: f"{season_label}E{dynamic_format_number(i_episode)}")
+
 def download_episode(index_season_selected: int, scrape_serie: ScrapeSerie, video_source: VideoSource, download_all: bool = False) -> None:
     """
     Download episodes of a selected season.
@@ -104,11 +253,7 @@ def download_episode(index_season_selected: int, scrape_serie: ScrapeSerie, vide
     if download_all:
 
         # Download all episodes without asking
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie, video_source)
-
-            if stopped:
-                break
+        download_episodes(index_season_selected, list(range(1, episodes_count + 1)), scrape_serie, video_source)
 
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
@@ -125,11 +270,7 @@ def download_episode(index_season_selected: int, scrape_serie: ScrapeSerie, vide
             return
 
         # Download selected episodes if not stopped
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie, video_source)
-
-            if stopped:
-                break
+        download_episodes(index_season_selected, list_episode_select, scrape_serie, video_source)
 
 def download_series(select_season: MediaItem, version: str) -> None:
     """
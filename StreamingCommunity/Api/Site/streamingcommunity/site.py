@@ -5,15 +5,12 @@ import logging
 import secrets
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_data_page
 from StreamingCommunity.Util.table import TVShowManager
 from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
@@ -46,18 +43,15 @@ def get_version(domain: str):
         str: The version extracted from the webpage.
     """
     try:
-        response = httpx.get(
+        response = session_registry.get(
             url=f"https://{SITE_NAME}.{domain}/", 
             headers={'User-Agent': get_headers()}, 
             timeout=max_timeout
         )
         response.raise_for_status()
 
-        # Parse request to site
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Extract version
-        version = json.loads(soup.find("div", {"id": "app"}).get("data-page"))['version']
+        # Extract version from the page state
+        version = json.loads(get_data_page(response.text))['version']
         #console.print(f"[cyan]Get version [white]=> [red]{version} \n")
 
         return version
@@ -110,7 +104,7 @@ def title_search(title_search: str, domain: str) -> int:
     table_show_manager.clear()
     
     try:
-        response = httpx.get(
+        response = session_registry.get(
             url=f"https://{SITE_NAME}.{domain}/api/search?q={title_search.replace(' ', '+')}", 
             headers={'user-agent': get_headers()}, 
             timeout=max_timeout
@@ -4,13 +4,10 @@ import json
 import logging
 
 
-# External libraries
-import httpx
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
+from StreamingCommunity.Util.html_extract import get_data_page
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Api.Player.Helper.Vixcloud.util import Season, EpisodeManager
 
@@ -59,7 +56,7 @@ class ScrapeSerie:
             Exception: If there's an error fetching season information
         """
         try:
-            response = httpx.get(
+            response = session_registry.get(
                 url=f"https://{self.base_name}.{self.domain}/titles/{self.media_id}-{self.series_name}",
                 headers=self.headers,
                 timeout=max_timeout
@@ -67,8 +64,7 @@ class ScrapeSerie:
             response.raise_for_status()
 
             # Extract seasons from JSON response
-            soup = BeautifulSoup(response.text, "html.parser")
-            json_response = json.loads(soup.find("div", {"id": "app"}).get("data-page"))
+            json_response = json.loads(get_data_page(response.text))
             self.version = json_response['version']
                   
             """
@@ -101,7 +97,7 @@ class ScrapeSerie:
             Exception: If there's an error fetching episode information
         """
         try:
-            response = httpx.get(
+            response = session_registry.get(
                 url=f'https://{self.base_name}.{self.domain}/titles/{self.media_id}-{self.series_name}/stagione-{number_season}', 
                 headers={
                     'User-Agent': get_headers(),
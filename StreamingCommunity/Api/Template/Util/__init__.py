@@ -2,4 +2,6 @@
 
 from .recall_search import execute_search
 from .get_domain import search_domain
-from .manage_ep import manage_selection, map_episode_title, validate_episode_selection, validate_selection, dynamic_format_number
\ No newline at end of file
+from .manage_ep import manage_selection, map_episode_title, validate_episode_selection, validate_selection, dynamic_format_number
+from .episode_scheduler import EpisodeScheduler, EpisodeSlot
+from .global_search import search_all_sites, global_search
\ No newline at end of file
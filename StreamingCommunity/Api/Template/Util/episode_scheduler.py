@@ -0,0 +1,169 @@
+# 18.10.26
+
+import signal
+import logging
+import threading
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+
+# External libraries
+from tqdm import tqdm
+
+
+# Internal utilities
+from StreamingCommunity.Util.console import console
+from StreamingCommunity.Util._jsonConfig import config_manager
+from StreamingCommunity.Lib.Downloader.HLS.controller import WorkerBudget
+
+
+# Config
+PARALLEL_EPISODES = config_manager.get_int('M3U8_DOWNLOAD', 'parallel_episodes')
+TOTAL_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'total_workers')
+
+
+
+class EpisodeSlot:
+    def __init__(self, scheduler: "EpisodeScheduler", index: int, label: str):
+        """
+        Place of an episode downloading next to the others: its progress bar lines and its share of the workers.
+
+        Parameters:
+            - scheduler (EpisodeScheduler): Scheduler running the episode.
+            - index (int): Index of the slot, from 0 to max_parallel - 1.
+            - label (str): Prefix of the progress bars, e.g. S01E03.
+        """
+        self.scheduler = scheduler
+        self.index = index
+        self.label = label
+
+        # Line 0 is the overall bar
+        self.bar_position = 1 + index * scheduler.rows_per_episode
+
+    @property
+    def worker_budget(self) -> WorkerBudget:
+        return self.scheduler.worker_budget
+
+    @property
+    def stop_event(self) -> threading.Event:
+        return self.scheduler.stopped
+
+    def register(self, downloader: Any) -> None:
+        """
+        Forward Ctrl+C to a downloader running in this slot.
+
+        Parameters:
+            - downloader (Any): Object with an interrupt() method, e.g. HLS_Downloader.
+        """
+        self.scheduler._register(downloader)
+
+
+class EpisodeScheduler:
+    def __init__(self, max_parallel: int = PARALLEL_EPISODES, total_workers: int = TOTAL_WORKERS, rows_per_episode: int = 1):
+        """
+        Download up to max_parallel episodes at once. Segment requests of every episode share one budget of total_workers.
+
+        Parameters:
+            - max_parallel (int): Episodes downloaded at the same time, 1 downloads them one after another.
+            - total_workers (int): Segment requests in flight across all the episodes.
+            - rows_per_episode (int): Progress bar lines used by a single episode.
+        """
+        self.max_parallel = max(1, max_parallel)
+        self.rows_per_episode = max(1, rows_per_episode)
+        self.worker_budget = WorkerBudget(total_workers)
+        self.stopped = threading.Event()
+        self._downloaders = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_parallel(self) -> bool:
+        return self.max_parallel > 1
+
+    def _register(self, downloader: Any) -> None:
+        with self._lock:
+            self._downloaders.append(downloader)
+
+        # Ctrl+C arrived before the downloader existed
+        if self.stopped.is_set():
+            downloader.interrupt()
+
+    def _interrupt_all(self, signum, frame):
+        """Signal handler stopping every episode in progress and the ones not started yet."""
+        console.print("\n[red]Stopping every episode ...")
+        self.stopped.set()
+
+        with self._lock:
+            downloaders = list(self._downloaders)
+
+        for downloader in downloaders:
+            downloader.interrupt()
+
+    def run(self, episodes: List[Any], download: Callable[[Any, Optional[EpisodeSlot]], Tuple[str, bool]], get_label: Callable[[Any], str] = str) -> bool:
+        """
+        Download the episodes, in order when max_parallel is 1.
+
+        Parameters:
+            - episodes (List[Any]): Episodes to download, passed as is to download.
+            - download (Callable): Called with the episode and its slot (None when sequential), returns the output path and the stopped status.
+            - get_label (Callable): Short name of an episode shown before its progress bars.
+
+        Returns:
+            bool: True if the download was stopped by the user.
+        """
+        if not self.is_parallel or len(episodes) <= 1:
+            for episode in episodes:
+                path, stopped = download(episode, None)
+
+                if stopped:
+                    self.stopped.set()
+                    break
+
+            return self.stopped.is_set()
+
+        return self._run_parallel(episodes, download, get_label)
+
+    def _run_parallel(self, episodes: List[Any], download: Callable, get_label: Callable[[Any], str]) -> bool:
+        free_slots = Queue()
+        for index in range(self.max_parallel):
+            free_slots.put(index)
+
+        overall_bar = tqdm(total=len(episodes), desc="Episodes", unit="ep", position=0, leave=True)
+
+        def download_in_slot(episode: Any) -> Tuple[str, bool]:
+            index = free_slots.get()
+            try:
+                if self.stopped.is_set():
+                    return None, True
+
+                return download(episode, EpisodeSlot(self, index, get_label(episode)))
+
+            finally:
+                free_slots.put(index)
+                overall_bar.update(1)
+
+        # Episodes run in worker threads, only the main thread can receive the signal
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGINT, self._interrupt_all)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="episode") as executor:
+                futures = [(episode, executor.submit(download_in_slot, episode)) for episode in episodes]
+
+                for episode, future in futures:
+                    try:
+                        path, stopped = future.result()
+                        if stopped:
+                            self.stopped.set()
+
+                    except Exception as e:
+                        logging.error(f"Episode {get_label(episode)} failed", exc_info=True)
+                        console.print(f"[red]Episode {get_label(episode)} failed: {e}")
+
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+            overall_bar.close()
+
+        return self.stopped.is_set()
@@ -1,7 +1,13 @@
 # 18.06.24
 
+import os
 import ssl
+import json
 import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 from urllib.parse import urlparse, unquote
 
 
@@ -15,6 +21,14 @@ from StreamingCommunity.Util.headers import get_headers
 from StreamingCommunity.Util.console import console, msg
 from StreamingCommunity.Util._jsonConfig import config_manager
 
+
+# Config
+DOMAIN_CACHE_PATH = config_manager.get('DEFAULT', 'domain_cache_path')
+DOMAIN_CACHE_TTL = config_manager.get_int('DEFAULT', 'domain_cache_ttl')
+
+
+# Variable
+VALIDATE_WORKERS = 8
 base_headers = {
     'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
     'accept-language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7',
@@ -32,6 +46,90 @@ base_headers = {
 }
 
 
+class DomainCache:
+    def __init__(self, path: str, ttl: int):
+        """
+        Domains validated recently, kept on disk so the next runs skip the validation.
+
+        Parameters:
+            - path (str): Json file of the cache.
+            - ttl (int): Seconds an entry is trusted after its validation, 0 disables the cache.
+        """
+        self.path = path
+        self.ttl = ttl
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, 'r') as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logging.warning(f"Cant read domain cache {self.path}: {e}")
+
+        return self._entries
+
+    def get(self, site_name: str, base_url: str) -> Optional[Tuple[str, str]]:
+        """
+        Domain and url validated for base_url less than ttl seconds ago, None otherwise.
+
+        Parameters:
+            - site_name (str): Name of the site.
+            - base_url (str): Url the site asked to validate.
+        """
+        if self.ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._load().get(site_name)
+
+        if entry is None or entry.get('base_url') != base_url:
+            return None
+        if time.time() - entry.get('validated_at', 0) > self.ttl:
+            return None
+
+        return entry['domain'], entry['url']
+
+    def set(self, site_name: str, base_url: str, domain: str, url: str) -> None:
+        """
+        Store a validated domain.
+
+        Parameters:
+            - site_name (str): Name of the site.
+            - base_url (str): Url the site asked to validate.
+            - domain (str): Validated domain (tld).
+            - url (str): Url returned with the domain.
+        """
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            entries = self._load()
+            entries[site_name] = {
+                'base_url': base_url,
+                'domain': domain,
+                'url': url,
+                'validated_at': time.time()
+            }
+
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(entries, f, indent=4)
+                os.replace(tmp_path, self.path)
+
+            except OSError as e:
+                logging.warning(f"Cant write domain cache {self.path}: {e}")
+
+
+# Shared by every site
+domain_cache = DomainCache(DOMAIN_CACHE_PATH, DOMAIN_CACHE_TTL)
+
+
 def get_tld(url_str):
     """Extract the TLD (Top-Level Domain) from the URL."""
     try:
@@ -83,8 +181,10 @@ def validate_url(url, base_url, max_timeout, max_retries=2, sleep=1):
     base_domain = get_base_domain(base_url)
     url_domain = get_base_domain(url)
 
-    base_headers['referer'] = url
-    base_headers['user-agent'] = get_headers()
+    # Copy, several sites can be validated at the same time
+    headers = dict(base_headers)
+    headers['referer'] = url
+    headers['user-agent'] = get_headers()
     
     if base_domain != url_domain:
         console.print(f"[red]Domain structure mismatch: {url_domain} != {base_domain}")
@@ -99,13 +199,16 @@ def validate_url(url, base_url, max_timeout, max_retries=2, sleep=1):
 
     client = httpx.Client(
         verify=False,
-        headers=base_headers,
+        headers=headers,
         timeout=max_timeout
     )
 
     for retry in range(max_retries):
         try:
-            time.sleep(sleep)
+
+            # Wait only before a new attempt
+            if retry > 0:
+                time.sleep(sleep)
             
             # Initial check without redirects
             response = client.get(url, follow_redirects=False)
@@ -134,15 +237,39 @@ def validate_url(url, base_url, max_timeout, max_retries=2, sleep=1):
             
         except (httpx.RequestError, ssl.SSLError) as e:
             console.print(f"[red]Connection error: {str(e)}")
-            time.sleep(sleep)
             continue
             
     return False, None
 
+def validate_urls(urls, base_url, max_timeout):
+    """Validate candidate URLs at the same time, results in the order of urls."""
+    def validate(url):
+        try:
+            return validate_url(url, base_url, max_timeout)
+        except Exception as e:
+            console.print(f"[red]Error validating {url}: {str(e)}")
+            return False, None
+
+    if not urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(VALIDATE_WORKERS, len(urls)), thread_name_prefix="validate") as executor:
+        return list(executor.map(validate, urls))
+
 def search_domain(site_name: str, base_url: str, get_first: bool = False):
     """Search for valid domain matching site name and base URL."""
+
+    # Only the main thread can ask, e.g. a global search uses the first valid domain for this run without saving it
+    in_background = threading.current_thread() is not threading.main_thread()
+
     max_timeout = config_manager.get_int("REQUESTS", "timeout")
     domain = str(config_manager.get_dict("SITE", site_name)['domain'])
+
+    # Validated less than domain_cache_ttl seconds ago
+    cached = domain_cache.get(site_name, base_url)
+    if cached is not None:
+        logging.info(f"Domain of {site_name} from cache: {cached[0]}")
+        return cached
     
     # Test initial URL
     try:
@@ -150,8 +277,16 @@ def search_domain(site_name: str, base_url: str, get_first: bool = False):
 
         if is_correct:
             tld = redirect_tld or get_tld(base_url)
-            config_manager.config['SITE'][site_name]['domain'] = tld
-            config_manager.write_config()
+
+            if in_background and tld != domain:
+                console.print(f"[yellow]{site_name}: domain [red]'{tld}'[yellow] used for this search only, open the site to save it")
+                return tld, base_url
+
+            if not in_background:
+                config_manager.config['SITE'][site_name]['domain'] = tld
+                config_manager.write_config()
+
+            domain_cache.set(site_name, base_url, tld, base_url)
             console.print(f"[green]Successfully validated initial URL")
             return tld, base_url
         
@@ -178,13 +313,18 @@ def search_domain(site_name: str, base_url: str, get_first: bool = False):
             and url.count('.') <= base_url.count('.') + 1
         ]
 
-        for idx, result_url in enumerate(filtered_results, 1):
-            console.print(f"\n[cyan]Checking result {idx}/{len(filtered_results)}[white]: [yellow]{result_url}")
-            
-            is_valid, new_tld = validate_url(result_url, base_url, max_timeout)
+        console.print(f"\n[cyan]Checking {len(filtered_results)} results")
+        validations = validate_urls(filtered_results, base_url, max_timeout)
+
+        for result_url, (is_valid, new_tld) in zip(filtered_results, validations):
             if is_valid:
                 final_tld = new_tld or get_tld(result_url)
 
+                # Never saved without the confirmation of the user
+                if in_background:
+                    console.print(f"[yellow]{site_name}: domain [red]'{final_tld}'[yellow] auto-accepted for this search only, open the site to save it")
+                    return final_tld, f"{base_url}.{final_tld}"
+
                 if get_first or msg.ask(
                     f"\n[cyan]Update site[white] [red]'{site_name}'[cyan] with domain[white] [red]'{final_tld}'",
                     choices=["y", "n"],
@@ -193,6 +333,7 @@ def search_domain(site_name: str, base_url: str, get_first: bool = False):
                     
                     config_manager.config['SITE'][site_name]['domain'] = final_tld
                     config_manager.write_config()
+                    domain_cache.set(site_name, base_url, final_tld, f"{base_url}.{final_tld}")
                     return final_tld, f"{base_url}.{final_tld}"
                     
     except Exception as e:
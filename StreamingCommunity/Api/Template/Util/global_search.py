@@ -0,0 +1,145 @@
+# 18.10.26
+
+import sys
+import time
+import logging
+import threading
+from concurrent.futures import Future, as_completed, TimeoutError
+from typing import Callable, Dict, Optional, Tuple
+
+
+# Internal utilities
+from StreamingCommunity.Util.console import console, msg
+from StreamingCommunity.Util.table import TVShowManager
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Logic class
+from StreamingCommunity.Api.Template.site import get_select_title
+from StreamingCommunity.Api.Template.Class.SearchType import MediaItem, MediaManager
+
+
+# Config
+GLOBAL_SEARCH_TIMEOUT = config_manager.get_int('DEFAULT', 'global_search_timeout')
+
+
+
+def _get_dedup_key(media: MediaItem) -> Tuple[str, str, str]:
+    """
+    Same title on two sites: normalized name, type and year when the site gives them.
+    """
+    name = " ".join(str(media.name or "").lower().split())
+    year = str(media.date or "")[:4]
+    return name, str(media.type or ""), year
+
+
+def _search_site(site_name: str, search_function: Callable, string_to_search: str) -> list:
+    """
+    Run the search of a single site and copy its results, the site keeps reusing its own MediaManager.
+    """
+    database = search_function(string_to_search, get_onylDatabase=True)
+
+    # Sites without a searchable database return a number
+    if not isinstance(database, MediaManager):
+        return []
+
+    media_list = list(database.media_list)
+    for media in media_list:
+        media.site = site_name
+
+    return media_list
+
+
+def _start_search(site_name: str, search_function: Callable, string_to_search: str) -> Future:
+    """
+    Run _search_site in a daemon thread: a site still hanging after the timeout must not hold the exit of the program,
+    as the threads of a ThreadPoolExecutor would.
+    """
+    future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(_search_site(site_name, search_function, string_to_search))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f"search_{site_name}", daemon=True).start()
+    return future
+
+
+def search_all_sites(search_functions: Dict[str, Tuple[Callable, str]], string_to_search: str, timeout: int = GLOBAL_SEARCH_TIMEOUT) -> MediaManager:
+    """
+    Search a title on every site at the same time, merging the results as each site answers.
+    Domain lookup and version fetch of every site run in parallel with the others.
+
+    Parameters:
+        - search_functions (dict): Search function and category of each site, as returned by load_search_functions.
+        - string_to_search (str): Title to search.
+        - timeout (int): Seconds given to the sites, the ones still running after it are skipped.
+
+    Returns:
+        MediaManager: Results without duplicates, each item with the 'site' it comes from.
+    """
+    merged = MediaManager()
+    seen = set()
+    start = time.time()
+
+    futures = {}
+    for alias, (search_function, _) in search_functions.items():
+        site_name = alias.split("_search")[0]
+        futures[_start_search(site_name, search_function, string_to_search)] = site_name
+
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            site_name = futures[future]
+
+            try:
+                media_list = future.result()
+            except Exception as e:
+                logging.error(f"Global search failed on {site_name}: {e}")
+                console.print(f"[red]{site_name}: search failed")
+                continue
+
+            n_added = 0
+            for media in media_list:
+                key = _get_dedup_key(media)
+                if key in seen:
+                    continue
+
+                seen.add(key)
+                merged.media_list.append(media)
+                n_added += 1
+
+            console.print(f"[green]{site_name}: [red]{len(media_list)} [green]results, [red]{n_added} [green]new [white]({time.time() - start:.1f} s)")
+
+    # A dead mirror must not hold the results of the others, late sites end in background without saving their domain
+    except TimeoutError:
+        pending = [site_name for future, site_name in futures.items() if not future.done()]
+        console.print(f"[yellow]No answer after {timeout} s from: [red]{', '.join(pending)}[yellow], their results are discarded")
+
+    return merged
+
+
+def global_search(search_functions: Dict[str, Tuple[Callable, str]], string_to_search: Optional[str] = None) -> None:
+    """
+    Search a title on every site, then continue on the site of the selected result.
+
+    Parameters:
+        - search_functions (dict): Search function and category of each site, as returned by load_search_functions.
+        - string_to_search (str, optional): Title to search, asked if None.
+    """
+    if string_to_search is None:
+        string_to_search = msg.ask("\n[purple]Insert word to search in [green]all sites").strip()
+
+    media_manager = search_all_sites(search_functions, string_to_search)
+
+    if media_manager.get_length() == 0:
+        console.print(f"\n[red]Nothing matching was found for[white]: [purple]{string_to_search}")
+        return
+
+    select_title = get_select_title(TVShowManager(), media_manager)
+
+    # Each site has its own download flow, it starts from the selected title without searching again
+    search_function, _ = search_functions[f"{select_title.site}_search"]
+    sys.modules[search_function.__module__].process_search_result(select_title)
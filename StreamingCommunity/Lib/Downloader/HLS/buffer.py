@@ -0,0 +1,129 @@
+# 18.10.26
+
+import os
+import logging
+import threading
+from typing import Optional
+
+
+class SpilledSegment:
+    __slots__ = ('offset', 'size')
+
+    def __init__(self, offset: int, size: int):
+        """
+        Reference to a segment parked in the spill file.
+
+        Parameters:
+            - offset (int): Position of the segment inside the spill file.
+            - size (int): Length of the segment in bytes.
+        """
+        self.offset = offset
+        self.size = size
+
+
+class SegmentBuffer:
+    def __init__(self, spill_path: str, max_bytes: int, use_spill: bool = False):
+        """
+        Bounded memory window for segments waiting to be written in order.
+
+        Parameters:
+            - spill_path (str): Path of the temporary file used when spilling.
+            - max_bytes (int): Maximum bytes kept in memory between download and write.
+            - use_spill (bool): Spill to disk when the window is full instead of blocking producers.
+        """
+        self.spill_path = spill_path
+        self.max_bytes = max_bytes
+        self.use_spill = use_spill
+
+        self.buffered_bytes = 0
+        self.peak_bytes = 0
+        self.spilled_segments = 0
+        self.next_index = 0
+        self.stopped = False
+
+        self._cond = threading.Condition()
+        self._spill_lock = threading.Lock()
+        self._spill_file = None
+        self._spill_offset = 0
+
+    def _can_buffer(self, index: int, size: int) -> bool:
+        # The segment the writer is waiting for is always accepted, otherwise the window can deadlock
+        return self.stopped or index <= self.next_index or self.buffered_bytes + size <= self.max_bytes
+
+    def acquire(self, index: int, size: int, blocking: bool = True) -> Optional[bool]:
+        """
+        Reserve room for a segment.
+
+        Parameters:
+            - index (int): Index of the segment.
+            - size (int): Size of the segment in bytes.
+            - blocking (bool): Wait for room instead of returning None.
+
+        Returns:
+            bool: True if the segment can stay in memory, False if it must be spilled to disk.
+            None: the window is full and blocking is False.
+        """
+        with self._cond:
+            while not self._can_buffer(index, size):
+                if self.use_spill:
+                    return False
+
+                if not blocking:
+                    return None
+
+                self._cond.wait(timeout=1)
+
+            self.buffered_bytes += size
+            self.peak_bytes = max(self.peak_bytes, self.buffered_bytes)
+            return True
+
+    def release(self, size: int) -> None:
+        """Free the room of a segment written to the output file."""
+        with self._cond:
+            self.buffered_bytes -= size
+            self._cond.notify_all()
+
+    def advance(self, next_index: int) -> None:
+        """Update the index the writer is waiting for."""
+        with self._cond:
+            self.next_index = next_index
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        """Wake up every blocked producer."""
+        with self._cond:
+            self.stopped = True
+            self._cond.notify_all()
+
+    def spill(self, content: bytes) -> SpilledSegment:
+        """Append a segment to the spill file."""
+        with self._spill_lock:
+            if self._spill_file is None:
+                self._spill_file = open(self.spill_path, 'w+b')
+
+            self._spill_file.seek(self._spill_offset)
+            self._spill_file.write(content)
+
+            ref = SpilledSegment(self._spill_offset, len(content))
+            self._spill_offset += len(content)
+            self.spilled_segments += 1
+            return ref
+
+    def read(self, ref: SpilledSegment) -> bytes:
+        """Read back a spilled segment."""
+        with self._spill_lock:
+            self._spill_file.flush()
+            self._spill_file.seek(ref.offset)
+            return self._spill_file.read(ref.size)
+
+    def close(self) -> None:
+        """Remove the spill file."""
+        with self._spill_lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+                try:
+                    os.remove(self.spill_path)
+                except OSError as e:
+                    logging.error(f"Cant remove spill file: {e}")
@@ -0,0 +1,189 @@
+# 18.10.26
+
+import time
+import logging
+import threading
+
+
+# External libraries
+import httpx
+
+
+# Variable
+THROTTLE_STATUS = (403, 429, 503)
+WINDOW_MIN_SECONDS = 1.0
+LATENCY_RISE_FACTOR = 2.0
+THROUGHPUT_GAIN = 1.05
+
+
+
+class WorkerBudget(threading.BoundedSemaphore):
+    def __init__(self, size: int):
+        """
+        Segment requests in flight shared by the tracks and episodes downloaded together.
+
+        Parameters:
+            - size (int): Requests in flight allowed, also the most workers a single track can use.
+        """
+        self.size = max(1, size)
+        super().__init__(self.size)
+
+
+class WorkerController:
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        """
+        AIMD controller of the segment requests in flight.
+        The limit grows by one while throughput keeps rising and is halved when the server throttles.
+
+        Parameters:
+            - initial (int): Requests in flight at start.
+            - minimum (int): Lower bound of the limit.
+            - maximum (int): Upper bound of the limit, the size of the worker pool.
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(self.maximum, max(self.minimum, initial))
+        self.peak_limit = self.limit
+        self.active = 0
+        self.stopped = False
+        self._cond = threading.Condition()
+
+        # Current measurement window
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._window_latency = 0.0
+        self._window_count = 0
+        self._last_throughput = 0.0
+        self._best_latency = None
+        self._last_decrease = 0.0
+
+        # Stats
+        self.n_increase = 0
+        self.n_decrease = 0
+
+    @property
+    def adaptive(self) -> bool:
+        return self.minimum != self.maximum
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Take a slot to start a request.
+
+        Parameters:
+            - blocking (bool): Wait for a free slot, else return False immediately.
+        """
+        with self._cond:
+            while self.active >= self.limit and not self.stopped:
+                if not blocking:
+                    return False
+                self._cond.wait(0.5)
+
+            self.active += 1
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            self.active -= 1
+            self._cond.notify()
+
+    def stop(self) -> None:
+        """Wake up every waiting worker, used on interrupt."""
+        with self._cond:
+            self.stopped = True
+            self._cond.notify_all()
+
+    def _set_limit(self, limit: int) -> None:
+        limit = min(self.maximum, max(self.minimum, limit))
+        if limit == self.limit:
+            return
+
+        if limit > self.limit:
+            self.n_increase += 1
+        else:
+            self.n_decrease += 1
+
+        logging.info(f"Worker limit {self.limit} -> {limit}")
+        self.limit = limit
+        self.peak_limit = max(self.peak_limit, limit)
+        self._cond.notify_all()
+
+    def _reset_window(self) -> None:
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._window_latency = 0.0
+        self._window_count = 0
+
+    def record_success(self, size: int, latency: float) -> None:
+        """
+        Account a downloaded segment, evaluating the window once it has seen enough of them.
+
+        Parameters:
+            - size (int): Downloaded bytes.
+            - latency (float): Seconds spent to download the segment.
+        """
+        if not self.adaptive:
+            return
+
+        with self._cond:
+            self._window_bytes += size
+            self._window_latency += latency
+            self._window_count += 1
+
+            elapsed = time.monotonic() - self._window_start
+            if self._window_count < self.limit or elapsed < WINDOW_MIN_SECONDS:
+                return
+
+            throughput = self._window_bytes / elapsed
+            avg_latency = self._window_latency / self._window_count
+            self._best_latency = avg_latency if self._best_latency is None else min(self._best_latency, avg_latency)
+
+            if throughput > self._last_throughput * THROUGHPUT_GAIN:
+                self._set_limit(self.limit + 1)
+
+            elif avg_latency > self._best_latency * LATENCY_RISE_FACTOR:
+                self._set_limit(self.limit - 1)
+
+            self._last_throughput = throughput
+            self._reset_window()
+
+    def record_failure(self, error: Exception) -> None:
+        """
+        Halve the limit when the error means the server is throttling us.
+
+        Parameters:
+            - error (Exception): Error raised by the request.
+        """
+        if not self.adaptive:
+            return
+
+        # A request waiting for a free connection of the local pool is not a sign of the server
+        if isinstance(error, httpx.PoolTimeout):
+            return
+
+        throttled = isinstance(error, httpx.TimeoutException) or (
+            isinstance(error, httpx.HTTPStatusError) and error.response.status_code in THROTTLE_STATUS
+        )
+        if not throttled:
+            return
+
+        with self._cond:
+
+            # Requests failing together are the same congestion event
+            now = time.monotonic()
+            if now - self._last_decrease < WINDOW_MIN_SECONDS:
+                return
+
+            self._last_decrease = now
+            self._set_limit(self.limit // 2)
+
+            # Throughput measured with the old limit is no longer a reference
+            self._last_throughput = 0.0
+            self._reset_window()
+
+    def get_stats(self) -> dict:
+        return {
+            'limit': self.limit,
+            'peakLimit': self.peak_limit,
+            'increases': self.n_increase,
+            'decreases': self.n_decrease
+        }
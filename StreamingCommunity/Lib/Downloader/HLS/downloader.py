@@ -5,7 +5,10 @@ import re
 import time
 import logging
 import shutil
-from typing import Any, Dict, List, Optional
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 
 # External libraries
@@ -28,11 +31,16 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 from ...FFmpeg import (
     print_duration_table,
     join_video,
-    join_audios,
-    join_subtitle
+    join_all,
+    join_stream
 )
 from ...M3U8 import M3U8_Parser, M3U8_UrlFix
 from .segments import M3U8_Segments
+from .segments_async import M3U8_Segments_Async
+from .journal import SegmentJournal
+from .controller import WorkerBudget
+from .playlist_cache import playlist_cache
+from .segment_cache import segment_cache
 
 
 # Config
@@ -43,6 +51,11 @@ DOWNLOAD_SPECIFIC_SUBTITLE = config_manager.get_list('M3U8_DOWNLOAD', 'specific_
 MERGE_AUDIO = config_manager.get_bool('M3U8_DOWNLOAD', 'merge_audio')
 MERGE_SUBTITLE = config_manager.get_bool('M3U8_DOWNLOAD', 'merge_subs')
 CLEANUP_TMP = config_manager.get_bool('M3U8_DOWNLOAD', 'cleanup_tmp_folder')
+DOWNLOAD_ENGINE = config_manager.get('M3U8_DOWNLOAD', 'download_engine')
+CONCURRENT_TRACKS = config_manager.get_bool('M3U8_DOWNLOAD', 'concurrent_tracks')
+TOTAL_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'total_workers')
+STREAM_REMUX = config_manager.get_bool('M3U8_DOWNLOAD', 'stream_remux')
+USE_CODEC = config_manager.get_bool("M3U8_CONVERSION", "use_codec")
 FILTER_CUSTOM_REOLUTION = config_manager.get_int('M3U8_PARSER', 'force_resolution')
 GET_ONLY_LINK = config_manager.get_bool('M3U8_PARSER', 'get_only_link')
 RETRY_LIMIT = config_manager.get_int('REQUESTS', 'max_retry')
@@ -51,6 +64,10 @@ MAX_TIMEOUT = config_manager.get_int("REQUESTS", "timeout")
 TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
 
 
+# Variable
+REMUX_STOP_TIMEOUT = 10
+
+
 
 class HLSClient:
     """Client for making HTTP requests to HLS endpoints with retry mechanism."""
@@ -71,9 +88,12 @@ class HLSClient:
         client = httpx.Client(headers=self.headers, timeout=MAX_TIMEOUT, follow_redirects=True)
         for attempt in range(RETRY_LIMIT):
             try:
+                if not return_content:
+                    return playlist_cache.fetch(url, client)
+
                 response = client.get(url)
                 response.raise_for_status()
-                return response.content if return_content else response.text
+                return response.content
             
             except Exception as e:
                 logging.error(f"Attempt {attempt+1} failed: {str(e)}")
@@ -149,7 +169,7 @@ class M3U8Manager:
         if not content:
             raise ValueError("Failed to fetch M3U8 content")
         
-        self.parser.parse_data(uri=self.m3u8_url, raw_content=content)
+        self.parser = playlist_cache.get_parser(self.m3u8_url, content)
         self.url_fixer.set_playlist(self.m3u8_url)
         self.is_master = self.parser.is_master_playlist
 
@@ -240,26 +260,59 @@ class M3U8Manager:
 
 class DownloadManager:
     """Manages downloading of video, audio, and subtitle streams."""
-    def __init__(self, temp_dir: str, client: HLSClient, url_fixer: M3U8_UrlFix):
+    def __init__(self, temp_dir: str, client: HLSClient, url_fixer: M3U8_UrlFix, worker_budget: Optional[WorkerBudget] = None, bar_position: Optional[int] = None, label: Optional[str] = None):
         """
         Args:
             temp_dir: Directory for storing temporary files
             client: HLSClient instance for making requests
             url_fixer: URL fixer instance for generating complete URLs
+            worker_budget: Requests in flight shared with other downloads, e.g. episodes downloaded in parallel
+            bar_position: First line of the progress bars
+            label: Prefix of the progress bar descriptions
         """
         self.temp_dir = temp_dir
         self.client = client
         self.url_fixer = url_fixer
         self.missing_segments = []
         self.stopped = False
+        self.segments_class = M3U8_Segments_Async if DOWNLOAD_ENGINE == "async" else M3U8_Segments
+        self.bar_position = bar_position
+        self.label = f"{label} " if label else ""
+
+        # Created when tracks are downloaded concurrently, if not given
+        self.worker_budget: Optional[WorkerBudget] = worker_budget
+        self.bar_positions = {}
+        self.pipe_paths = {}
+        self.active_downloaders: List[M3U8_Segments] = []
+
+        # Called when a track fails or the user interrupts, e.g. to stop the FFmpeg reading the pipes
+        self.on_abort: Optional[Callable[[], None]] = None
+
+    def _create_downloader(self, url: str, tmp_dir: str) -> M3U8_Segments:
+        downloader = self.segments_class(
+            url=url, 
+            tmp_folder=tmp_dir, 
+            worker_budget=self.worker_budget, 
+            bar_position=self.bar_positions.get(tmp_dir, self.bar_position),
+            output_pipe=self.pipe_paths.get(tmp_dir)
+        )
+        self.active_downloaders.append(downloader)
+
+        # Interrupted while the track was starting
+        if self.stopped:
+            downloader.interrupt()
+        return downloader
 
     def download_video(self, video_url: str):
         """Downloads video segments from the M3U8 playlist."""
+        if self.stopped:
+            return True
+
         video_full_url = self.url_fixer.generate_full_url(video_url)
         video_tmp_dir = os.path.join(self.temp_dir, 'video')
 
-        downloader = M3U8_Segments(url=video_full_url, tmp_folder=video_tmp_dir)
-        result = downloader.download_streams("Video", "video")
+        downloader = self._create_downloader(video_full_url, video_tmp_dir)
+        result = downloader.download_streams(f"{self.label}Video", "video")
         self.missing_segments.append(result)
 
         if result.get('stopped', False):
@@ -274,8 +327,8 @@ class DownloadManager:
         audio_full_url = self.url_fixer.generate_full_url(audio['uri'])
         audio_tmp_dir = os.path.join(self.temp_dir, 'audio', audio['language'])
 
-        downloader = M3U8_Segments(url=audio_full_url, tmp_folder=audio_tmp_dir)
-        result = downloader.download_streams(f"Audio {audio['language']}", "audio")
+        downloader = self._create_downloader(audio_full_url, audio_tmp_dir)
+        result = downloader.download_streams(f"{self.label}Audio {audio['language']}", "audio")
         self.missing_segments.append(result)
 
         if result.get('stopped', False):
@@ -295,12 +348,91 @@ class DownloadManager:
 
         return self.stopped
 
+    def _is_track_downloaded(self, track_dir: str) -> bool:
+        """
+        Check if a track is complete. Partial tracks are resumed by M3U8_Segments through their journal.
+        """
+        if SegmentJournal.exists(track_dir):
+            return SegmentJournal.is_complete(track_dir)
+        return os.path.exists(os.path.join(track_dir, '0.ts'))
+
+    def _interrupt_all(self, signum, frame):
+        """Signal handler forwarding the interruption to every track in progress."""
+        self.interrupt()
+
+    def interrupt(self) -> None:
+        """Stop every track in progress."""
+        self.stopped = True
+        for downloader in self.active_downloaders:
+            downloader.interrupt()
+
+        if self.on_abort is not None:
+            self.on_abort()
+
+    def _run_track(self, job: Callable, arg: Any):
+        """Run a track download, the other tracks are aborted through on_abort if it fails."""
+        try:
+            return job(arg)
+
+        except Exception:
+            if self.on_abort is not None:
+                self.on_abort()
+            raise
+
+    def download_all_concurrent(self, video_url: str, audio_streams: List[Dict], sub_streams: List[Dict]):
+        """
+        Downloads video, audio and subtitle streams at the same time.
+        Segment requests of every track share one worker budget.
+        """
+        jobs = []
+        if not self._is_track_downloaded(os.path.join(self.temp_dir, 'video')):
+            jobs.append((self.download_video, video_url, os.path.join(self.temp_dir, 'video')))
+
+        for audio in audio_streams:
+            audio_tmp_dir = os.path.join(self.temp_dir, 'audio', audio['language'])
+            if not self._is_track_downloaded(audio_tmp_dir):
+                jobs.append((self.download_audio, audio, audio_tmp_dir))
+
+        for sub in sub_streams:
+            if not os.path.exists(os.path.join(self.temp_dir, 'subs', f"{sub['language']}.vtt")):
+                jobs.append((self.download_subtitle, sub, None))
+
+        if not jobs:
+            return self.stopped
+
+        if self.worker_budget is None:
+            self.worker_budget = WorkerBudget(TOTAL_WORKERS)
+
+        # One progress bar line for each segmented track
+        track_dirs = [tmp_dir for _, _, tmp_dir in jobs if tmp_dir]
+        self.bar_positions = {tmp_dir: (self.bar_position or 0) + position for position, tmp_dir in enumerate(track_dirs)}
+
+        # Tracks run in worker threads, only the main thread can receive the signal
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGINT, self._interrupt_all)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [executor.submit(self._run_track, job, arg) for job, arg, _ in jobs]
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+
+        # Propagate the first error, like the sequential download
+        for future in futures:
+            future.result()
+
+        return self.stopped
+
     def download_all(self, video_url: str, audio_streams: List[Dict], sub_streams: List[Dict]):
         """
         Downloads all selected streams (video, audio, subtitles).
         """
-        video_file = os.path.join(self.temp_dir, 'video', '0.ts')
-        if not os.path.exists(video_file):
+        if CONCURRENT_TRACKS:
+            return self.download_all_concurrent(video_url, audio_streams, sub_streams)
+
+        if not self._is_track_downloaded(os.path.join(self.temp_dir, 'video')):
             if self.download_video(video_url):
                 return True
         
@@ -308,8 +440,7 @@ class DownloadManager:
             if self.stopped:
                 break
 
-            audio_file = os.path.join(self.temp_dir, 'audio', audio['language'], '0.ts')
-            if not os.path.exists(audio_file):
+            if not self._is_track_downloaded(os.path.join(self.temp_dir, 'audio', audio['language'])):
                 if self.download_audio(audio):
                     return True
 
@@ -347,8 +478,7 @@ class MergeManager:
         
         Process:
         1. If no audio/subs, just process video
-        2. If audio exists, merge with video
-        3. If subtitles exist, add them to the video
+        2. Else merge video, audio and subtitles with a single FFmpeg pass
         """
         video_file = os.path.join(self.temp_dir, 'video', '0.ts')
         merged_file = video_file
@@ -361,45 +491,220 @@ class MergeManager:
             )
 
         else:
+            audio_tracks = []
             if MERGE_AUDIO and self.audio_streams:
                 audio_tracks = [{
                     'path': os.path.join(self.temp_dir, 'audio', a['language'], '0.ts'),
                     'name': a['language']
                 } for a in self.audio_streams]
 
-                merged_audio_path = os.path.join(self.temp_dir, 'merged_audio.mp4')
-                merged_file = join_audios(
-                    video_path=video_file,
-                    audio_tracks=audio_tracks,
-                    out_path=merged_audio_path,
-                    codec=self.parser.codec
-                )
-
+            sub_tracks = []
             if MERGE_SUBTITLE and self.sub_streams:
                 sub_tracks = [{
                     'path': os.path.join(self.temp_dir, 'subs', f"{s['language']}.vtt"),
                     'language': s['language']
                 } for s in self.sub_streams]
 
-                merged_subs_path = os.path.join(self.temp_dir, 'final.mp4')
-                merged_file = join_subtitle(
-                    video_path=merged_file,
+            if audio_tracks or sub_tracks:
+                merged_file = join_all(
+                    video_path=video_file,
+                    audio_tracks=audio_tracks,
                     subtitles_list=sub_tracks,
-                    out_path=merged_subs_path
+                    out_path=os.path.join(self.temp_dir, 'final.mp4'),
+                    codec=self.parser.codec
                 )
-                
+
         return merged_file
 
 
+class StreamRemuxManager:
+    """Remuxes video and audio into mp4 while they are downloaded, FFmpeg reads the segments from named pipes."""
+    def __init__(self, temp_dir: str, download_manager: DownloadManager, audio_streams: List[Dict], sub_streams: List[Dict]):
+        """
+        Args:
+            temp_dir: Directory for storing temporary files
+            download_manager: DownloadManager used for the tracks
+            audio_streams: List of audio streams to merge
+            sub_streams: List of subtitle streams to merge
+        """
+        self.temp_dir = temp_dir
+        self.download_manager = download_manager
+        self.audio_streams = audio_streams if MERGE_AUDIO else []
+        self.sub_streams = sub_streams if MERGE_SUBTITLE else []
+        self.out_path = os.path.join(temp_dir, 'final.mp4')
+        self.process = None
+        self.stderr = ""
+
+    @staticmethod
+    def is_supported(temp_dir: str, audio_streams: List[Dict]) -> bool:
+        """
+        Streaming needs named pipes, stream copy and no partial track to resume.
+        """
+        if not STREAM_REMUX or USE_CODEC or not hasattr(os, 'mkfifo'):
+            return False
+        
+        if audio_streams and not MERGE_AUDIO:
+            return False
+
+        track_dirs = [os.path.join(temp_dir, 'video')] + [os.path.join(temp_dir, 'audio', a['language']) for a in audio_streams]
+        return not any(
+            SegmentJournal.exists(track_dir) or os.path.exists(os.path.join(track_dir, '0.ts'))
+            for track_dir in track_dirs
+        )
+
+    def _create_pipe(self, track_dir: str) -> str:
+        os.makedirs(track_dir, exist_ok=True)
+        pipe_path = os.path.join(track_dir, 'stream.pipe')
+
+        if os.path.exists(pipe_path):
+            os.remove(pipe_path)
+        os.mkfifo(pipe_path)
+
+        self.download_manager.pipe_paths[track_dir] = pipe_path
+        return pipe_path
+
+    def _watch_ffmpeg(self) -> None:
+        """
+        Wait for FFmpeg, releasing the writers blocked on the pipes if it exits too early.
+        """
+        _, stderr = self.process.communicate()
+        self.stderr = stderr or ""
+
+        if self.process.returncode != 0:
+            for pipe_path in self.download_manager.pipe_paths.values():
+                try:
+                    fd = os.open(pipe_path, os.O_RDONLY | os.O_NONBLOCK)
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _close_unopened_pipes(self) -> None:
+        """
+        FFmpeg opens its inputs one after another and waits on a pipe until a writer opens it.
+        Opening and closing the pipes of the tracks that never started gives it an empty input.
+        """
+        for pipe_path in self.download_manager.pipe_paths.values():
+            try:
+                # Fails with ENXIO once FFmpeg is no longer reading the pipe
+                fd = os.open(pipe_path, os.O_WRONLY | os.O_NONBLOCK)
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _abort(self) -> None:
+        """
+        A track failed or the user interrupted: stop FFmpeg, so the writers blocked on a full pipe get a broken pipe.
+        The other tracks cannot be remuxed anymore and are stopped too.
+        """
+        if self.process is not None and self.process.poll() is None:
+            logging.info("Stop FFmpeg stream remux")
+            self.process.terminate()
+
+        if not self.download_manager.stopped:
+            self.download_manager.stopped = True
+            for downloader in self.download_manager.active_downloaders:
+                downloader.interrupt()
+
+    def download(self, video_url: str) -> bool:
+        """
+        Downloads all the tracks concurrently while FFmpeg writes the final file.
+        Returns True if the download was stopped.
+        """
+        for sub in self.sub_streams:
+            self.download_manager.download_subtitle(sub)
+
+        video_pipe = self._create_pipe(os.path.join(self.temp_dir, 'video'))
+        audio_tracks = [{
+            'path': self._create_pipe(os.path.join(self.temp_dir, 'audio', a['language'])),
+            'name': a['language']
+        } for a in self.audio_streams]
+        sub_tracks = [{
+            'path': os.path.join(self.temp_dir, 'subs', f"{s['language']}.vtt"),
+            'language': s['language']
+        } for s in self.sub_streams]
+
+        console.log("[purple]FFmpeg [white][[cyan]Stream remux[white]] ...")
+        self.process = join_stream(video_pipe, audio_tracks, sub_tracks, self.out_path)
+        watcher = threading.Thread(target=self._watch_ffmpeg, daemon=True)
+        watcher.start()
+        self.download_manager.on_abort = self._abort
+
+        completed = False
+        try:
+            stopped = self.download_manager.download_all_concurrent(video_url, self.audio_streams, [])
+            completed = not stopped
+
+        finally:
+            self.download_manager.on_abort = None
+            if not completed:
+                self._abort()
+            self._close_unopened_pipes()
+
+            # After a failure FFmpeg only has to exit, a completed download waits for the end of the remux
+            watcher.join(None if completed else REMUX_STOP_TIMEOUT)
+            if watcher.is_alive():
+                logging.error("FFmpeg stream remux did not exit, kill it")
+                self.process.kill()
+                watcher.join(REMUX_STOP_TIMEOUT)
+
+            for pipe_path in self.download_manager.pipe_paths.values():
+                if os.path.exists(pipe_path):
+                    os.remove(pipe_path)
+
+        if stopped:
+            return True
+
+        if self.process.returncode != 0:
+            raise RuntimeError(f"FFmpeg stream remux failed ({self.process.returncode}): {self.stderr.strip()}")
+        
+        return False
+
+
 class HLS_Downloader:
     """Main class for HLS video download and processing."""
-    def __init__(self, m3u8_url: str, output_path: Optional[str] = None):
+    def __init__(self, m3u8_url: str, output_path: Optional[str] = None, worker_budget: Optional[WorkerBudget] = None, bar_position: Optional[int] = None, label: Optional[str] = None):
+        """
+        Args:
+            m3u8_url: Master or media playlist URL
+            output_path: Desired output path for the final video file
+            worker_budget: Segment requests in flight shared with the other episodes downloaded in parallel
+            bar_position: First line of the progress bars of this download
+            label: Prefix of the progress bar descriptions, e.g. the episode
+        """
         self.m3u8_url = m3u8_url
+        self.worker_budget = worker_budget
+        self.bar_position = bar_position
+        self.label = label
+        self.interrupted = False
         self.path_manager = PathManager(m3u8_url, output_path)
         self.client = HLSClient()
         self.m3u8_manager = M3U8Manager(m3u8_url, self.client)
         self.download_manager: Optional[DownloadManager] = None
         self.merge_manager: Optional[MergeManager] = None
+        self.remux_manager: Optional[StreamRemuxManager] = None
+
+    @staticmethod
+    def get_bar_rows() -> int:
+        """Progress bar lines a download can use at the same time."""
+        return 1 + len(DOWNLOAD_SPECIFIC_AUDIO) if CONCURRENT_TRACKS or STREAM_REMUX else 1
+
+    def interrupt(self) -> None:
+        """Stop the download in progress, used when it runs outside of the main thread."""
+        self.interrupted = True
+        if self.download_manager is not None:
+            self.download_manager.interrupt()
+
+    @staticmethod
+    def prefetch(m3u8_url: str) -> None:
+        """
+        Fetch and parse a playlist into the shared playlist cache ahead of start(), used to resolve the next episodes in background.
+
+        Parameters:
+            - m3u8_url (str): Master or media playlist URL.
+        """
+        content = HLSClient().request(m3u8_url)
+        if content:
+            playlist_cache.get_parser(m3u8_url, content)
 
     def start(self) -> Dict[str, Any]:
         """
@@ -412,6 +717,19 @@ class HLS_Downloader:
                 - is_master: Whether the M3U8 was a master playlist
             Or raises an exception if there's an error
         """       
+        response = self.download()
+        if response is not None:
+            return response
+
+        return self.finalize()
+
+    def download(self) -> Optional[Dict[str, Any]]:
+        """
+        Parse the playlist and download every track, without merging them.
+
+        Returns:
+            Dict: The final response if there is nothing to merge (file exists, stopped or error), None if finalize() must follow.
+        """
         if TELEGRAM_BOT:
             bot = get_bot_instance()
 
@@ -439,15 +757,31 @@ class HLS_Downloader:
             self.download_manager = DownloadManager(
                 temp_dir=self.path_manager.temp_dir,
                 client=self.client,
-                url_fixer=self.m3u8_manager.url_fixer
+                url_fixer=self.m3u8_manager.url_fixer,
+                worker_budget=self.worker_budget,
+                bar_position=self.bar_position,
+                label=self.label
             )
             
-            # Check if download was stopped
-            download_stopped = self.download_manager.download_all(
-                video_url=self.m3u8_manager.video_url,
-                audio_streams=self.m3u8_manager.audio_streams,
-                sub_streams=self.m3u8_manager.sub_streams
-            )
+            # Remux while downloading when possible, else download every track and merge them after
+            if self.interrupted:
+                download_stopped = True
+
+            elif StreamRemuxManager.is_supported(self.path_manager.temp_dir, self.m3u8_manager.audio_streams):
+                self.remux_manager = StreamRemuxManager(
+                    temp_dir=self.path_manager.temp_dir,
+                    download_manager=self.download_manager,
+                    audio_streams=self.m3u8_manager.audio_streams,
+                    sub_streams=self.m3u8_manager.sub_streams
+                )
+                download_stopped = self.remux_manager.download(self.m3u8_manager.video_url)
+
+            else:
+                download_stopped = self.download_manager.download_all(
+                    video_url=self.m3u8_manager.video_url,
+                    audio_streams=self.m3u8_manager.audio_streams,
+                    sub_streams=self.m3u8_manager.sub_streams
+                )
 
             if download_stopped:
                 return {
@@ -458,14 +792,29 @@ class HLS_Downloader:
                     'stopped': True
                 }
 
-            self.merge_manager = MergeManager(
-                temp_dir=self.path_manager.temp_dir,
-                parser=self.m3u8_manager.parser,
-                audio_streams=self.m3u8_manager.audio_streams,
-                sub_streams=self.m3u8_manager.sub_streams
-            )
+            return None
+
+        except Exception as e:
+            return self._error_response(e)
+
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Merge the downloaded tracks, move the final file and print the summary.
+        Can run in another thread while the next download starts.
+        """
+        try:
+            if self.remux_manager is not None:
+                final_file = self.remux_manager.out_path
+
+            else:
+                self.merge_manager = MergeManager(
+                    temp_dir=self.path_manager.temp_dir,
+                    parser=self.m3u8_manager.parser,
+                    audio_streams=self.m3u8_manager.audio_streams,
+                    sub_streams=self.m3u8_manager.sub_streams
+                )
+                final_file = self.merge_manager.merge()
 
-            final_file = self.merge_manager.merge()
             self.path_manager.move_final_file(final_file)
             self.path_manager.cleanup()
 
@@ -479,17 +828,20 @@ class HLS_Downloader:
             }
 
         except Exception as e:
-            error_msg = str(e)
-            console.print(f"[red]Download failed: {error_msg}[/red]")
-            logging.error("Download error", exc_info=True)
-            
-            return {
-                'path': None,
-                'url': self.m3u8_url,
-                'is_master': getattr(self.m3u8_manager, 'is_master', None),
-                'error': error_msg,
-                'stopped': False
-            }
+            return self._error_response(e)
+
+    def _error_response(self, e: Exception) -> Dict[str, Any]:
+        error_msg = str(e)
+        console.print(f"[red]Download failed: {error_msg}[/red]")
+        logging.error("Download error", exc_info=True)
+        
+        return {
+            'path': None,
+            'url': self.m3u8_url,
+            'is_master': getattr(self.m3u8_manager, 'is_master', None),
+            'error': error_msg,
+            'stopped': False
+        }
         
     def _print_summary(self):
         """Prints download summary including file size, duration, and any missing segments."""
@@ -518,6 +870,11 @@ class HLS_Downloader:
             clean_message = re.sub(r'\[[a-zA-Z]+\]', '', message)
             bot.send_message(clean_message, None)
 
+        if segment_cache.enabled:
+            cache_hit = sum(item.get('cache', {}).get('hit', 0) for item in self.download_manager.missing_segments)
+            cache_miss = sum(item.get('cache', {}).get('miss', 0) for item in self.download_manager.missing_segments)
+            panel_content += f"\n[cyan]Segment cache: [bold green]{cache_hit}[/bold green] hit, [bold red]{cache_miss}[/bold red] miss"
+
         if missing_ts:
             panel_content += f"\n{missing_info}"
             os.rename(self.path_manager.output_path, self.path_manager.output_path.replace(".mp4", "_failed.mp4"))
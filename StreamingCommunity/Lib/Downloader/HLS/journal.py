@@ -0,0 +1,132 @@
+# 18.10.26
+
+import os
+import json
+import logging
+from typing import Dict, List, Set, Tuple
+
+
+# Variable
+JOURNAL_NAME = "journal.log"
+DONE_MARKER = "done"
+INIT_INDEX = -1             # fMP4 init section, written before the first segment
+
+
+
+class SegmentJournal:
+    def __init__(self, folder: str):
+        """
+        Append-only journal of the segments written to 0.ts, used to resume interrupted downloads.
+
+        Parameters:
+            - folder (str): Temporary folder of the stream.
+        """
+        self.path = os.path.join(folder, JOURNAL_NAME)
+        self._file = None
+
+    def load(self, playlist_hash: str) -> Tuple[Dict[int, Tuple[int, int]], Set[int]]:
+        """
+        Read a previous journal written for the same playlist.
+
+        Parameters:
+            - playlist_hash (str): Hash of the current playlist.
+
+        Returns:
+            tuple: ({index: (offset, size)} of written segments, set of failed indexes).
+        """
+        written, failed = {}, set()
+        if not os.path.exists(self.path):
+            return written, failed
+
+        try:
+            with open(self.path, 'r') as f:
+                header = json.loads(f.readline())
+                if header.get('playlist') != playlist_hash:
+                    logging.info("Journal belongs to another playlist, start from scratch")
+                    return {}, set()
+
+                for line in f:
+                    parts = line.split()
+
+                    # Skip the done marker and a line truncated by a crash
+                    if len(parts) != 3 or not line.endswith("\n"):
+                        continue
+
+                    index, offset, size = map(int, parts)
+                    if offset < 0:
+                        failed.add(index)
+                    else:
+                        written[index] = (offset, size)
+
+        except Exception as e:
+            logging.error(f"Cant read journal {self.path}: {e}")
+            return {}, set()
+
+        return written, failed
+
+    def open(self, playlist_hash: str, entries: List[Tuple[int, int, int]] = None) -> None:
+        """
+        Start a new journal, keeping the entries still valid from a previous run.
+
+        Parameters:
+            - playlist_hash (str): Hash of the current playlist.
+            - entries (list): (index, offset, size) entries to carry over, offset -1 for failed segments.
+        """
+        self._file = open(self.path, 'w')
+        self._file.write(json.dumps({'playlist': playlist_hash}) + "\n")
+
+        for index, offset, size in (entries or []):
+            self._file.write(f"{index} {offset} {size}\n")
+        self._file.flush()
+
+    def record(self, index: int, offset: int, size: int) -> None:
+        """Record a segment written at offset."""
+        if self._file is not None:
+            self._file.write(f"{index} {offset} {size}\n")
+            self._file.flush()
+
+    def record_init(self, size: int) -> None:
+        """Record the init section written at the start of 0.ts."""
+        self.record(INIT_INDEX, 0, size)
+
+    def record_failed(self, index: int) -> None:
+        """Record a segment skipped after all the retries."""
+        self.record(index, -1, 0)
+
+    def mark_complete(self) -> None:
+        """Mark every segment of the playlist as processed."""
+        if self._file is not None:
+            self._file.write(DONE_MARKER + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def is_complete(folder: str) -> bool:
+        """
+        Check if every segment of the stream in folder has been downloaded, a track with failed segments is resumed to fill them.
+
+        Parameters:
+            - folder (str): Temporary folder of the stream.
+        """
+        path = os.path.join(folder, JOURNAL_NAME)
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, 'r') as f:
+                f.readline()
+                lines = f.read().split()
+
+        except OSError:
+            return False
+
+        # Entries are "index offset size", failed ones have offset -1
+        return bool(lines) and lines[-1] == DONE_MARKER and "-1" not in lines[1::3]
+
+    @staticmethod
+    def exists(folder: str) -> bool:
+        return os.path.exists(os.path.join(folder, JOURNAL_NAME))
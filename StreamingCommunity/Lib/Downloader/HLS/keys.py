@@ -0,0 +1,125 @@
+# 18.10.26
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable
+
+
+# External libraries
+import httpx
+
+
+# Internal utilities
+from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Config
+MAX_TIMEOOUT = config_manager.get_int("REQUESTS", "timeout")
+REQUEST_MAX_RETRY = config_manager.get_int('REQUESTS', 'max_retry')
+
+
+# Variable
+KEY_CACHE_SIZE = 128
+KEY_PREFETCH = 2
+
+
+
+class KeyCache:
+    def __init__(self, max_keys: int = KEY_CACHE_SIZE):
+        """
+        Thread-safe LRU cache of EXT-X-KEY keys, each distinct key uri is fetched once.
+
+        Parameters:
+            - max_keys (int): Maximum number of keys kept.
+        """
+        self.max_keys = max_keys
+        self._keys: "OrderedDict[str, bytes]" = OrderedDict()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._prefetcher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="key-prefetch")
+
+        # Stats
+        self.n_fetch = 0
+        self.n_hit = 0
+
+    def _fetch(self, uri: str) -> bytes:
+        client_params = {'headers': {'User-Agent': get_headers()}, 'timeout': MAX_TIMEOOUT, 'follow_redirects': True}
+
+        for attempt in range(REQUEST_MAX_RETRY):
+            try:
+                response = httpx.get(url=uri, **client_params)
+                response.raise_for_status()
+                return response.content
+
+            except Exception as e:
+                logging.info(f"Attempt {attempt + 1} failed for key '{uri}': {e}")
+                if attempt + 1 == REQUEST_MAX_RETRY:
+                    raise Exception(f"Failed to fetch key: {e}")
+
+    def get(self, uri: str) -> bytes:
+        """
+        Return the key at uri, fetching it only if no other thread is already doing it.
+
+        Parameters:
+            - uri (str): Absolute uri of the key.
+        """
+        while True:
+            with self._lock:
+                if uri in self._keys:
+                    self._keys.move_to_end(uri)
+                    self.n_hit += 1
+                    return self._keys[uri]
+
+                event = self._inflight.get(uri)
+                if event is None:
+                    event = threading.Event()
+                    self._inflight[uri] = event
+                    owner = True
+                else:
+                    owner = False
+
+            # Another thread is fetching this key: wait, then read it from the cache or fetch it if that failed
+            if not owner:
+                event.wait()
+                continue
+
+            try:
+                key = self._fetch(uri)
+                with self._lock:
+                    self.n_fetch += 1
+                    self._keys[uri] = key
+                    while len(self._keys) > self.max_keys:
+                        self._keys.popitem(last=False)
+                return key
+
+            finally:
+                with self._lock:
+                    self._inflight.pop(uri, None)
+                event.set()
+
+    def prefetch(self, uris: Iterable[str]) -> None:
+        """
+        Fetch keys in background before the segments that need them.
+
+        Parameters:
+            - uris (Iterable[str]): Uris of the next keys.
+        """
+        for uri in uris:
+            with self._lock:
+                if uri in self._keys or uri in self._inflight:
+                    continue
+
+            self._prefetcher.submit(self._prefetch_one, uri)
+
+    def _prefetch_one(self, uri: str) -> None:
+        try:
+            self.get(uri)
+        except Exception as e:
+            logging.warning(f"Prefetch of key '{uri}' failed: {e}")
+
+
+# Shared by every rendition downloaded by the process
+key_cache = KeyCache()
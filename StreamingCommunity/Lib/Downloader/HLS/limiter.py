@@ -0,0 +1,107 @@
+# 18.10.26
+
+import time
+import threading
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+
+# Internal utilities
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Config
+RATE_LIMIT = config_manager.get_float('REQUESTS', 'rate_limit')
+RATE_BURST = config_manager.get_int('REQUESTS', 'rate_burst')
+
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        """
+        Token bucket refilled at a constant rate.
+
+        Parameters:
+            - rate (float): Tokens added per second.
+            - burst (int): Maximum tokens stored, requests that can start back to back.
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, going in debt if the bucket is empty.
+
+        Returns:
+            float: Seconds the caller must wait before starting the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+
+
+class RateLimiter:
+    def __init__(self, rate: float = RATE_LIMIT, burst: int = RATE_BURST):
+        """
+        Per host and per proxy request rate limiter.
+
+        Parameters:
+            - rate (float): Requests per second allowed for each host/proxy pair, 0 to disable.
+            - burst (int): Requests that can start together before the rate applies.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.n_delayed = 0
+        self.total_wait = 0.0
+
+    def _get_bucket(self, key: Tuple[str, str]) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(self.rate, self.burst))
+        return bucket
+
+    def reserve(self, url: str, proxy=None) -> float:
+        """
+        Reserve a request start for url.
+
+        Parameters:
+            - url (str): The URL that will be requested.
+            - proxy: The proxy used for the request, if any.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+        if self.rate <= 0:
+            return 0
+
+        wait = self._get_bucket((urlparse(url).netloc, str(proxy))).reserve()
+        if wait > 0:
+            with self._lock:
+                self.n_delayed += 1
+                self.total_wait += wait
+
+        return wait
+
+    def wait(self, url: str, proxy=None) -> None:
+        """Block until a request to url can start."""
+        wait = self.reserve(url, proxy)
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Shared by every segment pool of the process, concurrent tracks and episodes hitting one CDN split its rate
+rate_limiter = RateLimiter()
@@ -0,0 +1,146 @@
+# 18.10.26
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+# External libraries
+import httpx
+
+
+# Internal utilities
+from StreamingCommunity.Lib.M3U8 import M3U8_Parser
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Config
+PLAYLIST_CACHE_TTL = config_manager.get_int('M3U8_PARSER', 'playlist_cache_ttl')
+
+
+# Variable
+PLAYLIST_CACHE_SIZE = 64
+
+
+
+class _PlaylistEntry:
+    def __init__(self, text: str, etag: Optional[str], last_modified: Optional[str]):
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = time.monotonic()
+        self.parser: Optional[M3U8_Parser] = None
+
+        # Media playlists without EXT-X-ENDLIST grow, they are never served without asking the server
+        self.is_live = "#EXTINF" in text and "#EXT-X-ENDLIST" not in text
+
+
+class PlaylistCache:
+    def __init__(self, ttl: int = PLAYLIST_CACHE_TTL, max_entries: int = PLAYLIST_CACHE_SIZE):
+        """
+        Thread-safe LRU cache of playlists keyed by absolute url.
+        Entries are served as is for ttl seconds, then revalidated with ETag/Last-Modified.
+
+        Parameters:
+            - ttl (int): Seconds a playlist is used without asking the server, 0 disables the cache.
+            - max_entries (int): Maximum number of playlists kept.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _PlaylistEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Stats
+        self.n_hit = 0
+        self.n_revalidated = 0
+        self.n_fetch = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _get_entry(self, url: str) -> Optional[_PlaylistEntry]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def _put_entry(self, url: str, entry: _PlaylistEntry) -> None:
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def fetch(self, url: str, client: httpx.Client) -> str:
+        """
+        Return the playlist text at url, downloading it only if it is missing or changed.
+
+        Parameters:
+            - url (str): Absolute url of the playlist.
+            - client (httpx.Client): Client used for the request.
+        """
+        if not self.enabled:
+            response = client.get(url)
+            response.raise_for_status()
+            return response.text
+
+        entry = self._get_entry(url)
+        if entry is not None and not entry.is_live and time.monotonic() - entry.fetched_at < self.ttl:
+            self.n_hit += 1
+            return entry.text
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+
+            # Last-Modified has a one second resolution, too coarse for a live playlist
+            if entry.last_modified and not entry.is_live:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        response = client.get(url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            logging.info(f"Playlist not modified: {url}")
+            entry.fetched_at = time.monotonic()
+            self.n_revalidated += 1
+            return entry.text
+
+        response.raise_for_status()
+        self.n_fetch += 1
+        self._put_entry(url, _PlaylistEntry(response.text, response.headers.get('ETag'), response.headers.get('Last-Modified')))
+        return response.text
+
+    def get_parser(self, url: str, text: str) -> M3U8_Parser:
+        """
+        Return the parsed playlist, parsing it only once while its text does not change.
+        The returned parser is shared and must be treated as read only.
+
+        Parameters:
+            - url (str): Absolute url of the playlist.
+            - text (str): Content of the playlist.
+        """
+        entry = self._get_entry(url) if self.enabled else None
+        if entry is not None and entry.text == text and entry.parser is not None:
+            return entry.parser
+
+        parser = M3U8_Parser()
+        parser.parse_data(uri=url, raw_content=text)
+
+        if entry is not None and entry.text == text:
+            entry.parser = parser
+        return parser
+
+    def get_stats(self) -> dict:
+        return {
+            'hit': self.n_hit,
+            'revalidated': self.n_revalidated,
+            'fetch': self.n_fetch
+        }
+
+
+# Shared by every download of the process
+playlist_cache = PlaylistCache()
@@ -0,0 +1,252 @@
+# 18.10.26
+
+import time
+import asyncio
+import logging
+import threading
+import importlib.util
+from collections import deque
+from typing import Deque, Dict, List
+
+
+# External libraries
+import httpx
+
+
+# Internal utilities
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Logic class
+from .limiter import rate_limiter
+
+
+# Config
+MAX_TIMEOOUT = config_manager.get_int("REQUESTS", "timeout")
+MAX_CONNECTIONS = config_manager.get_int("REQUESTS", "max_connections")
+KEEPALIVE_EXPIRY = config_manager.get_float("REQUESTS", "keepalive_expiry")
+USE_HTTP2 = config_manager.get_bool("REQUESTS", "use_http2")
+
+
+# Check if h2 module is installed
+h2_installed = importlib.util.find_spec("h2") is not None
+if USE_HTTP2 and not h2_installed:
+    logging.warning("HTTP/2 requested but 'h2' is not installed, fallback to HTTP/1.1")
+
+
+# Variable
+LATENCY_WINDOW = 2000
+
+
+
+class ClientPool:
+    def __init__(self, headers: Dict[str, str], proxies: List = None, max_in_flight: int = 0):
+        """
+        Thread-safe pool of keep-alive httpx clients, one client per proxy.
+
+        Parameters:
+            - headers (dict): Headers shared by every request of the pool.
+            - proxies (list): Optional list of proxies, each one gets its own connection pool.
+            - max_in_flight (int): Requests the workers can have in flight, the pool never has fewer connections.
+        """
+        self.headers = headers
+        self.proxies = proxies or []
+        self.max_in_flight = max_in_flight
+        self.http2 = USE_HTTP2 and h2_installed
+
+        # A request waiting for a free connection would end in a PoolTimeout
+        max_connections = max(MAX_CONNECTIONS, max_in_flight)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        )
+
+        self._clients: Dict[int, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.n_requests = 0
+        self.n_delayed = 0
+        self.total_wait = 0.0
+        self.n_connections = 0
+        self.n_tls_handshakes = 0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def _trace(self, event_name: str, info: dict) -> None:
+        """Count new tcp connections and tls handshakes reported by httpcore."""
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.n_connections += 1
+
+        elif event_name == "connection.start_tls.complete":
+            with self._lock:
+                self.n_tls_handshakes += 1
+
+    def _get_client_params(self, proxy=None) -> Dict:
+        client_params = {
+            'headers': self.headers,
+            'timeout': MAX_TIMEOOUT,
+            'follow_redirects': True,
+            'http2': self.http2,
+            'limits': self.limits
+        }
+
+        if proxy is not None:
+            client_params['proxies'] = proxy
+
+        return client_params
+
+    def _create_client(self, proxy=None) -> httpx.Client:
+        return httpx.Client(**self._get_client_params(proxy))
+
+    def _get_slot(self, index: int = None) -> int:
+        return index % len(self.proxies) if (self.proxies and index is not None) else -1
+
+    def _get_proxy(self, index: int = None):
+        slot = self._get_slot(index)
+        return self.proxies[slot] if slot >= 0 else None
+
+    def get_client(self, index: int = None) -> httpx.Client:
+        """
+        Return the shared client for a segment index, creating it on first use.
+
+        Parameters:
+            - index (int): Segment index, used to spread requests over the proxies.
+        """
+        slot = self._get_slot(index)
+
+        client = self._clients.get(slot)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(slot)
+
+                if client is None:
+                    client = self._create_client(self.proxies[slot] if slot >= 0 else None)
+                    self._clients[slot] = client
+
+        return client
+
+    def _reserve_turn(self, url: str, index: int = None) -> float:
+        """Take the next request start of the host from the shared rate limiter."""
+        wait = rate_limiter.reserve(url, self._get_proxy(index))
+        if wait > 0:
+            with self._lock:
+                self.n_delayed += 1
+                self.total_wait += wait
+
+        return wait
+
+    def wait_turn(self, url: str, index: int = None) -> None:
+        """
+        Block until the shared rate limiter lets a request to url start, call it before taking a worker slot.
+
+        Parameters:
+            - url (str): The URL that will be requested.
+            - index (int): Segment index, used to select the proxy.
+        """
+        wait = self._reserve_turn(url, index)
+        if wait > 0:
+            time.sleep(wait)
+
+    def get(self, url: str, index: int = None, headers: Dict = None) -> httpx.Response:
+        """
+        Perform a GET using the pooled client and record its latency, the rate limit is left to wait_turn.
+
+        Parameters:
+            - url (str): The URL to request.
+            - index (int): Segment index, used to select the proxy.
+            - headers (dict): Extra headers of the request, e.g. Range.
+        """
+        client = self.get_client(index)
+
+        start_time = time.time()
+        response = client.get(url, headers=headers, extensions={"trace": self._trace})
+        elapsed = time.time() - start_time
+
+        with self._lock:
+            self.n_requests += 1
+            self.latencies.append(elapsed)
+
+        return response
+
+    def get_stats(self) -> Dict:
+        """Summary of requests, handshakes, latency of the last LATENCY_WINDOW requests and rate limiting."""
+        with self._lock:
+            latencies = sorted(self.latencies)
+
+        n = len(latencies)
+        return {
+            'requests': self.n_requests,
+            'connections': self.n_connections,
+            'tlsHandshakes': self.n_tls_handshakes,
+            'http2': self.http2,
+            'avgLatency': round(sum(latencies) / n, 4) if n else 0,
+            'p95Latency': round(latencies[min(n - 1, int(n * 0.95))], 4) if n else 0,
+            'rateLimited': self.n_delayed,
+            'rateWait': round(self.total_wait, 2)
+        }
+
+    def close(self) -> None:
+        """Close every client of the pool."""
+        with self._lock:
+            for client in self._clients.values():
+                try:
+                    client.close()
+                except Exception as e:
+                    logging.error(f"Error closing client: {e}")
+
+            self._clients.clear()
+
+
+class AsyncClientPool(ClientPool):
+    """
+    Same as ClientPool but backed by httpx.AsyncClient, must be used and closed inside one event loop.
+    """
+    async def _atrace(self, event_name: str, info: dict) -> None:
+        self._trace(event_name, info)
+
+    def _create_client(self, proxy=None) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**self._get_client_params(proxy))
+
+    async def wait_turn(self, url: str, index: int = None) -> None:
+        """Same as ClientPool.wait_turn without blocking the event loop."""
+        wait = self._reserve_turn(url, index)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def get(self, url: str, index: int = None, headers: Dict = None) -> httpx.Response:
+        """
+        Perform a GET using the pooled async client and record its latency, the rate limit is left to wait_turn.
+
+        Parameters:
+            - url (str): The URL to request.
+            - index (int): Segment index, used to select the proxy.
+            - headers (dict): Extra headers of the request, e.g. Range.
+        """
+        client = self.get_client(index)
+
+        start_time = time.time()
+        response = await client.get(url, headers=headers, extensions={"trace": self._atrace})
+        elapsed = time.time() - start_time
+
+        with self._lock:
+            self.n_requests += 1
+            self.latencies.append(elapsed)
+
+        return response
+
+    async def aclose(self) -> None:
+        """Close every async client of the pool."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logging.error(f"Error closing client: {e}")
+
+    def close(self) -> None:
+        """Clients are closed by aclose() inside the event loop."""
+        self._clients.clear()
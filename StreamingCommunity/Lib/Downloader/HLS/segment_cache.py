@@ -0,0 +1,149 @@
+# 18.10.26
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+# Internal utilities
+from StreamingCommunity.Util.os import compute_sha1_hash
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Config
+SEGMENT_CACHE = config_manager.get_bool('M3U8_DOWNLOAD', 'segment_cache')
+SEGMENT_CACHE_PATH = config_manager.get('M3U8_DOWNLOAD', 'segment_cache_path')
+SEGMENT_CACHE_MB = config_manager.get_int('M3U8_DOWNLOAD', 'segment_cache_mb')
+
+
+
+class SegmentCache:
+    def __init__(self, path: str, max_bytes: int, enabled: bool = True):
+        """
+        On disk content-addressed cache of downloaded segments, evicted least recently used first.
+
+        Parameters:
+            - path (str): Folder of the cache.
+            - max_bytes (int): Maximum size of the cached segments.
+            - enabled (bool): When False every lookup misses and nothing is written.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = enabled and max_bytes > 0
+        self.total_bytes = 0
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    @staticmethod
+    def make_key(url: str, key_uri: Optional[str] = None, byte_range: Optional[Tuple[int, int]] = None) -> str:
+        """
+        Key of a segment: its absolute url, the key that encrypts it and its byte range.
+        """
+        return compute_sha1_hash(f"{url}|{key_uri or ''}|{byte_range or ''}")
+
+    def _get_file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key)
+
+    def _load(self) -> None:
+        """
+        Index the segments already on disk, oldest access first. Called once, on first use.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+
+        files = []
+        for root, _, names in os.walk(self.path):
+            for name in names:
+                if name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                    files.append((stat.st_mtime, name, stat.st_size))
+                except OSError:
+                    pass
+
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self.total_bytes += size
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Content of a cached segment, None on miss.
+
+        Parameters:
+            - key (str): Key returned by make_key.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._load()
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+
+        file_path = self._get_file(key)
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+
+            # mtime keeps the access order across runs
+            os.utime(file_path)
+            return content
+
+        except OSError:
+            with self._lock:
+                self.total_bytes -= self._entries.pop(key, 0)
+            return None
+
+    def put(self, key: str, content: bytes) -> None:
+        """
+        Store a segment, evicting the least recently used ones over the size limit.
+
+        Parameters:
+            - key (str): Key returned by make_key.
+            - content (bytes): Raw content of the segment.
+        """
+        if not self.enabled or len(content) > self.max_bytes:
+            return
+
+        # Index the disk first, the new file must not be counted twice
+        with self._lock:
+            self._load()
+
+        file_path = self._get_file(key)
+        tmp_path = f"{file_path}.{threading.get_ident()}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, file_path)
+
+        except OSError as e:
+            logging.warning(f"Cant write segment cache {file_path}: {e}")
+            return
+
+        evicted = []
+        with self._lock:
+            self.total_bytes += len(content) - self._entries.pop(key, 0)
+            self._entries[key] = len(content)
+
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, size = self._entries.popitem(last=False)
+                self.total_bytes -= size
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            try:
+                os.remove(self._get_file(old_key))
+            except OSError:
+                pass
+
+
+# Shared by every download of the process
+segment_cache = SegmentCache(SEGMENT_CACHE_PATH, SEGMENT_CACHE_MB * 1024 * 1024, SEGMENT_CACHE)
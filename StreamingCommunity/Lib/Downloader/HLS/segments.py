@@ -3,15 +3,16 @@
 import os
 import sys
 import time
+import errno
 import queue
 import signal
 import logging
-import binascii
 import threading
+from contextlib import nullcontext
 from queue import PriorityQueue
 from urllib.parse import urljoin, urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple
 
 
 # External libraries
@@ -24,34 +25,51 @@ from StreamingCommunity.Util.color import Colors
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util.headers import get_headers, random_headers
 from StreamingCommunity.Util._jsonConfig import config_manager
-from StreamingCommunity.Util.os import os_manager
+from StreamingCommunity.Util.os import os_manager, compute_sha1_hash
 
 
 # Logic class
 from ...M3U8 import (
     M3U8_Decryption,
     M3U8_Ts_Estimator,
+    sequence_to_iv,
     M3U8_Parser,
     M3U8_UrlFix
 )
 from .proxyes import main_test_proxy
+from .pool import ClientPool
+from .buffer import SegmentBuffer, SpilledSegment
+from .journal import SegmentJournal, INIT_INDEX
+from .controller import WorkerBudget, WorkerController
+from .keys import key_cache, KEY_PREFETCH
+from .playlist_cache import playlist_cache
+from .segment_cache import segment_cache
 
 # Config
-TQDM_DELAY_WORKER = config_manager.get_float('M3U8_DOWNLOAD', 'tqdm_delay')
 TQDM_USE_LARGE_BAR = not ("android" in sys.platform or "ios" in sys.platform)
 REQUEST_MAX_RETRY = config_manager.get_int('REQUESTS', 'max_retry')
 REQUEST_VERIFY = False
 THERE_IS_PROXY_LIST = os_manager.check_file("list_proxy.txt")
-PROXY_START_MIN = config_manager.get_float('REQUESTS', 'proxy_start_min')
-PROXY_START_MAX = config_manager.get_float('REQUESTS', 'proxy_start_max')
 DEFAULT_VIDEO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_video_workser')
 DEFAULT_AUDIO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_audio_workser')
+ADAPTIVE_WORKERS = config_manager.get_bool('M3U8_DOWNLOAD', 'adaptive_workers')
+MAX_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'max_workers')
+DECRYPT_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'decrypt_workers')
+DECRYPT_USE_PROCESSES = config_manager.get_bool('M3U8_DOWNLOAD', 'decrypt_use_processes')
 MAX_TIMEOOUT = config_manager.get_int("REQUESTS", "timeout")
+REORDER_BUFFER_MB = config_manager.get_int('M3U8_DOWNLOAD', 'reorder_buffer_mb')
+REORDER_SPILL = config_manager.get_bool('M3U8_DOWNLOAD', 'reorder_spill_to_disk')
+BYTERANGE_COALESCE_MB = config_manager.get_int('M3U8_DOWNLOAD', 'byterange_coalesce_mb')
+LIVE_FOLLOW = config_manager.get_bool('M3U8_DOWNLOAD', 'live_follow')
+
+
+# Variable
+LIVE_IDLE_TARGETS = 10
 
 
 
 class M3U8_Segments:
-    def __init__(self, url: str, tmp_folder: str, is_index_url: bool = True):
+    def __init__(self, url: str, tmp_folder: str, is_index_url: bool = True, worker_budget: WorkerBudget = None, bar_position: int = None, output_pipe: str = None):
         """
         Initializes the M3U8_Segments object.
 
@@ -59,23 +77,58 @@ class M3U8_Segments:
             - url (str): The URL of the M3U8 playlist.
             - tmp_folder (str): The temporary folder to store downloaded segments.
             - is_index_url (bool): Flag indicating if `m3u8_index` is a URL (default True).
+            - worker_budget (WorkerBudget): Optional budget of requests in flight shared with other downloads.
+            - bar_position (int): Line of the progress bar when more streams are downloaded together.
+            - output_pipe (str): Named pipe read by FFmpeg, written instead of 0.ts (no resume).
         """
         self.url = url
         self.tmp_folder = tmp_folder
         self.is_index_url = is_index_url
+        self.worker_budget = worker_budget
+        self.bar_position = bar_position
         self.expected_real_time = None
-        self.tmp_file_path = os.path.join(self.tmp_folder, "0.ts")
+        self.is_pipe = output_pipe is not None
+        self.tmp_file_path = output_pipe if self.is_pipe else os.path.join(self.tmp_folder, "0.ts")
         os.makedirs(self.tmp_folder, exist_ok=True)
 
         # Util class
-        self.decryption: M3U8_Decryption = None 
+        self.is_encrypted = False
+        self.segment_keys: List[Dict] = []
+        self.segment_ranges: List[Tuple[int, int]] = []
+        self.init_segment: Dict = None
+        self.init_content: bytes = None
+        self.segment_sequences: List[int] = []
+        self.decryptions: Dict[Tuple, M3U8_Decryption] = {}
+        self.key_order: List[str] = []
+        self.key_positions: Dict[str, int] = {}
+        self.decrypt_pool: Executor = None
+        self.media_sequence = 0
+        self.target_duration = 0
+        self.is_live = False
+        self.last_sequence = -1
+        self.live_has_new = True
+        self.live_idle_since = 0.0
+        self.client_pool: ClientPool = None
+        self.worker_controller: WorkerController = None
         self.class_ts_estimator = M3U8_Ts_Estimator(0, self) 
         self.class_url_fixer = M3U8_UrlFix(url)
 
         # Sync
+        self.pending_decrypts = 0
+        self.pending_decrypts_cond = threading.Condition()
         self.queue = PriorityQueue()
         self.stop_event = threading.Event()
         self.downloaded_segments = set()
+        self.segment_buffer = SegmentBuffer(
+            spill_path=os.path.join(self.tmp_folder, "reorder.spill"),
+            max_bytes=REORDER_BUFFER_MB * 1024 * 1024,
+            use_spill=REORDER_SPILL
+        )
+        self.journal = SegmentJournal(self.tmp_folder)
+        self.journal_entries = []
+        self.playlist_hash = None
+        self.resume_index = 0
+        self.resume_offset = 0
         self.base_timeout = 0.5
         self.current_timeout = 3.0
 
@@ -91,35 +144,62 @@ class M3U8_Segments:
         self.active_retries = 0 
         self.active_retries_lock = threading.Lock()
 
-    def __get_key__(self, m3u8_parser: M3U8_Parser) -> bytes:
-        key_uri = urljoin(self.url, m3u8_parser.keys.get('uri'))
-        parsed_url = urlparse(key_uri)
+        # Segment cache
+        self.cache_hit = 0
+        self.cache_miss = 0
+        self.cache_lock = threading.Lock()
+
+    def _setup_keys(self, m3u8_parser: M3U8_Parser) -> None:
+        """
+        Map every segment to its key, keys can rotate along the playlist.
+        """
+        self.segment_keys = [
+            dict(key, uri=urljoin(self.url, key['uri'])) if key else None
+            for key in m3u8_parser.segment_keys
+        ]
+        self.is_encrypted = any(self.segment_keys)
+        if not self.is_encrypted:
+            return
+
+        # Distinct keys in playlist order, used to prefetch the next ones
+        self.key_order = list(dict.fromkeys(key['uri'] for key in self.segment_keys if key))
+        self.key_positions = {uri: position for position, uri in enumerate(self.key_order)}
+
+        parsed_url = urlparse(self.key_order[0])
         self.key_base_url = f"{parsed_url.scheme}://{parsed_url.netloc}/"
-        
-        try:
-            client_params = {'headers': {'User-Agent': get_headers()}, 'timeout': MAX_TIMEOOUT}
-            response = httpx.get(url=key_uri, **client_params)
-            response.raise_for_status()
 
-            hex_content = binascii.hexlify(response.content).decode('utf-8')
-            return bytes.fromhex(hex_content)
-            
-        except Exception as e:
-            raise Exception(f"Failed to fetch key: {e}")
+        # First key fetched now to fail fast
+        key_cache.get(self.key_order[0])
+        key_cache.prefetch(self.key_order[1:1 + KEY_PREFETCH])
+
+    def _get_decryption(self, index: int):
+        """
+        Decryption of a segment, None if it is not encrypted.
+        """
+        key = self.segment_keys[index] if index < len(self.segment_keys) else None
+        if key is None:
+            return None
+
+        decryption_id = (key['uri'], key['iv'], key['method'])
+        decryption = self.decryptions.get(decryption_id)
+
+        if decryption is None:
+            decryption = M3U8_Decryption(key_cache.get(key['uri']), key['iv'], key['method'])
+            self.decryptions[decryption_id] = decryption
+
+            # A new key is in use, fetch the next ones before their segments arrive
+            position = self.key_positions[key['uri']]
+            key_cache.prefetch(self.key_order[position + 1:position + 1 + KEY_PREFETCH])
+
+        return decryption
     
     def parse_data(self, m3u8_content: str) -> None:
-        m3u8_parser = M3U8_Parser()
-        m3u8_parser.parse_data(uri=self.url, raw_content=m3u8_content)
+        m3u8_parser = playlist_cache.get_parser(self.url, m3u8_content)
 
         self.expected_real_time_s = m3u8_parser.duration
+        self.media_sequence = m3u8_parser.media_sequence
 
-        if m3u8_parser.keys:
-            key = self.__get_key__(m3u8_parser)    
-            self.decryption = M3U8_Decryption(
-                key, 
-                m3u8_parser.keys.get('iv'), 
-                m3u8_parser.keys.get('method')
-            )
+        self._setup_keys(m3u8_parser)
 
         self.segments = [
             self.class_url_fixer.generate_full_url(seg)
@@ -128,6 +208,17 @@ class M3U8_Segments:
         ]
         self.class_ts_estimator.total_segments = len(self.segments)
 
+        # Byte ranges of a single resource and fMP4 init section
+        self.segment_ranges = list(m3u8_parser.segment_ranges) or [None] * len(self.segments)
+        if m3u8_parser.init_segment is not None:
+            self.init_segment = dict(m3u8_parser.init_segment, uri=urljoin(self.url, m3u8_parser.init_segment['uri']))
+
+        # Media sequence of every segment, a live playlist is followed from the last one seen
+        self.segment_sequences = list(range(self.media_sequence, self.media_sequence + len(self.segments)))
+        self.last_sequence = self.media_sequence + len(self.segments) - 1
+        self.target_duration = m3u8_parser.target_duration
+        self.is_live = LIVE_FOLLOW and not m3u8_parser.is_endlist
+
         # Proxy
         if THERE_IS_PROXY_LIST:
             console.log("[red]Start validation proxy.")
@@ -137,50 +228,485 @@ class M3U8_Segments:
             if len(self.valid_proxy) == 0:
                 sys.exit(0)
 
+        # Nothing is left on disk to resume when segments go straight to FFmpeg
+        if not self.is_pipe:
+            self._load_journal()
+
+        # Shared keep-alive clients, headers are generated once per stream
+        self.client_pool = ClientPool(
+            headers=random_headers(self.key_base_url) if hasattr(self, 'key_base_url') else {'User-Agent': get_headers()},
+            proxies=self.valid_proxy if THERE_IS_PROXY_LIST else None,
+            max_in_flight=MAX_WORKERS
+        )
+
+    def _load_journal(self) -> None:
+        """
+        Resume from the segments already written to 0.ts by a previous run on the same playlist.
+        """
+        # Query strings usually carry per-session tokens, hash only the segment paths
+        self.playlist_hash = compute_sha1_hash("\n".join(seg.split("?")[0] for seg in self.segments))
+        written, failed = self.journal.load(self.playlist_hash)
+        file_size = os.path.getsize(self.tmp_file_path) if os.path.exists(self.tmp_file_path) else 0
+
+        # Keep the longest prefix of segments found at the expected offset, a failed segment is downloaded again with the ones after it
+        index, offset = 0, 0
+        self.journal_entries = []
+
+        # Segments of fMP4 tracks start after the init section
+        if self.init_segment is not None:
+            entry = written.get(INIT_INDEX)
+            if entry is None or entry[0] != 0 or entry[1] > file_size:
+                return
+
+            self.journal_entries.append((INIT_INDEX, 0, entry[1]))
+            offset = entry[1]
+
+        while index < len(self.segments):
+            entry = written.get(index)
+            if entry is None or entry[0] != offset or offset + entry[1] > file_size:
+                break
+
+            self.journal_entries.append((index, offset, entry[1]))
+            offset += entry[1]
+            index += 1
+
+        # Nothing to resume, the init section is written again with the first segment
+        if index == 0:
+            self.journal_entries = []
+            return
+
+        self.resume_index, self.resume_offset = index, offset
+        if index in failed:
+            logging.info(f"Segment {index} failed in the previous run, retry it")
+
+        self.downloaded_segments.update(range(index))
+        console.log(f"[cyan]Resume from segment: [red]{index}[white]/[red]{len(self.segments)}")
+
+    def _append_live_segments(self, m3u8_parser: M3U8_Parser) -> List[int]:
+        """
+        Append the segments of a reloaded live playlist with a media sequence greater than the last one seen.
+
+        Returns:
+            list: Indexes of the new segments.
+        """
+        first_new = self.last_sequence + 1 - m3u8_parser.media_sequence
+        if first_new < 0:
+            logging.warning(f"Live playlist moved past {-first_new} segments before they were seen")
+            first_new = 0
+
+        new_indexes = []
+        for position in range(first_new, len(m3u8_parser.segments)):
+            segment = m3u8_parser.segments[position]
+            key = m3u8_parser.segment_keys[position]
+
+            if key:
+                key = dict(key, uri=urljoin(self.url, key['uri']))
+                if key['uri'] not in self.key_positions:
+                    self.key_positions[key['uri']] = len(self.key_order)
+                    self.key_order.append(key['uri'])
+
+            new_indexes.append(len(self.segments))
+            self.segment_keys.append(key)
+            self.segment_ranges.append(m3u8_parser.segment_ranges[position] if m3u8_parser.segment_ranges else None)
+            self.segment_sequences.append(m3u8_parser.media_sequence + position)
+            self.segments.append(self.class_url_fixer.generate_full_url(segment) if "http" not in segment else segment)
+
+        self.last_sequence = max(self.last_sequence, m3u8_parser.media_sequence + len(m3u8_parser.segments) - 1)
+        return new_indexes
+
+    def _poll_live_playlist(self, progress_bar: tqdm) -> List[int]:
+        """
+        Wait for the next reload of a live playlist and append its new segments.
+        Following stops on EXT-X-ENDLIST or when the playlist does not grow for LIVE_IDLE_TARGETS target durations.
+
+        Returns:
+            list: Indexes of the new segments, empty if there are none or the download was stopped.
+        """
+        # Reload after a target duration, half of it when the last reload had nothing new
+        wait = self.target_duration if self.live_has_new else self.target_duration / 2
+        if self.interrupt_flag.wait(max(1, wait)):
+            return []
+
+        new_indexes = []
+        try:
+            client_params = {'headers': {'User-Agent': get_headers()}, 'timeout': MAX_TIMEOOUT}
+            with httpx.Client(**client_params) as client:
+                content = playlist_cache.fetch(self.url, client)
+
+            m3u8_parser = playlist_cache.get_parser(self.url, content)
+            new_indexes = self._append_live_segments(m3u8_parser)
+            self.target_duration = m3u8_parser.target_duration or self.target_duration
+
+            if m3u8_parser.is_endlist:
+                logging.info("Live playlist ended")
+                self.is_live = False
+
+        except Exception as e:
+            logging.warning(f"Reload of live playlist failed: {e}")
+
+        self.live_has_new = bool(new_indexes)
+        if new_indexes:
+            self.live_idle_since = time.monotonic()
+            self.class_ts_estimator.total_segments = len(self.segments)
+            progress_bar.total = len(self.segments)
+            progress_bar.refresh()
+
+        elif time.monotonic() - self.live_idle_since > LIVE_IDLE_TARGETS * max(1, self.target_duration):
+            console.log("[red]Live playlist stopped growing, stop following it.")
+            self.is_live = False
+
+        return new_indexes
+
+    def _start_live(self) -> None:
+        if self.is_live:
+            console.log(f"[cyan]Following live playlist, reload every [red]{self.target_duration}[cyan] s")
+            self.live_idle_since = time.monotonic()
+
     def get_info(self) -> None:
         if self.is_index_url:
             try:
                 client_params = {'headers': {'User-Agent': get_headers()}, 'timeout': MAX_TIMEOOUT}
-                response = httpx.get(self.url, **client_params)
-                response.raise_for_status()
+                with httpx.Client(**client_params) as client:
+                    content = playlist_cache.fetch(self.url, client)
                 
-                self.parse_data(response.text)
+                self.parse_data(content)
                 with open(os.path.join(self.tmp_folder, "playlist.m3u8"), "w") as f:
-                    f.write(response.text)
+                    f.write(content)
                     
             except Exception as e:
                 raise RuntimeError(f"M3U8 info retrieval failed: {e}")
     
+    def interrupt(self) -> None:
+        """
+        Stop the download gracefully.
+        """
+        if not self.interrupt_flag.is_set():
+            console.log("\n[red] Stopping download gracefully...")
+            self.download_interrupted = True
+            self._stop_workers()
+
+    def _stop_workers(self) -> None:
+        """
+        Stop downloader and writer threads, waking up the workers waiting for a slot.
+        """
+        self.interrupt_flag.set()   # Interrupt the download process
+        self.stop_event.set()       # Trigger the stopping event for all threads
+        self.segment_buffer.stop()  # Wake up producers waiting for the reorder window
+
+        if self.worker_controller is not None:
+            self.worker_controller.stop()
+
     def setup_interrupt_handler(self):
         """
         Set up a signal handler for graceful interruption.
         """
         def interrupt_handler(signum, frame):
-            if not self.interrupt_flag.is_set():
-                console.log("\n[red] Stopping download gracefully...")
-                self.interrupt_flag.set()
-                self.download_interrupted = True
-                self.stop_event.set()
+            self.interrupt()
 
         if threading.current_thread() is threading.main_thread():
             signal.signal(signal.SIGINT, interrupt_handler)
         else:
-            print("Signal handler must be set in the main thread")
-
-    def _get_http_client(self, index: int = None):
-        client_params = {
-            'headers': random_headers(self.key_base_url) if hasattr(self, 'key_base_url') else {'User-Agent': get_headers()},
-            'timeout': MAX_TIMEOOUT,
-            'follow_redirects': True,
-            'http2': False
-        }
-        
-        if THERE_IS_PROXY_LIST and index is not None and hasattr(self, 'valid_proxy'):
-            client_params['proxies'] = self.valid_proxy[index % len(self.valid_proxy)]
+            logging.info("Signal handler must be set in the main thread, interrupt() is left to the caller")
+
+    def _get_segment_iv(self, index: int, decryption: M3U8_Decryption):
+        """
+        IV of a segment: the key IV if present, else its media sequence number.
+        """
+        if decryption.iv:
+            return None
+        return sequence_to_iv(self.segment_sequences[index])
+
+    def _decrypt_failed(self, index: int, error: Exception) -> None:
+        logging.error(f"Decryption failed for segment {index}: {str(error)}")
+        self._stop_workers()
+
+    def _decrypt_segment(self, index: int, segment_content: bytes):
+        """
+        Decrypts a downloaded segment if the stream is encrypted.
+
+        Returns:
+            bytes: The decrypted content, None if decryption failed and the download has been stopped.
+        """
+        try:
+            decryption = self._get_decryption(index)
+            if decryption is None:
+                return segment_content
+            
+            return decryption.decrypt(segment_content, self._get_segment_iv(index, decryption))
+            
+        except Exception as e:
+            self._decrypt_failed(index, e)
+            return None
+
+    def _create_decrypt_pool(self) -> Executor:
+        """
+        Pool decrypting the segments, so network workers go back to fetching right away.
+        """
+        if not self.is_encrypted or DECRYPT_WORKERS <= 0:
+            return None
+
+        if DECRYPT_USE_PROCESSES:
+            return ProcessPoolExecutor(max_workers=DECRYPT_WORKERS)
+        return ThreadPoolExecutor(max_workers=DECRYPT_WORKERS, thread_name_prefix="decrypt")
+
+    def _submit_decrypt(self, index: int, decryption: M3U8_Decryption, segment_content: bytes, duration: float, progress_bar: tqdm) -> None:
+        """
+        Reserve room in the reorder window and hand a segment to the decryption pool.
+        Room is reserved before decryption, so segments waiting for the pool are bounded too.
+        """
+        content_size = len(segment_content)
+        in_memory = self.segment_buffer.acquire(index, content_size)
+
+        with self.pending_decrypts_cond:
+            self.pending_decrypts += 1
+
+        future = self.decrypt_pool.submit(decryption.decrypt, segment_content, self._get_segment_iv(index, decryption))
+        future.add_done_callback(lambda f: self._on_decrypted(f, index, content_size, duration, progress_bar, in_memory))
+
+    def _on_decrypted(self, future: Future, index: int, content_size: int, duration: float, progress_bar: tqdm, in_memory: bool) -> None:
+        try:
+            try:
+                segment_content = future.result()
+            except Exception as e:
+                if in_memory:
+                    self.segment_buffer.release(content_size)
+                self._decrypt_failed(index, e)
+                return
+
+            # Padding removed by decryption
+            if in_memory:
+                self.segment_buffer.release(content_size - len(segment_content))
+            self._queue_segment(index, segment_content, content_size, duration, progress_bar, in_memory)
+
+        finally:
+            with self.pending_decrypts_cond:
+                self.pending_decrypts -= 1
+                self.pending_decrypts_cond.notify_all()
+
+    def _wait_decrypts(self) -> None:
+        """Wait for the segments still in the decryption pool."""
+        with self.pending_decrypts_cond:
+            while self.pending_decrypts > 0 and not self.interrupt_flag.is_set():
+                self.pending_decrypts_cond.wait(timeout=1)
+
+    def _queue_segment(self, index: int, segment_content: bytes, content_size: int, duration: float, progress_bar: tqdm, in_memory: bool = None) -> None:
+        """
+        Hands a segment to the writer, waiting for room in the reorder window or spilling it to disk.
+
+        Parameters:
+            - index (int): The index of the segment.
+            - segment_content (bytes): Decrypted content of the segment.
+            - content_size (int): Downloaded size of the segment.
+            - duration (float): Time spent to download the segment, 0 if it comes from the segment cache.
+            - progress_bar (tqdm): Progress counter for tracking download progress.
+            - in_memory (bool): Result of a previous SegmentBuffer.acquire, acquired here if None.
+        """
+        if in_memory is None:
+            in_memory = self.segment_buffer.acquire(index, len(segment_content))
+
+        if not in_memory:
+            segment_content = self.segment_buffer.spill(segment_content)
+
+        # Cached segments say nothing about the network
+        if duration > 0:
+            self.worker_controller.record_success(content_size, duration)
+        self.class_ts_estimator.update_progress_bar(content_size, duration, progress_bar)
+        self.queue.put((index, segment_content))
+        self.downloaded_segments.add(index)  
+        progress_bar.update(1)
+
+    def _process_segment(self, index: int, segment_content: bytes, duration: float, progress_bar: tqdm) -> bool:
+        """
+        Decrypts a downloaded segment and hands it to the writer.
+
+        Parameters:
+            - index (int): The index of the segment.
+            - segment_content (bytes): Raw content of the segment.
+            - duration (float): Time spent to download the segment.
+            - progress_bar (tqdm): Progress counter for tracking download progress.
+
+        Returns:
+            bool: False if decryption failed and the download has been stopped, True if queued or sent to the decryption pool.
+        """
+        if self.decrypt_pool is not None:
+            try:
+                decryption = self._get_decryption(index)
+            except Exception as e:
+                self._decrypt_failed(index, e)
+                return False
+
+            if decryption is not None:
+                self._submit_decrypt(index, decryption, segment_content, duration, progress_bar)
+                return True
+
+        content_size = len(segment_content)
+        segment_content = self._decrypt_segment(index, segment_content)
+        if segment_content is None:
+            return False
+
+        self._queue_segment(index, segment_content, content_size, duration, progress_bar)
+        return True
+
+    def _handle_failed_attempt(self, ts_url: str, index: int, attempt: int, error: Exception, progress_bar: tqdm, backoff_factor: float):
+        """
+        Updates retry counters after a failed attempt.
+
+        Returns:
+            float: Seconds to wait before the next attempt, None if the segment is given up.
+        """
+        logging.info(f"Attempt {attempt + 1} failed for segment {index} - '{ts_url}': {error}")
+        self.worker_controller.record_failure(error)
+
+        if attempt > self.info_maxRetry:
+            self.info_maxRetry = ( attempt + 1 )
+        self.info_nRetry += 1
+
+        if attempt + 1 == REQUEST_MAX_RETRY:
+            console.log(f"[red]Final retry failed for segment: {index}")
+            self.queue.put((index, None))  # Marker for failed segment
+            progress_bar.update(1)
+            self.info_nFailed += 1
+            return None
         
-        return httpx.Client(**client_params)
-                            
-    def download_segment(self, ts_url: str, index: int, progress_bar: tqdm, backoff_factor: float = 1.1) -> None:
+        sleep_time = backoff_factor * (2 ** attempt)
+        logging.info(f"Retrying segment {index} in {sleep_time} seconds...")
+        return sleep_time
+
+    def _get_request_groups(self, indexes) -> List[Tuple[int, int]]:
+        """
+        Group consecutive segments that are adjacent byte ranges of the same resource, so they are fetched by one request.
+
+        Parameters:
+            - indexes (Iterable[int]): Sorted indexes of the segments to download.
+
+        Returns:
+            list: (first index, number of segments) of every request.
+        """
+        max_bytes = BYTERANGE_COALESCE_MB * 1024 * 1024
+        groups = []
+
+        for index in indexes:
+            if groups and max_bytes > 0:
+                first, count = groups[-1]
+                last_range = self.segment_ranges[first + count - 1]
+                segment_range = self.segment_ranges[index]
+
+                if (
+                    index == first + count and segment_range is not None and last_range is not None
+                    and self.segments[index] == self.segments[first]
+                    and segment_range[0] == last_range[0] + last_range[1]
+                    and segment_range[0] + segment_range[1] - self.segment_ranges[first][0] <= max_bytes
+                ):
+                    groups[-1] = (first, count + 1)
+                    continue
+
+            groups.append((index, 1))
+
+        return groups
+
+    def _get_range_headers(self, index: int, count: int = 1) -> Dict:
+        """
+        Range header covering count segments starting from index, None if they are whole resources.
+        """
+        first = self.segment_ranges[index] if self.segment_ranges else None
+        if first is None:
+            return None
+
+        last = self.segment_ranges[index + count - 1]
+        return {'Range': f"bytes={first[0]}-{last[0] + last[1] - 1}"}
+
+    def _split_ranges(self, index: int, count: int, response: httpx.Response) -> List[Tuple[int, bytes]]:
+        """
+        Cut the content of a ranged request in its segments.
+        Servers ignoring the Range header answer 200 with the whole resource, ranges are then taken from its start.
+        """
+        content = response.content
+        first = self.segment_ranges[index] if self.segment_ranges else None
+        if first is None:
+            return [(index, content)]
+
+        base = first[0] if response.status_code == 206 else 0
+        pieces = []
+
+        for segment_index in range(index, index + count):
+            offset, length = self.segment_ranges[segment_index]
+            start = offset - base
+
+            if start < 0 or start + length > len(content):
+                raise ValueError(f"Ranged response too short for segment {segment_index}")
+            pieces.append((segment_index, content[start:start + length]))
+
+        return pieces
+
+    def _get_cache_key(self, index: int) -> str:
+        key = self.segment_keys[index] if index < len(self.segment_keys) else None
+        return segment_cache.make_key(
+            self.segments[index],
+            key['uri'] if key else None,
+            self.segment_ranges[index] if self.segment_ranges else None
+        )
+
+    def _read_cache(self, index: int, count: int = 1) -> List[Tuple[int, bytes]]:
+        """
+        Raw content of count segments from the segment cache.
+
+        Returns:
+            list: (index, content) of every segment, None if any of them is missing.
+        """
+        if not segment_cache.enabled:
+            return None
+
+        pieces = []
+        for segment_index in range(index, index + count):
+            segment_content = segment_cache.get(self._get_cache_key(segment_index))
+            if segment_content is None:
+                return None
+            pieces.append((segment_index, segment_content))
+
+        with self.cache_lock:
+            self.cache_hit += count
+        return pieces
+
+    def _write_cache(self, pieces: List[Tuple[int, bytes]]) -> None:
+        """Store segments fetched from the network, each of them is a cache miss."""
+        if not segment_cache.enabled:
+            return
+
+        for segment_index, segment_content in pieces:
+            segment_cache.put(self._get_cache_key(segment_index), segment_content)
+
+        with self.cache_lock:
+            self.cache_miss += len(pieces)
+
+    def _download_init_segment(self) -> None:
+        """
+        Download the EXT-X-MAP init section, written once at the start of the output.
+        """
+        if self.init_segment is None or self.resume_index > 0:
+            return
+
+        init_range = self.init_segment['range']
+        headers = {'Range': f"bytes={init_range[0]}-{init_range[0] + init_range[1] - 1}"} if init_range else None
+
+        for attempt in range(REQUEST_MAX_RETRY):
+            try:
+                self.client_pool.wait_turn(self.init_segment['uri'])
+                response = self.client_pool.get(self.init_segment['uri'], headers=headers)
+                response.raise_for_status()
+
+                content = response.content
+                if init_range and response.status_code != 206:
+                    content = content[init_range[0]:init_range[0] + init_range[1]]
+
+                self.init_content = content
+                return
+
+            except Exception as e:
+                logging.info(f"Attempt {attempt + 1} failed for init segment '{self.init_segment['uri']}': {e}")
+
+        raise RuntimeError("Failed to download the init segment")
+
+    def download_segment(self, ts_url: str, index: int, progress_bar: tqdm, backoff_factor: float = 1.1, count: int = 1) -> None:
         """
         Downloads a TS segment and adds it to the segment queue with retry logic.
 
@@ -189,91 +715,160 @@ class M3U8_Segments:
             - index (int): The index of the segment.
             - progress_bar (tqdm): Progress counter for tracking download progress.
             - backoff_factor (float): The backoff factor for exponential backoff (default is 1.5 seconds).
+            - count (int): Consecutive byte ranges of ts_url fetched by the same request.
         """       
+        cached = self._read_cache(index, count)
+        if cached is not None:
+            for segment_index, segment_content in cached:
+                if not self._process_segment(segment_index, segment_content, 0, progress_bar):
+                    return
+            return
+
         for attempt in range(REQUEST_MAX_RETRY):
             if self.interrupt_flag.is_set():
                 return
             
             try:
-                with self._get_http_client(index) as client:
-                    start_time = time.time()
-                    response = client.get(ts_url)
-        
-                    # Validate response and content
-                    response.raise_for_status()
-                    segment_content = response.content
-                    content_size = len(segment_content)
-                    duration = time.time() - start_time
-
-                    # Decrypt if needed and verify decrypted content
-                    if self.decryption is not None:
-                        try:
-                            segment_content = self.decryption.decrypt(segment_content)
-                            
-                        except Exception as e:
-                            logging.error(f"Decryption failed for segment {index}: {str(e)}")
-                            self.interrupt_flag.set()   # Interrupt the download process
-                            self.stop_event.set()       # Trigger the stopping event for all threads
-                            break                       # Stop the current task immediately
-
-                    self.class_ts_estimator.update_progress_bar(content_size, duration, progress_bar)
-                    self.queue.put((index, segment_content))
-                    self.downloaded_segments.add(index)  
-                    progress_bar.update(1)
-                    return
+                # Waiting for the rate limiter must not hold a slot other tracks and episodes could use
+                self.client_pool.wait_turn(ts_url, index)
+
+                self.worker_controller.acquire()
+                try:
+                    with self.worker_budget or nullcontext():
+                        response = self.client_pool.get(ts_url, index, headers=self._get_range_headers(index, count))
+                finally:
+                    self.worker_controller.release()
+    
+                # Validate response and content
+                response.raise_for_status()
+
+                # Only the request itself, the waits for a slot would feed the controller its own limit
+                duration = response.elapsed.total_seconds()
+
+                pieces = self._split_ranges(index, count, response)
+                self._write_cache(pieces)
+
+                for segment_index, segment_content in pieces:
+                    if not self._process_segment(segment_index, segment_content, duration / count, progress_bar):
+                        return
+                return
 
             except Exception as e:
-                logging.info(f"Attempt {attempt + 1} failed for segment {index} - '{ts_url}': {e}")
-                
-                if attempt > self.info_maxRetry:
-                    self.info_maxRetry = ( attempt + 1 )
-                self.info_nRetry += 1
-
-                if attempt + 1 == REQUEST_MAX_RETRY:
-                    console.log(f"[red]Final retry failed for segment: {index}")
-                    self.queue.put((index, None))  # Marker for failed segment
-                    progress_bar.update(1)
-                    self.info_nFailed += 1
+
+                # Retry a failed coalesced request as single segments, they are marked failed one by one
+                if count > 1:
+                    logging.info(f"Request of segments {index}-{index + count - 1} failed: {e}, retry them one by one")
+                    self.worker_controller.record_failure(e)
+                    for segment_index in range(index, index + count):
+                        self.download_segment(ts_url, segment_index, progress_bar, backoff_factor)
+                    return
+
+                sleep_time = self._handle_failed_attempt(ts_url, index, attempt, e, progress_bar, backoff_factor)
+                if sleep_time is None:
                     return
                 
                 with self.active_retries_lock:
                     self.active_retries += 1
                 
-                sleep_time = backoff_factor * (2 ** attempt)
-                logging.info(f"Retrying segment {index} in {sleep_time} seconds...")
                 time.sleep(sleep_time)
                 
                 with self.active_retries_lock:
                     self.active_retries -= 1
 
+    def _write_segment(self, f, index: int, segment_content) -> None:
+        """
+        Write a segment to the output file, journal it and free its room in the reorder window.
+        """
+        offset = f.tell() if not self.is_pipe else -1
+
+        if isinstance(segment_content, SpilledSegment):
+            segment_content = self.segment_buffer.read(segment_content)
+            f.write(segment_content)
+        else:
+            f.write(segment_content)
+            self.segment_buffer.release(len(segment_content))
+        f.flush()
+
+        self.journal.record(index, offset, len(segment_content))
+
+    def _skip_segment(self, index: int) -> None:
+        """
+        Journal a failed segment left out of the output file.
+        """
+        self.journal.record_failed(index)
+
+    def _open_output(self):
+        """
+        Open 0.ts, or the pipe once FFmpeg is reading it. Opening a pipe does not block, so an interrupt is never stuck on a dead FFmpeg.
+        """
+        if not self.is_pipe:
+            return open(self.tmp_file_path, 'r+b' if self.resume_index > 0 else 'wb')
+
+        while not self.interrupt_flag.is_set():
+            try:
+                fd = os.open(self.tmp_file_path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as e:
+
+                # No reader yet
+                if e.errno != errno.ENXIO:
+                    raise
+                self.interrupt_flag.wait(0.05)
+                continue
+
+            os.set_blocking(fd, True)
+            return os.fdopen(fd, 'wb')
+
+        raise BrokenPipeError("Interrupted before FFmpeg opened the pipe")
+
     def write_segments_to_file(self):
         """
         Writes segments to file with additional verification.
         """
         buffer = {}
-        expected_index = 0
+        expected_index = self.resume_index
+        self.segment_buffer.advance(expected_index)
+        if not self.is_pipe:
+            self.journal.open(self.playlist_hash, self.journal_entries)
         
-        with open(self.tmp_file_path, 'wb') as f:
-            while not self.stop_event.is_set() or not self.queue.empty():
-                if self.interrupt_flag.is_set():
-                    break
-                
-                try:
-                    index, segment_content = self.queue.get(timeout=self.current_timeout)
+        try:
+            with self._open_output() as f:
 
-                    # Successful queue retrieval: reduce timeout
-                    self.current_timeout = max(self.base_timeout, self.current_timeout / 2)
+                # Drop whatever a previous run wrote after the last journaled segment
+                if self.resume_index > 0:
+                    f.truncate(self.resume_offset)
+                    f.seek(self.resume_offset)
 
-                    # Handle failed segments
-                    if segment_content is None:
-                        if index == expected_index:
-                            expected_index += 1
-                        continue
+                # fMP4 init section goes once before the first segment
+                elif self.init_content:
+                    f.write(self.init_content)
+                    self.journal.record_init(len(self.init_content))
+
+                while not self.stop_event.is_set() or not self.queue.empty():
+                    if self.interrupt_flag.is_set():
+                        break
+                    
+                    try:
+                        index, segment_content = self.queue.get(timeout=self.current_timeout)
+
+                        # Successful queue retrieval: reduce timeout
+                        self.current_timeout = max(self.base_timeout, self.current_timeout / 2)
+
+                        # Drop late duplicates of segments already written or skipped
+                        if index < expected_index:
+                            if isinstance(segment_content, bytes):
+                                self.segment_buffer.release(len(segment_content))
+                            continue
+
+                        # Keep out of order segments (and failed markers) until their turn
+                        if index != expected_index:
+                            buffer[index] = segment_content
+                            continue
 
-                    # Write segment if it's the next expected one
-                    if index == expected_index:
-                        f.write(segment_content)
-                        f.flush()
+                        # Write segment if it's the next expected one, failed segments are skipped
+                        if segment_content is not None:
+                            self._write_segment(f, index, segment_content)
+                        else:
+                            self._skip_segment(index)
                         expected_index += 1
 
                         # Write any buffered segments that are now in order
@@ -281,21 +876,37 @@ class M3U8_Segments:
                             next_segment = buffer.pop(expected_index)
 
                             if next_segment is not None:
-                                f.write(next_segment)
-                                f.flush()
+                                self._write_segment(f, expected_index, next_segment)
+                            else:
+                                self._skip_segment(expected_index)
 
                             expected_index += 1
-                    
-                    else:
-                        buffer[index] = segment_content
 
-                except queue.Empty:
-                    self.current_timeout = min(MAX_TIMEOOUT, self.current_timeout * 1.1)
-                    if self.stop_event.is_set():
+                        self.segment_buffer.advance(expected_index)
+
+                    except queue.Empty:
+                        self.current_timeout = min(MAX_TIMEOOUT, self.current_timeout * 1.1)
+                        if self.stop_event.is_set():
+                            break
+
+                    except BrokenPipeError:
+                        logging.error("FFmpeg closed the output pipe, stop the download")
+                        self._stop_workers()
                         break
 
-                except Exception as e:
-                    logging.error(f"Error writing segment {index}: {str(e)}")
+                    except Exception as e:
+                        logging.error(f"Error writing segment {index}: {str(e)}")
+
+        # Closing a pipe left by FFmpeg fails to flush the last buffered bytes
+        except BrokenPipeError:
+            logging.error("FFmpeg closed the output pipe before the end of the stream")
+
+        if expected_index >= len(self.segments):
+            self.journal.mark_complete()
+        self.journal.close()
+
+        self.segment_buffer.stop()
+        self.segment_buffer.close()
     
     def download_streams(self, description: str, type: str):
         """
@@ -306,36 +917,27 @@ class M3U8_Segments:
             - type (str): Type of download: 'video' or 'audio'
         """
         self.get_info()
+        self._download_init_segment()
         self.setup_interrupt_handler()
-
-        progress_bar = tqdm(
-            total=len(self.segments), 
-            unit='s',
-            ascii='░▒█',
-            bar_format=self._get_bar_format(description),
-            mininterval=0.05
-        )
+        progress_bar = self._get_progress_bar(description)
 
         try:
             writer_thread = threading.Thread(target=self.write_segments_to_file)
             writer_thread.daemon = True
             writer_thread.start()
 
-            # Configure workers and delay
-            max_workers = self._get_worker_count(type)
-            delay = max(PROXY_START_MIN, min(PROXY_START_MAX, 1 / (len(self.valid_proxy) + 1))) if THERE_IS_PROXY_LIST else TQDM_DELAY_WORKER
-            
-            # Download segments with completion verification
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = []
-                for index, segment_url in enumerate(self.segments):
+            # Request rate is governed by the rate limiter shared by every client pool
+            self.worker_controller = self._create_worker_controller(self._get_worker_count(type))
+            self.decrypt_pool = self._create_decrypt_pool()
 
-                    # Check for interrupt before submitting each task
-                    if self.interrupt_flag.is_set():
-                        break
+            # Download segments with completion verification
+            with ThreadPoolExecutor(max_workers=self.worker_controller.maximum) as executor:
+                futures = self._submit_segments(executor, range(self.resume_index, len(self.segments)), progress_bar)
 
-                    time.sleep(delay)
-                    futures.append(executor.submit(self.download_segment, segment_url, index, progress_bar))
+                # Live playlists keep growing until EXT-X-ENDLIST, the writer appends their segments as they arrive
+                self._start_live()
+                while self.is_live and not self.interrupt_flag.is_set():
+                    futures.extend(self._submit_segments(executor, self._poll_live_playlist(progress_bar), progress_bar))
 
                 # Wait for futures with interrupt handling
                 for future in as_completed(futures):
@@ -346,13 +948,14 @@ class M3U8_Segments:
                     except Exception as e:
                         logging.error(f"Error in download thread: {str(e)}")
 
+                # Segments still decrypting are not missing
+                self._wait_decrypts()
+
                 # Interrupt handling for missing segments
                 if not self.interrupt_flag.is_set():
-                    total_segments = len(self.segments)
-                    completed_segments = len(self.downloaded_segments)
+                    missing_segments = self._get_missing_segments()
                     
-                    if completed_segments < total_segments:
-                        missing_segments = set(range(total_segments)) - self.downloaded_segments
+                    if missing_segments:
                         logging.warning(f"Missing segments: {sorted(missing_segments)}")
                         
                         # Retry missing segments with interrupt check
@@ -366,6 +969,8 @@ class M3U8_Segments:
                             except Exception as e:
                                 logging.error(f"Failed to retry segment {index}: {str(e)}")
 
+                        self._wait_decrypts()
+
         finally:
             self._cleanup_resources(writer_thread, progress_bar)
 
@@ -374,6 +979,35 @@ class M3U8_Segments:
 
         return self._generate_results(type)
     
+    def _submit_segments(self, executor: ThreadPoolExecutor, indexes, progress_bar: tqdm) -> List[Future]:
+        """
+        Submit the downloads of the segments, adjacent byte ranges go in a single request.
+        """
+        futures = []
+        for index, count in self._get_request_groups(indexes):
+
+            # Check for interrupt before submitting each task
+            if self.interrupt_flag.is_set():
+                break
+
+            futures.append(executor.submit(self.download_segment, self.segments[index], index, progress_bar, count=count))
+
+        return futures
+
+    def _get_progress_bar(self, description: str) -> tqdm:
+        """
+        Create the progress bar for the segments of the stream.
+        """
+        return tqdm(
+            total=len(self.segments), 
+            initial=self.resume_index,
+            position=self.bar_position,
+            unit='s',
+            ascii='░▒█',
+            bar_format=self._get_bar_format(description),
+            mininterval=0.05
+        )
+
     def _get_bar_format(self, description: str) -> str:
         """
         Generate platform-appropriate progress bar format.
@@ -408,12 +1042,33 @@ class M3U8_Segments:
             return min(len(self.valid_proxy), base_workers * 2)
         return base_workers
     
+    def _create_worker_controller(self, initial: int, maximum: int = MAX_WORKERS) -> WorkerController:
+        """
+        Controller of the requests in flight, fixed to initial when adaptive workers are disabled.
+        """
+        # More workers than the shared budget would only wait for it
+        if self.worker_budget is not None:
+            maximum = min(maximum, self.worker_budget.size)
+            initial = min(initial, self.worker_budget.size)
+
+        if ADAPTIVE_WORKERS:
+            return WorkerController(initial, minimum=1, maximum=max(initial, maximum))
+        return WorkerController(initial, minimum=initial, maximum=initial)
+
+    def _get_missing_segments(self) -> set:
+        """Segments of this run not downloaded yet."""
+        return set(range(self.resume_index, len(self.segments))) - self.downloaded_segments
+
     def _generate_results(self, stream_type: str) -> Dict:
         """Package final download results."""
         return {
             'type': stream_type,
             'nFailed': self.info_nFailed,
-            'stopped': self.download_interrupted
+            'stopped': self.download_interrupted,
+            'peakBuffer': self.segment_buffer.peak_bytes,
+            'workers': self.worker_controller.get_stats() if self.worker_controller else {},
+            'cache': {'hit': self.cache_hit, 'miss': self.cache_miss},
+            'http': self.client_pool.get_stats() if self.client_pool else {}
         }
     
     def _verify_download_completion(self) -> None:
@@ -426,8 +1081,19 @@ class M3U8_Segments:
     def _cleanup_resources(self, writer_thread: threading.Thread, progress_bar: tqdm) -> None:
         """Ensure resource cleanup and final reporting."""
         self.stop_event.set()
+        self.segment_buffer.stop()
         writer_thread.join(timeout=30)
+
+        if self.decrypt_pool is not None:
+            self.decrypt_pool.shutdown(wait=False, cancel_futures=True)
         progress_bar.close()
+
+        if self.client_pool is not None:
+            logging.info(f"HTTP pool stats: {self.client_pool.get_stats()}")
+            self.client_pool.close()
+
+        if self.worker_controller is not None:
+            logging.info(f"Worker controller stats: {self.worker_controller.get_stats()}")
         
         if self.download_interrupted:
             console.print("\n[red]Download terminated by user")
@@ -0,0 +1,277 @@
+# 18.10.26
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable
+
+
+# External libraries
+from tqdm import tqdm
+
+
+# Internal utilities
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Logic class
+from .segments import M3U8_Segments, REQUEST_MAX_RETRY, ADAPTIVE_WORKERS
+from .pool import AsyncClientPool
+from .segment_cache import segment_cache
+
+
+# Config
+ASYNC_MAX_CONCURRENCY = config_manager.get_int('M3U8_DOWNLOAD', 'async_max_concurrency')
+
+
+
+class M3U8_Segments_Async(M3U8_Segments):
+    """
+    Segment engine built on httpx.AsyncClient: hundreds of requests in flight from a single thread.
+    Ordering, writer thread and result dict are the same of M3U8_Segments.
+    """
+    def _acquire_slots(self) -> bool:
+        """
+        Block until a slot of the worker controller and of the shared worker budget, if any, are held.
+
+        Returns:
+            bool: False if the download has been stopped, no slot is held then.
+        """
+        self.worker_controller.acquire()
+
+        while self.worker_budget is not None and not self.worker_budget.acquire(timeout=0.5):
+            if self.interrupt_flag.is_set():
+                self.worker_controller.release()
+                return False
+
+        if self.interrupt_flag.is_set():
+            self._release_slots()
+            return False
+
+        return True
+
+    def _release_slots(self) -> None:
+        if self.worker_budget is not None:
+            self.worker_budget.release()
+        self.worker_controller.release()
+
+    async def _wait_slots(self) -> bool:
+        """
+        Wait for the slots in the slot thread, the coroutines queue there instead of polling the event loop.
+        """
+        future = self.slot_executor.submit(self._acquire_slots)
+        try:
+            return await asyncio.wrap_future(future)
+
+        except asyncio.CancelledError:
+
+            # The acquire may be running already, give back what it takes
+            future.add_done_callback(lambda f: f.cancelled() or not f.result() or self._release_slots())
+            raise
+
+    async def _budget_get(self, pool: AsyncClientPool, ts_url: str, index: int, headers: Dict = None):
+        """
+        Request a segment holding a slot of the worker controller and of the shared worker budget, if any.
+        The rate limiter is waited first, a slot is never held while sleeping on it.
+        """
+        await pool.wait_turn(ts_url, index)
+        if not await self._wait_slots():
+            raise RuntimeError("Download interrupted")
+
+        try:
+            return await pool.get(ts_url, index, headers=headers)
+        finally:
+            self._release_slots()
+
+    async def _process_segment_async(self, index: int, segment_content: bytes, duration: float, progress_bar: tqdm) -> bool:
+        """
+        Decrypts a downloaded segment and hands it to the writer without blocking the event loop.
+
+        Returns:
+            bool: False if the download has been stopped.
+        """
+        loop = asyncio.get_running_loop()
+        content_size = len(segment_content)
+
+        # Decryption is cpu bound, keep it out of the event loop
+        if self.segment_keys and self.segment_keys[index] is not None:
+            try:
+                # The key may have to be fetched, keep it out of the event loop too
+                decryption = await loop.run_in_executor(None, self._get_decryption, index)
+                segment_content = await loop.run_in_executor(
+                    self.decrypt_pool, decryption.decrypt, segment_content, self._get_segment_iv(index, decryption)
+                )
+            except Exception as e:
+                self._decrypt_failed(index, e)
+                return False
+
+        # Wait for room in the reorder window without blocking the loop
+        in_memory = self.segment_buffer.acquire(index, len(segment_content), blocking=False)
+        while in_memory is None:
+            if self.interrupt_flag.is_set():
+                return False
+            
+            await asyncio.sleep(0.05)
+            in_memory = self.segment_buffer.acquire(index, len(segment_content), blocking=False)
+
+        self._queue_segment(index, segment_content, content_size, duration, progress_bar, in_memory)
+        return True
+
+    async def download_segment_async(self, pool: AsyncClientPool, ts_url: str, index: int, progress_bar: tqdm, backoff_factor: float = 1.1, count: int = 1) -> None:
+        """
+        Downloads a TS segment and adds it to the segment queue with retry logic.
+
+        Parameters:
+            - pool (AsyncClientPool): Async clients used for the requests.
+            - ts_url (str): The URL of the TS segment.
+            - index (int): The index of the segment.
+            - progress_bar (tqdm): Progress counter for tracking download progress.
+            - backoff_factor (float): The backoff factor for exponential backoff.
+            - count (int): Consecutive byte ranges of ts_url fetched by the same request.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Disk reads and writes of the segment cache stay out of the event loop
+        cached = await loop.run_in_executor(None, self._read_cache, index, count) if segment_cache.enabled else None
+        if cached is not None:
+            for segment_index, segment_content in cached:
+                if not await self._process_segment_async(segment_index, segment_content, 0, progress_bar):
+                    return
+            return
+
+        for attempt in range(REQUEST_MAX_RETRY):
+            if self.interrupt_flag.is_set():
+                return
+
+            try:
+                response = await self._budget_get(pool, ts_url, index, self._get_range_headers(index, count))
+
+                # Validate response and content
+                response.raise_for_status()
+
+                # Only the request itself, the waits for a slot would feed the controller its own limit
+                duration = response.elapsed.total_seconds()
+
+                pieces = self._split_ranges(index, count, response)
+                if segment_cache.enabled:
+                    await loop.run_in_executor(None, self._write_cache, pieces)
+
+                for segment_index, segment_content in pieces:
+                    if not await self._process_segment_async(segment_index, segment_content, duration / count, progress_bar):
+                        return
+                return
+
+            except Exception as e:
+
+                # Retry a failed coalesced request as single segments, they are marked failed one by one
+                if count > 1:
+                    logging.info(f"Request of segments {index}-{index + count - 1} failed: {e}, retry them one by one")
+                    self.worker_controller.record_failure(e)
+                    for segment_index in range(index, index + count):
+                        await self.download_segment_async(pool, ts_url, segment_index, progress_bar, backoff_factor)
+                    return
+
+                sleep_time = self._handle_failed_attempt(ts_url, index, attempt, e, progress_bar, backoff_factor)
+                if sleep_time is None:
+                    return
+
+                with self.active_retries_lock:
+                    self.active_retries += 1
+
+                # Backoff without holding a worker thread
+                await asyncio.sleep(sleep_time)
+
+                with self.active_retries_lock:
+                    self.active_retries -= 1
+
+    async def _run_workers(self, pool: AsyncClientPool, indexes: Iterable[int], progress_bar: tqdm) -> None:
+        """
+        Bounded-concurrency scheduler: a fixed number of coroutines consume the segment indexes.
+        """
+        pending = asyncio.Queue()
+        for group in self._get_request_groups(indexes):
+            pending.put_nowait(group)
+
+        async def worker():
+            while not self.interrupt_flag.is_set():
+                try:
+                    index, count = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    await self.download_segment_async(pool, self.segments[index], index, progress_bar, count=count)
+                except Exception as e:
+                    logging.error(f"Error in download task: {str(e)}")
+
+        n_workers = max(1, min(self.worker_controller.maximum, pending.qsize()))
+        await asyncio.gather(*(worker() for _ in range(n_workers)))
+
+    async def _download_all(self, progress_bar: tqdm) -> None:
+        pool = AsyncClientPool(self.client_pool.headers, self.client_pool.proxies, self.worker_controller.maximum)
+
+        # One thread is enough, a waiter can only go once the one before it holds its slots
+        self.slot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slots")
+
+        try:
+            loop = asyncio.get_running_loop()
+            tasks = [asyncio.ensure_future(self._run_workers(pool, range(self.resume_index, len(self.segments)), progress_bar))]
+
+            # Live playlists keep growing until EXT-X-ENDLIST, new segments download while the next reload is awaited
+            self._start_live()
+            while self.is_live and not self.interrupt_flag.is_set():
+                new_indexes = await loop.run_in_executor(None, self._poll_live_playlist, progress_bar)
+                if new_indexes:
+                    tasks.append(asyncio.ensure_future(self._run_workers(pool, new_indexes, progress_bar)))
+
+            await asyncio.gather(*tasks)
+
+            # Retry missing segments
+            if not self.interrupt_flag.is_set():
+                missing_segments = self._get_missing_segments()
+
+                if missing_segments:
+                    logging.warning(f"Missing segments: {sorted(missing_segments)}")
+                    await self._run_workers(pool, sorted(missing_segments), progress_bar)
+
+        finally:
+            self.slot_executor.shutdown(wait=False, cancel_futures=True)
+            await pool.aclose()
+
+            # The sync pool only served the init segment, keep the stats of the requests made by the async clients
+            self.client_pool.close()
+            self.client_pool = pool
+
+    def download_streams(self, description: str, type: str) -> Dict:
+        """
+        Downloads all TS segments with asyncio and writes them to a file.
+
+        Parameters:
+            - description: Description to insert on tqdm bar
+            - type (str): Type of download: 'video' or 'audio'
+        """
+        self.get_info()
+        self._download_init_segment()
+        self.setup_interrupt_handler()
+        progress_bar = self._get_progress_bar(description)
+
+        # Adaptive mode starts from the thread engine worker count and grows up to the async concurrency
+        initial = self._get_worker_count(type) if ADAPTIVE_WORKERS else ASYNC_MAX_CONCURRENCY
+        self.worker_controller = self._create_worker_controller(initial, ASYNC_MAX_CONCURRENCY)
+        self.decrypt_pool = self._create_decrypt_pool()
+
+        try:
+            writer_thread = threading.Thread(target=self.write_segments_to_file)
+            writer_thread.daemon = True
+            writer_thread.start()
+
+            asyncio.run(self._download_all(progress_bar))
+
+        finally:
+            self._cleanup_resources(writer_thread, progress_bar)
+
+        if not self.interrupt_flag.is_set():
+            self._verify_download_completion()
+
+        return self._generate_results(type)
@@ -5,6 +5,7 @@ import re
 import sys
 import signal
 import logging
+import threading
 
 
 # External libraries
@@ -42,7 +43,7 @@ TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
 KILL_HANDLER = bool(False)
    
 
-def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = None):
+def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = None, bar_position: int = None, stop_event: threading.Event = None, label: str = None):
     """
     Downloads an MP4 video from a given URL with robust error handling and SSL bypass.
 
@@ -51,6 +52,9 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
         - path (str): The local path where the downloaded MP4 file will be saved.
         - referer (str, optional): The referer header value.
         - headers_ (dict, optional): Custom headers for the request.
+        - bar_position (int, optional): Line of the progress bar, used when several episodes are downloaded at once.
+        - stop_event (threading.Event, optional): Stops the download when set, used outside of the main thread. Set when the user stops the download, so the caller can stop the next ones.
+        - label (str, optional): Shown in the progress bar in place of 'video', e.g. the episode.
     """
     if TELEGRAM_BOT:
         bot = get_bot_instance()
@@ -113,7 +117,7 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
                 progress_bar = tqdm(
                     total=total,
                     ascii='âââ',
-                    bar_format=f"{Colors.YELLOW}[MP4] {Colors.WHITE}({Colors.CYAN}video{Colors.WHITE}): "
+                    bar_format=f"{Colors.YELLOW}[MP4] {Colors.WHITE}({Colors.CYAN}{label or 'video'}{Colors.WHITE}): "
                                f"{Colors.RED}{{percentage:.2f}}% {Colors.MAGENTA}{{bar}} {Colors.WHITE}[ "
                                f"{Colors.YELLOW}{{n_fmt}}{Colors.WHITE} / {Colors.RED}{{total_fmt}} {Colors.WHITE}] "
                                f"{Colors.YELLOW}{{elapsed}} {Colors.WHITE}< {Colors.CYAN}{{remaining}} {Colors.WHITE}| "
@@ -121,7 +125,9 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
                     unit='iB',
                     unit_scale=True,
                     desc='Downloading',
-                    mininterval=0.05
+                    mininterval=0.05,
+                    position=bar_position,
+                    leave=bar_position is None
                 )
 
                 # Ensure directory exists
@@ -139,17 +145,24 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
                         raise KeyboardInterrupt
                     else:
                         console.print("[bold green]Download almost completed, will exit next[/bold green]")
-                        print("KILL_HANDLER: ", KILL_HANDLER)
+                        stop_after_download.set()
 
 
                 # Download file
+                stop_after_download = threading.Event()
                 with open(path, 'wb') as file, progress_bar as bar:
                     downloaded = 0
                     #Test check stop download
                     #atexit.register(quit_gracefully)
 
+                    # Only the main thread can install a signal handler
+                    is_main_thread = threading.current_thread() is threading.main_thread()
+
                     for chunk in response.iter_bytes(chunk_size=1024):
-                        signal.signal(signal.SIGINT,signal_handler)
+                        if is_main_thread:
+                            signal.signal(signal.SIGINT,signal_handler)
+                        if stop_event is not None and stop_event.is_set():
+                            raise KeyboardInterrupt
                         if chunk:
                             size = file.write(chunk)
                             downloaded += size
@@ -158,6 +171,10 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
                             # if downloaded > MAX_DOWNLOAD_SIZE:
                             #     break
 
+        # Ctrl+C in the second half lets this file complete, the caller stops before the next one
+        if stop_after_download.is_set() and stop_event is not None:
+            stop_event.set()
+
         # Post-download processing
         if os.path.exists(path) and os.path.getsize(path) > 0:
             console.print(Panel(
@@ -186,4 +203,6 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
     
     except KeyboardInterrupt:   
         console.print("[bold red]Download stopped by user.[/bold red]")
+        if stop_event is not None:
+            stop_event.set()
         return None
\ No newline at end of file
@@ -1,4 +1,4 @@
 # 18.04.24
 
-from .command import join_video, join_audios, join_subtitle
+from .command import join_video, join_audios, join_subtitle, join_all, join_stream
 from .util import print_duration_table, get_video_duration
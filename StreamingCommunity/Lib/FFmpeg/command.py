@@ -261,4 +261,168 @@ def join_subtitle(video_path: str, subtitles_list: List[Dict[str, str]], out_pat
                 capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join subtitle")
                 print()
 
-    return out_path
\ No newline at end of file
+    return out_path
+
+def join_all(video_path: str, audio_tracks: List[Dict[str, str]], subtitles_list: List[Dict[str, str]], out_path: str, codec: M3U8_Codec = None):
+    """
+    Joins video, audio tracks and subtitles with a single FFmpeg pass.
+    
+    Parameters:
+        - video_path (str): The path to the video file.
+        - audio_tracks (list[dict[str, str]]): A list of dictionaries containing information about audio tracks.
+            Each dictionary should contain the 'path' key with the path to the audio file.
+        - subtitles_list (list[dict[str, str]]): A list of dictionaries containing information about subtitles.
+            Each dictionary should contain the 'path' key with the path to the subtitle file and the 'language' key.
+        - out_path (str): The path to save the output file.
+        - codec (M3U8_Codec): The codec info of the stream.
+    """
+    audio_tracks = [a for a in audio_tracks if os_manager.check_file(a.get('path'))]
+    subtitles_list = [s for s in subtitles_list if os_manager.check_file(s.get('path'))]
+    video_audio_same_duration = check_duration_v_a(video_path, audio_tracks[0].get('path')) if audio_tracks else True
+
+    # Start command with locate ffmpeg
+    ffmpeg_cmd = [FFMPEG_PATH]
+
+    # Enabled the use of gpu
+    if USE_GPU:
+        ffmpeg_cmd.extend(['-hwaccel', 'cuda'])
+
+    # Add mpegts to force to detect input file as ts file
+    if need_to_force_to_ts(video_path):
+        ffmpeg_cmd.extend(['-f', 'mpegts'])
+
+    # Insert input video path, then audio and subtitle inputs
+    ffmpeg_cmd.extend(['-i', video_path])
+    for audio_track in audio_tracks:
+        ffmpeg_cmd.extend(['-i', audio_track.get('path')])
+    for subtitle in subtitles_list:
+        ffmpeg_cmd.extend(['-i', subtitle.get('path')])
+
+    # Map the video stream, the audio tracks (or the audio inside the video) and the subtitles
+    ffmpeg_cmd.extend(['-map', '0:v'])
+    if audio_tracks:
+        for i in range(1, len(audio_tracks) + 1):
+            ffmpeg_cmd.extend(['-map', f'{i}:a'])
+    else:
+        ffmpeg_cmd.extend(['-map', '0:a?'])
+
+    first_sub_input = len(audio_tracks) + 1
+    for idx, subtitle in enumerate(subtitles_list):
+        ffmpeg_cmd.extend(['-map', f'{first_sub_input + idx}:s'])
+        ffmpeg_cmd.extend([f'-metadata:s:s:{idx}', f"title={subtitle['language']}"])
+
+    # Add output Parameters
+    if USE_CODEC and codec != None:
+        if USE_VCODEC:
+            if codec.video_codec_name: 
+                if not USE_GPU: 
+                    ffmpeg_cmd.extend(['-c:v', codec.video_codec_name])
+                else: 
+                    ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
+            else: 
+                console.log("[red]Cant find vcodec for 'join_all'")
+        else:
+            if USE_GPU:
+                ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
+
+        if USE_ACODEC:
+            if codec.audio_codec_name: 
+                ffmpeg_cmd.extend(['-c:a', codec.audio_codec_name])
+            else: 
+                console.log("[red]Cant find acodec for 'join_all'")
+
+        if USE_BITRATE:
+            ffmpeg_cmd.extend(['-b:v',  f'{codec.video_bitrate // 1000}k'])
+            ffmpeg_cmd.extend(['-b:a',  f'{codec.audio_bitrate // 1000}k'])
+
+    else:
+        ffmpeg_cmd.extend(['-c', 'copy'])
+
+    # Subtitles are always converted to the mp4 text format
+    if subtitles_list:
+        ffmpeg_cmd.extend(['-c:s', 'mov_text'])
+
+    # Ultrafast preset always or fast for gpu
+    if not USE_GPU:
+        ffmpeg_cmd.extend(['-preset', FFMPEG_DEFAULT_PRESET])
+    else:
+        ffmpeg_cmd.extend(['-preset', 'fast'])
+
+    # Use shortest input path for video and audios
+    if not video_audio_same_duration:
+        logging.info("[red]Use shortest input.")
+        ffmpeg_cmd.extend(['-shortest', '-strict', 'experimental'])
+
+    # Overwrite
+    ffmpeg_cmd += [out_path, "-y"]
+    logging.info(f"FFmpeg command: {ffmpeg_cmd}")
+
+    # Run join
+    if DEBUG_MODE:
+        subprocess.run(ffmpeg_cmd, check=True)
+    else:
+
+        if TQDM_USE_LARGE_BAR:
+            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join all")
+            print()
+
+        else:
+            console.log(f"[purple]FFmpeg [white][[cyan]Join all[white]] ...")
+            with suppress_output():
+                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join all")
+                print()
+
+    return out_path
+
+def join_stream(video_pipe: str, audio_tracks: List[Dict[str, str]], subtitles_list: List[Dict[str, str]], out_path: str) -> subprocess.Popen:
+    """
+    Starts FFmpeg remuxing mpegts streams read from named pipes, the mp4 is written while the segments are downloaded.
+    
+    Parameters:
+        - video_pipe (str): The path to the named pipe of the video stream.
+        - audio_tracks (list[dict[str, str]]): Audio tracks to merge, the 'path' key is the named pipe of the track.
+        - subtitles_list (list[dict[str, str]]): Subtitles already downloaded, with 'path' and 'language' keys.
+        - out_path (str): The path to save the output file.
+
+    Returns:
+        subprocess.Popen: The running FFmpeg process, it ends when every pipe is closed.
+    """
+    ffmpeg_cmd = [FFMPEG_PATH, "-loglevel", DEBUG_FFMPEG]
+
+    # Pipes cant be probed by extension
+    ffmpeg_cmd += ["-f", "mpegts", "-i", video_pipe]
+    for audio_track in audio_tracks:
+        ffmpeg_cmd += ["-f", "mpegts", "-i", audio_track['path']]
+
+    subtitles_list = [s for s in subtitles_list if os_manager.check_file(s.get('path'))]
+    for subtitle in subtitles_list:
+        ffmpeg_cmd += ["-i", subtitle['path']]
+
+    # Map video, audio (from the video stream if there are no separate tracks) and subtitles
+    ffmpeg_cmd += ["-map", "0:v"]
+    if audio_tracks:
+        for i in range(1, len(audio_tracks) + 1):
+            ffmpeg_cmd += ["-map", f"{i}:a"]
+    else:
+        ffmpeg_cmd += ["-map", "0:a?"]
+
+    first_sub_input = len(audio_tracks) + 1
+    for idx, subtitle in enumerate(subtitles_list):
+        ffmpeg_cmd += ["-map", f"{first_sub_input + idx}:s"]
+        ffmpeg_cmd += ["-metadata:s:s:{}".format(idx), "title={}".format(subtitle['language'])]
+
+    # Only stream copy, re-encoding is left to the join functions
+    ffmpeg_cmd += ["-c", "copy", "-c:s", "mov_text"]
+
+    # Overwrite
+    ffmpeg_cmd += [out_path, "-y"]
+    logging.info(f"FFmpeg command: {ffmpeg_cmd}")
+
+    # Errors are read back by the caller, debug output goes straight to the console
+    return subprocess.Popen(
+        ffmpeg_cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=None if DEBUG_MODE else subprocess.PIPE,
+        text=True
+    )
@@ -1,11 +1,12 @@
 # 16.04.24
 
 import os
-import sys
 import json
 import subprocess
 import logging
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 
 # Internal utilities
@@ -15,9 +16,62 @@ from StreamingCommunity.Util.os import os_summary
 
 # Variable
 FFPROB_PATH = os_summary.ffprobe_path
+PROBE_CACHE_SIZE = 64
+_probe_cache: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_probe_lock = threading.Lock()
 
 
 
+def probe_file(file_path: str) -> Optional[Dict]:
+    """
+    Run a single ffprobe with format and streams info, cached by path, size and modification time.
+
+    Parameters:
+        - file_path (str): Path to the media file.
+
+    Returns:
+        dict: The parsed ffprobe output, None if the file can't be probed.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError as e:
+        logging.error(f"Cant probe {file_path}: {e}")
+        return None
+
+    # A file rewritten in place changes size or mtime, so it gets probed again
+    key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    with _probe_lock:
+        if key in _probe_cache:
+            _probe_cache.move_to_end(key)
+            return _probe_cache[key]
+
+    ffprobe_cmd = [FFPROB_PATH, '-v', 'error', '-show_format', '-show_streams', '-print_format', 'json', file_path]
+    logging.info(f"FFmpeg command: {ffprobe_cmd}")
+
+    try:
+        result = subprocess.run(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            logging.error(f"ffprobe failed for file {file_path}: {result.stderr}")
+            return None
+
+        info = json.loads(result.stdout)
+
+    except json.JSONDecodeError as e:
+        logging.error(f"Failed to parse JSON output from ffprobe for file {file_path}: {e}")
+        return None
+    
+    except Exception as e:
+        logging.error(f"ffprobe error for file {file_path}: {e}")
+        return None
+
+    with _probe_lock:
+        _probe_cache[key] = info
+        while len(_probe_cache) > PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+
+    return info
+
+
 def has_audio_stream(video_path: str) -> bool:
     """
     Check if the input video has an audio stream.
@@ -28,21 +82,11 @@ def has_audio_stream(video_path: str) -> bool:
     Returns:
         has_audio (bool): True if the input video has an audio stream, False otherwise.
     """
-    try:
-        ffprobe_cmd = [FFPROB_PATH, '-v', 'error', '-print_format', 'json', '-select_streams', 'a', '-show_streams', video_path]
-        logging.info(f"FFmpeg command: {ffprobe_cmd}")
-
-        with subprocess.Popen(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
-            stdout, stderr = proc.communicate()
-            if stderr:
-                logging.error(f"Error: {stderr}")
-            else:
-                probe_result = json.loads(stdout)
-                return bool(probe_result.get('streams', []))
-            
-    except Exception as e:
-        logging.error(f"Error: {e}")
+    probe_result = probe_file(video_path)
+    if probe_result is None:
         return False
+    
+    return any(stream.get('codec_type') == 'audio' for stream in probe_result.get('streams', []))
 
 
 def get_video_duration(file_path: str) -> float:
@@ -55,32 +99,16 @@ def get_video_duration(file_path: str) -> float:
     Returns:
         (float): The duration of the video in seconds if successful, None if there's an error.
     """
+    probe_result = probe_file(file_path)
+    if probe_result is None:
+        return None
 
+    # Extract duration from the video information
     try:
-        ffprobe_cmd = [FFPROB_PATH, '-v', 'error', '-show_format', '-print_format', 'json', file_path]
-        logging.info(f"FFmpeg command: {ffprobe_cmd}")
-
-        # Use a with statement to ensure the subprocess is cleaned up properly
-        with subprocess.Popen(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
-            stdout, stderr = proc.communicate()
-            
-            if proc.returncode != 0:
-                logging.error(f"Error: {stderr}")
-                return None
-            
-            # Parse JSON output
-            probe_result = json.loads(stdout)
-
-            # Extract duration from the video information
-            try:
-                return float(probe_result['format']['duration'])
-            
-            except:
-                return 1
-
-    except Exception as e:
-        logging.error(f"Get video duration error: {e}")
-        sys.exit(0)
+        return float(probe_result['format']['duration'])
+    
+    except:
+        return 1
 
 
 def get_video_duration_s(filename):
@@ -93,23 +121,14 @@ def get_video_duration_s(filename):
     Returns:
         - duration (float): Duration of the video in seconds, or None if an error occurs.
     """
-    ffprobe_cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', filename]
+    probe_result = probe_file(filename)
+    if probe_result is None:
+        return None
 
     try:
-        
-        # Run ffprobe command and capture output
-        result = subprocess.run(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
-        
-        # Extract duration from the output
-        duration_str = result.stdout.strip()
-        duration = float(duration_str)  # Convert duration to float
-        
-        return int(duration)
+        return int(float(probe_result['format']['duration']))
     
-    except subprocess.CalledProcessError as e:
-        print(f"Error running ffprobe: {e}")
-        return None
-    except ValueError as e:
+    except (KeyError, ValueError) as e:
         print(f"Error converting duration to float: {e}")
         return None
 
@@ -170,29 +189,17 @@ def get_ffprobe_info(file_path):
     Returns:
         dict: A dictionary containing the format name and a list of codec names.
     """
-    try:
-        result = subprocess.run(
-            [FFPROB_PATH, '-v', 'error', '-show_format', '-show_streams', '-print_format', 'json', file_path],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True
-        )
-        output = result.stdout
-        info = json.loads(output)
-        
-        format_name = info['format']['format_name'] if 'format' in info else None
-        codec_names = [stream['codec_name'] for stream in info['streams']] if 'streams' in info else []
-        
-        return {
-            'format_name': format_name,
-            'codec_names': codec_names
-        }
-    
-    except subprocess.CalledProcessError as e:
-        logging.error(f"ffprobe failed for file {file_path}: {e}")
+    info = probe_file(file_path)
+    if info is None:
         return None
     
-    except json.JSONDecodeError as e:
-        logging.error(f"Failed to parse JSON output from ffprobe for file {file_path}: {e}")
-        return None
+    format_name = info['format']['format_name'] if 'format' in info else None
+    codec_names = [stream.get('codec_name') for stream in info['streams']] if 'streams' in info else []
+    
+    return {
+        'format_name': format_name,
+        'codec_names': codec_names
+    }
 
 
 def is_png_format_or_codec(file_info):
@@ -1,6 +1,6 @@
 # 02.04.24
 
-from .decryptor import M3U8_Decryption
+from .decryptor import M3U8_Decryption, sequence_to_iv
 from .estimator import M3U8_Ts_Estimator
 from .parser import M3U8_Parser, M3U8_Codec
 from .url_fixer import M3U8_UrlFix
\ No newline at end of file
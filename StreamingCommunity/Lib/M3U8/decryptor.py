@@ -2,6 +2,7 @@
 
 import sys
 import time
+import atexit
 import logging
 import subprocess
 import importlib.util
@@ -11,10 +12,27 @@ import importlib.util
 from StreamingCommunity.Util.console import console
 
 
+# Logic class
+from .libcrypto import load_libcrypto, LibCryptoAES
+
+
+def sequence_to_iv(sequence: int) -> bytes:
+    """
+    IV of a segment without an explicit IV: its media sequence number as a 16 bytes big-endian integer.
+
+    Parameters:
+        - sequence (int): Media sequence number of the segment.
+    """
+    return sequence.to_bytes(16, byteorder="big")
+
+
 # Check if Crypto module is installed
 crypto_spec = importlib.util.find_spec("Cryptodome")
 crypto_installed = crypto_spec is not None
 
+# Without Cryptodome try libcrypto in process before spawning openssl for every segment
+libcrypto = load_libcrypto() if not crypto_installed else None
+
 
 if crypto_installed:
     logging.info("[cyan]Decrypy use: Cryptodomex")
@@ -40,38 +58,44 @@ if crypto_installed:
                 self.iv = bytes.fromhex(iv.replace("0x", ""))
             self.method = method
 
-            # Precreate cipher based on encryption method
-            if self.method == "AES":
-                self.cipher = AES.new(self.key, AES.MODE_ECB)
-            elif self.method == "AES-128":
-                self.cipher = AES.new(self.key[:16], AES.MODE_CBC, iv=self.iv)
-            elif self.method == "AES-128-CTR":
-                self.cipher = AES.new(self.key[:16], AES.MODE_CTR, nonce=self.iv)
-            else:
+            if self.method not in {"AES", "AES-128", "AES-128-CTR"}:
                 raise ValueError("Invalid or unsupported method")
 
-        def decrypt(self, ciphertext: bytes) -> bytes:
+        def _new_cipher(self, iv: bytes):
+            """
+            Cipher contexts are stateful: every segment gets a new one, so segments can be decrypted in any order and in parallel.
+            """
+            if self.method == "AES":
+                return AES.new(self.key, AES.MODE_ECB)
+            
+            if iv is None:
+                raise ValueError("Missing IV for the segment")
+            
+            if self.method == "AES-128":
+                return AES.new(self.key[:16], AES.MODE_CBC, iv=iv)
+            return AES.new(self.key[:16], AES.MODE_CTR, nonce=iv)
+
+        def decrypt(self, ciphertext: bytes, iv: bytes = None) -> bytes:
             """
             Decrypt the ciphertext using the specified encryption method.
 
             Parameters:
                 - ciphertext (bytes): The encrypted content to decrypt.
+                - iv (bytes): IV of the segment, the playlist IV if None.
 
             Returns:
                 bytes: The decrypted content.
             """
             start = time.perf_counter_ns()
-            #logging.info(f"Ciphertext: {ciphertext}")
+            cipher = self._new_cipher(iv or self.iv)
 
             # Decrypt based on encryption method
             if self.method in {"AES", "AES-128"}:
-                decrypted_data = self.cipher.decrypt(ciphertext)
+                decrypted_data = cipher.decrypt(ciphertext)
                 decrypted_content = unpad(decrypted_data, AES.block_size)
                 
-            elif self.method == "AES-128-CTR":
-                decrypted_content = self.cipher.decrypt(ciphertext)
             else:
-                raise ValueError("Invalid or unsupported method")
+                decrypted_content = cipher.decrypt(ciphertext)
 
             end = time.perf_counter_ns() 
 
@@ -89,6 +113,60 @@ if crypto_installed:
             return decrypted_content
 
 
+elif libcrypto is not None:
+    logging.info("[cyan]Decrypy use: libcrypto")
+    libcrypto_aes = LibCryptoAES(libcrypto)
+    atexit.register(libcrypto_aes.close)
+
+    class M3U8_Decryption:
+        """
+        Class for decrypting M3U8 playlist content calling OpenSSL libcrypto through ctypes when the Crypto module is not available.
+        """
+        def __init__(self, key: bytes, iv: bytes, method: str) -> None:
+            """
+            Initialize the M3U8_Decryption object.
+
+            Parameters:
+                - key (bytes): The encryption key.
+                - iv (bytes): The initialization vector (IV).
+                - method (str): The encryption method.
+            """
+            self.key = key
+            self.iv = iv
+            if "0x" in str(iv): 
+                self.iv = bytes.fromhex(iv.replace("0x", ""))
+            self.method = method
+
+            if self.method not in {"AES", "AES-128", "AES-128-CTR"}:
+                raise ValueError("Invalid or unsupported method")
+
+        def decrypt(self, ciphertext: bytes, iv: bytes = None) -> bytes:
+            """
+            Decrypt the ciphertext using the specified encryption method.
+
+            Parameters:
+                - ciphertext (bytes): The encrypted content to decrypt.
+                - iv (bytes): IV of the segment, the playlist IV if None.
+
+            Returns:
+                bytes: The decrypted content.
+            """
+            start = time.perf_counter_ns()
+            iv = iv or self.iv
+            if self.method != "AES" and iv is None:
+                raise ValueError("Missing IV for the segment")
+
+            decrypted_content = libcrypto_aes.decrypt(self.method, self.key, iv, ciphertext)
+            elapsed_milliseconds = (time.perf_counter_ns() - start) / 1_000_000
+
+            logging.info(f"[libcrypto Decryption Performance]")
+            logging.info(f"Method: {self.method}")
+            logging.info(f"Decryption Time: {elapsed_milliseconds:.4f} ms")
+            logging.info(f"Decrypted Content Length: {len(decrypted_content)} bytes")
+
+            return decrypted_content
+
+
 else:
 
     # Check if openssl command is available
@@ -122,25 +200,29 @@ else:
             self.method = method
             logging.info(f"Decrypt add: ('key': {self.key}, 'iv': {self.iv}, 'method': {self.method})")
 
-        def decrypt(self, ciphertext: bytes) -> bytes:
+        def decrypt(self, ciphertext: bytes, iv: bytes = None) -> bytes:
             """
             Decrypt the ciphertext using the specified encryption method.
 
             Parameters:
                 - ciphertext (bytes): The encrypted content to decrypt.
+                - iv (bytes): IV of the segment, the playlist IV if None.
 
             Returns:
                 bytes: The decrypted content.
             """
             start = time.perf_counter_ns()
+            iv = iv or self.iv
+            if self.method != "AES" and iv is None:
+                raise ValueError("Missing IV for the segment")
 
             # Construct OpenSSL command based on encryption method
             if self.method == "AES":
                 openssl_cmd = f'openssl enc -d -aes-256-ecb -K {self.key.hex()} -nosalt'
             elif self.method == "AES-128":
-                openssl_cmd = f'openssl enc -d -aes-128-cbc -K {self.key[:16].hex()} -iv {self.iv.hex()}'
+                openssl_cmd = f'openssl enc -d -aes-128-cbc -K {self.key[:16].hex()} -iv {iv.hex()}'
             elif self.method == "AES-128-CTR":
-                openssl_cmd = f'openssl enc -d -aes-128-ctr -K {self.key[:16].hex()} -iv {self.iv.hex()}'
+                openssl_cmd = f'openssl enc -d -aes-128-ctr -K {self.key[:16].hex()} -iv {iv.hex()}'
             else:
                 raise ValueError("Invalid or unsupported method")
 
@@ -47,7 +47,7 @@ class M3U8_Ts_Estimator:
 
     def add_ts_file(self, size: int, size_download: int, duration: float):
         """Add a file size to the list of file sizes."""
-        if size <= 0 or size_download <= 0 or duration <= 0:
+        if size <= 0 or size_download <= 0 or duration < 0:
             logging.error(f"Invalid input values: size={size}, size_download={size_download}, duration={duration}")
             return
 
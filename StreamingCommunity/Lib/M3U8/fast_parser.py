@@ -0,0 +1,149 @@
+# 18.10.26
+
+import re
+import logging
+from array import array
+from typing import List, Optional
+
+
+# Variable
+ATTRIBUTE_PATTERN = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+
+# Tags understood by the scanner, any other #EXT tag sends the playlist to the m3u8 library
+SKIPPED_TAGS = frozenset((
+    "#EXTM3U",
+    "#EXT-X-VERSION",
+    "#EXT-X-DISCONTINUITY-SEQUENCE",
+    "#EXT-X-PLAYLIST-TYPE",
+    "#EXT-X-INDEPENDENT-SEGMENTS",
+    "#EXT-X-ALLOW-CACHE",
+    "#EXT-X-DISCONTINUITY",
+    "#EXT-X-PROGRAM-DATE-TIME",
+))
+
+
+
+class FastMediaPlaylist:
+    def __init__(self, text: str):
+        """
+        Scan result of a media playlist, as arrays of offsets into the raw text.
+        M3U8_Parser copies it into its usual segment lists, only the parsing is lighter than the m3u8 library.
+
+        Parameters:
+            - text (str): Raw content of the playlist.
+        """
+        self.text = text
+        self.uri_start = array('l')
+        self.uri_end = array('l')
+        self.durations = array('d')
+        self.key_indices = array('l')           # -1 for segments without EXT-X-KEY
+        self.keys: List[dict] = []
+        self.media_sequence = 0
+        self.target_duration = 0.0
+        self.is_endlist = False
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def uri(self, index: int) -> str:
+        return self.text[self.uri_start[index]:self.uri_end[index]]
+
+    def uris(self) -> List[str]:
+        text = self.text
+        return [text[start:end] for start, end in zip(self.uri_start, self.uri_end)]
+
+    def segment_key(self, index: int) -> Optional[dict]:
+        """Key in effect for the segment, None if it is not encrypted."""
+        key_index = self.key_indices[index]
+        if key_index < 0:
+            return None
+
+        key = self.keys[key_index]
+        return None if key['method'] in (None, "NONE") else key
+
+
+def _parse_attributes(value: str) -> dict:
+    return {name: raw.strip('"') for name, raw in ATTRIBUTE_PATTERN.findall(value)}
+
+
+def parse_media_playlist(text: str) -> Optional[FastMediaPlaylist]:
+    """
+    Scan a media playlist line by line without building per segment objects.
+
+    Parameters:
+        - text (str): Raw content of the playlist.
+
+    Returns:
+        FastMediaPlaylist: The parsed playlist, None if it is a master playlist or uses tags the scanner does not handle.
+    """
+    playlist = FastMediaPlaylist(text)
+    durations = playlist.durations
+    uri_start = playlist.uri_start
+    uri_end = playlist.uri_end
+    key_indices = playlist.key_indices
+
+    key_index = -1
+    duration = None
+    pos = 0
+    length = len(text)
+
+    while pos < length:
+        end = text.find('\n', pos)
+        if end == -1:
+            end = length
+        line = text[pos:end]
+        start = pos
+        pos = end + 1
+
+        # Keep offsets of the stripped line
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if len(stripped) != len(line):
+            start += len(line) - len(line.lstrip())
+            end = start + len(stripped)
+            line = stripped
+
+        if line[0] != '#':
+            if duration is None:
+                logging.info(f"Fast parser: uri without EXTINF at offset {start}")
+                return None
+
+            durations.append(duration)
+            uri_start.append(start)
+            uri_end.append(end)
+            key_indices.append(key_index)
+            duration = None
+            continue
+
+        tag, _, value = line.partition(':')
+
+        if tag == "#EXTINF":
+            duration = float(value.split(',', 1)[0])
+
+        elif tag == "#EXT-X-KEY":
+            attributes = _parse_attributes(value)
+            playlist.keys.append({
+                'method': attributes.get('METHOD'),
+                'iv': attributes.get('IV'),
+                'uri': attributes.get('URI')
+            })
+            key_index = len(playlist.keys) - 1
+
+        elif tag == "#EXT-X-MEDIA-SEQUENCE":
+            playlist.media_sequence = int(value)
+
+        elif tag == "#EXT-X-TARGETDURATION":
+            playlist.target_duration = float(value)
+
+        elif tag == "#EXT-X-ENDLIST":
+            playlist.is_endlist = True
+
+        elif tag.startswith("#EXT") and tag not in SKIPPED_TAGS:
+            logging.info(f"Fast parser: unsupported tag {tag}")
+            return None
+
+    if not durations:
+        return None
+
+    return playlist
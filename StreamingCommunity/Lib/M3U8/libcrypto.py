@@ -0,0 +1,136 @@
+# 18.10.26
+
+import ctypes
+import ctypes.util
+import logging
+import threading
+from typing import List
+
+
+# Variable
+_EVP_CIPHERS = {
+    ("AES", 16): "EVP_aes_128_ecb",
+    ("AES", 24): "EVP_aes_192_ecb",
+    ("AES", 32): "EVP_aes_256_ecb",
+    ("AES-128", 16): "EVP_aes_128_cbc",
+    ("AES-128-CTR", 16): "EVP_aes_128_ctr",
+}
+
+
+
+def _find_libcrypto():
+    """Candidate names of libcrypto for the current platform."""
+    names = []
+    for name in ("crypto", "libcrypto", "libcrypto-3-x64", "libcrypto-1_1-x64"):
+        try:
+            found = ctypes.util.find_library(name)
+        except Exception:
+            found = None
+
+        if found:
+            names.append(found)
+
+    return names + ["libcrypto.so.3", "libcrypto.so.1.1", "libcrypto.3.dylib"]
+
+
+def load_libcrypto():
+    """
+    Load OpenSSL libcrypto through ctypes.
+
+    Returns:
+        ctypes.CDLL: The library with the EVP prototypes set, None if it can't be loaded.
+    """
+    for name in _find_libcrypto():
+        try:
+            lib = ctypes.CDLL(name)
+            lib.EVP_CIPHER_CTX_new.restype = ctypes.c_void_p
+            lib.EVP_CIPHER_CTX_free.argtypes = [ctypes.c_void_p]
+            lib.EVP_DecryptInit_ex.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+            lib.EVP_DecryptUpdate.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_int), ctypes.c_char_p, ctypes.c_int]
+            lib.EVP_DecryptFinal_ex.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+
+            for symbol in set(_EVP_CIPHERS.values()):
+                getattr(lib, symbol).restype = ctypes.c_void_p
+
+            return lib
+
+        except (OSError, AttributeError) as e:
+            logging.info(f"Cant load {name}: {e}")
+
+    return None
+
+
+class LibCryptoAES:
+    def __init__(self, lib: ctypes.CDLL):
+        """
+        AES decryption calling libcrypto in process: no subprocess per segment and the GIL is released during the calls.
+        Cipher contexts are kept in a pool and re-initialized for each segment, there are as many as the decryptions running together.
+
+        Parameters:
+            - lib (ctypes.CDLL): libcrypto returned by load_libcrypto.
+        """
+        self.lib = lib
+        self._contexts: List[int] = []
+        self._lock = threading.Lock()
+
+    def _acquire_context(self) -> int:
+        with self._lock:
+            if self._contexts:
+                return self._contexts.pop()
+
+        ctx = self.lib.EVP_CIPHER_CTX_new()
+        if not ctx:
+            raise MemoryError("EVP_CIPHER_CTX_new failed")
+        return ctx
+
+    def _release_context(self, ctx: int) -> None:
+        with self._lock:
+            self._contexts.append(ctx)
+
+    def close(self) -> None:
+        """Free the cipher contexts of the pool."""
+        with self._lock:
+            contexts, self._contexts = self._contexts, []
+
+        for ctx in contexts:
+            self.lib.EVP_CIPHER_CTX_free(ctx)
+
+    def decrypt(self, method: str, key: bytes, iv: bytes, ciphertext: bytes) -> bytes:
+        """
+        Decrypt a segment.
+
+        Parameters:
+            - method (str): HLS method, AES (ECB), AES-128 (CBC with PKCS7 padding) or AES-128-CTR.
+            - key (bytes): The encryption key.
+            - iv (bytes): IV of the segment, ignored by ECB.
+            - ciphertext (bytes): The encrypted content.
+        """
+        key = key if method == "AES" else key[:16]
+        symbol = _EVP_CIPHERS.get((method, len(key)))
+        if symbol is None:
+            raise ValueError("Invalid or unsupported method")
+
+        # Short CTR nonces are followed by a counter starting from zero, like Cryptodome
+        if method == "AES-128-CTR" and len(iv) < 16:
+            iv = iv + bytes(16 - len(iv))
+
+        ctx = self._acquire_context()
+        try:
+            if self.lib.EVP_DecryptInit_ex(ctx, getattr(self.lib, symbol)(), None, key, iv if method != "AES" else None) != 1:
+                raise ValueError("EVP_DecryptInit_ex failed")
+
+            out = ctypes.create_string_buffer(len(ciphertext) + 32)
+            out_len = ctypes.c_int(0)
+            if self.lib.EVP_DecryptUpdate(ctx, out, ctypes.byref(out_len), ciphertext, len(ciphertext)) != 1:
+                raise ValueError("EVP_DecryptUpdate failed")
+
+            final_len = ctypes.c_int(0)
+
+            # Final block (padding removed) goes right after the updated data
+            if self.lib.EVP_DecryptFinal_ex(ctx, ctypes.addressof(out) + out_len.value, ctypes.byref(final_len)) != 1:
+                raise ValueError("Decryption failed: bad padding")
+
+        finally:
+            self._release_context(ctx)
+
+        return out.raw[:out_len.value + final_len.value]
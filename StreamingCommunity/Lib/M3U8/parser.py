@@ -7,12 +7,18 @@ import logging
 # Internal utilities
 from m3u8 import loads
 from StreamingCommunity.Util.os import internet_manager
+from StreamingCommunity.Util._jsonConfig import config_manager
+from .fast_parser import parse_media_playlist
 
 
 # External libraries
 import httpx
 
 
+# Config
+FAST_PARSER = config_manager.get_bool('M3U8_PARSER', 'fast_parser')
+
+
 # Costant
 CODEC_MAPPINGS = {
     "video": {
@@ -425,6 +431,9 @@ class M3U8_Parser:
         self.segments = []
         self.video_playlist = []
         self.keys = None
+        self.segment_keys = []
+        self.segment_ranges = []
+        self.init_segment = None
         self.subtitle_playlist = []
         self.subtitle = []
         self.audio_playlist = []
@@ -433,6 +442,9 @@ class M3U8_Parser:
         self._audio: M3U8_Audio = None
         self._subtitle: M3U8_Subtitle = None
         self.duration: float = 0
+        self.media_sequence: int = 0
+        self.target_duration: float = 0
+        self.is_endlist = False
 
         self.__create_variable__()
 
@@ -444,8 +456,18 @@ class M3U8_Parser:
             - m3u8_content (str): The content of the M3U8 file.
         """
 
+        # Large media playlists are scanned without the m3u8 library, which stays the fallback for everything else
+        if FAST_PARSER:
+            playlist = parse_media_playlist(raw_content)
+            if playlist is not None:
+                self.__parse_fast_playlist__(playlist)
+                return
+
         # Get obj of the m3u8 text content download, dictionary with video, audio, segments, subtitles
         m3u8_obj = loads(raw_content, uri)
+        self.media_sequence = m3u8_obj.media_sequence or 0
+        self.target_duration = m3u8_obj.target_duration or 0
+        self.is_endlist = m3u8_obj.is_endlist
 
         self.__parse_video_info__(m3u8_obj)
         self.__parse_subtitles_and_audio__(m3u8_obj)
@@ -570,6 +592,64 @@ class M3U8_Parser:
             sys.exit(0)
             pass
 
+    @staticmethod
+    def __get_segment_key__(segment):
+        """
+        Key in effect for a segment, keys can rotate along the playlist.
+
+        Returns:
+            dict: 'method', 'iv' and 'uri' of the key, None if the segment is not encrypted.
+        """
+        key = segment.key
+        if key is None or key.method in (None, "NONE"):
+            return None
+        
+        return {
+            'method': key.method,
+            'iv': key.iv,
+            'uri': key.uri
+        }
+
+    @staticmethod
+    def __parse_byterange__(byterange, uri, range_ends: dict):
+        """
+        Resolve an EXT-X-BYTERANGE, without offset a sub-range starts where the previous one of the same uri ended.
+
+        Parameters:
+            - byterange (str): Value of the tag, "<length>[@<offset>]".
+            - uri (str): Resource the range belongs to.
+            - range_ends (dict): End of the last range of each uri, updated.
+
+        Returns:
+            tuple: (offset, length) of the range, None if the segment is the whole resource.
+        """
+        if not byterange:
+            return None
+
+        length, _, offset = str(byterange).partition('@')
+        offset = int(offset) if offset else range_ends.get(uri, 0)
+        length = int(length)
+
+        range_ends[uri] = offset + length
+        return (offset, length)
+
+    def __parse_init_segment__(self, segment) -> None:
+        """
+        Store the EXT-X-MAP of the playlist, fMP4 streams have a single init section.
+        """
+        init_section = segment.init_section
+        if init_section is None or not init_section.uri:
+            return
+
+        if self.init_segment is None:
+            self.init_segment = {
+                'uri': init_section.uri,
+                'range': self.__parse_byterange__(init_section.byterange, init_section.uri, {})
+            }
+
+        elif self.init_segment['uri'] != init_section.uri:
+            logging.warning(f"Multiple EXT-X-MAP are not supported, keep {self.init_segment['uri']}")
+
     def __parse_subtitles_and_audio__(self, m3u8_obj) -> None:
         """
         Extracts subtitles and audio information from the M3U8 object.
@@ -609,6 +689,8 @@ class M3U8_Parser:
         """
 
         try:
+            range_ends = {}
+
             for segment in m3u8_obj.segments:
 
                 # Parse key
@@ -619,12 +701,41 @@ class M3U8_Parser:
 
                 if "vtt" not in segment.uri:
                     self.segments.append(segment.uri)
+                    self.segment_keys.append(self.__get_segment_key__(segment))
+                    self.segment_ranges.append(self.__parse_byterange__(segment.byterange, segment.uri, range_ends))
+                    self.__parse_init_segment__(segment)
                 else:
                     self.subtitle.append(segment.uri)
 
         except Exception as e:
             logging.error(f"Error parsing segments: {e}")
 
+    def __parse_fast_playlist__(self, playlist) -> None:
+        """
+        Fills the segment information from a playlist parsed by the fast scanner.
+
+        Parameters:
+            - playlist (FastMediaPlaylist): The scanned media playlist.
+        """
+        self.media_sequence = playlist.media_sequence
+        self.target_duration = playlist.target_duration
+        self.is_endlist = playlist.is_endlist
+        self.duration += sum(playlist.durations)
+
+        for index, segment_uri in enumerate(playlist.uris()):
+            key_index = playlist.key_indices[index]
+            if self.keys is None and key_index >= 0:
+                self.keys = playlist.keys[key_index]
+
+            if "vtt" not in segment_uri:
+                self.segments.append(segment_uri)
+                self.segment_keys.append(playlist.segment_key(index))
+                self.segment_ranges.append(None)
+            else:
+                self.subtitle.append(segment_uri)
+
+        self.is_master_playlist = False
+
     def __create_variable__(self):
         """
         Initialize variables for video, audio, and subtitle playlists.
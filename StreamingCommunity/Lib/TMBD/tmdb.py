@@ -5,13 +5,13 @@ from typing import Dict
 
 
 # External libraries
-import httpx
 from rich.console import Console
 
 
 # Internal utilities
 from .obj_tmbd import Json_film
 from StreamingCommunity.Util.table import TVShowManager
+from StreamingCommunity.Util.http_session import session_registry
 
 
 # Variable
@@ -117,7 +117,7 @@ class TheMovieDB:
 
         params['api_key'] = self.api_key
         url = f"{self.base_url}/{endpoint}"
-        response = httpx.get(url, params=params)
+        response = session_registry.get(url, params=params)
         response.raise_for_status()
         
         return response.json()
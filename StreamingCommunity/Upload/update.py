@@ -5,15 +5,12 @@ import sys
 import time
 
 
-# External library
-import httpx
-
-
 # Internal utilities
 from .version import __version__, __author__, __title__
 from StreamingCommunity.Util.console import console
 from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util.http_session import session_registry
 
 
 
@@ -29,14 +26,14 @@ def update():
     Check for updates on GitHub and display relevant information.
     """
     try:
-        response_reposity = httpx.get(
+        response_reposity = session_registry.get(
             url=f"https://api.github.com/repos/{__author__}/{__title__}", 
             headers={'user-agent': get_headers()}, 
             timeout=config_manager.get_int("REQUESTS", "timeout"), 
             follow_redirects=True
         ).json()
 
-        response_releases = httpx.get(
+        response_releases = session_registry.get(
             url=f"https://api.github.com/repos/{__author__}/{__title__}/releases",
             headers={'user-agent': get_headers()}, 
             timeout=config_manager.get_int("REQUESTS", "timeout"), 
@@ -5,6 +5,7 @@ import sys
 import json
 import httpx
 import logging
+import threading
 from typing import Any, List
 
 
@@ -18,6 +19,7 @@ class ConfigManager:
         self.file_path = file_path
         self.config = {}
         self.cache = {}
+        self.write_lock = threading.Lock()
 
     def read_config(self) -> None:
         """Read the configuration file."""
@@ -217,7 +219,7 @@ class ConfigManager:
     def write_config(self) -> None:
         """Write the configuration to the file."""
         try:
-            with open(self.file_path, 'w') as f:
+            with self.write_lock, open(self.file_path, 'w') as f:
                 json.dump(self.config, f, indent=4)
         except Exception as e:
             print(f"Error writing configuration file: {e}")
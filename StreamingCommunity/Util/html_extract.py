@@ -0,0 +1,151 @@
+# 18.10.26
+
+import re
+import html
+import logging
+import importlib.util
+from typing import Dict, List, Optional
+
+
+# External libraries
+from bs4 import BeautifulSoup
+
+
+# Internal utilities
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Config
+HTML_PARSER = config_manager.get('DEFAULT', 'html_parser')
+
+
+# Variable
+lxml_installed = importlib.util.find_spec("lxml") is not None
+ATTRIBUTE_PATTERN = re.compile(r'''([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?''')
+BODY_PATTERN = re.compile(r'<body\b', re.IGNORECASE)
+
+# Comments and the bodies of script and style are text, not markup: a tag written there is not a tag of the page
+RAW_TEXT_PATTERN = re.compile(
+    r'<!--.*?(?:-->|\Z)|(<(script|style)\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>)(.*?)(?:</\2\s*>|\Z)',
+    re.IGNORECASE | re.DOTALL
+)
+_tag_patterns: Dict[str, re.Pattern] = {}
+
+
+
+def get_parser_backend() -> str:
+    """
+    Backend used by get_soup: 'auto' takes lxml when it is installed, else the pure python html.parser.
+    """
+    if HTML_PARSER == "auto":
+        return "lxml" if lxml_installed else "html.parser"
+
+    if HTML_PARSER == "lxml" and not lxml_installed:
+        logging.warning("html_parser 'lxml' requested but not installed, fallback to html.parser")
+        return "html.parser"
+
+    return HTML_PARSER
+
+
+def get_soup(text: str) -> BeautifulSoup:
+    """
+    Full tree of a page with the configured backend, for pages that are walked in depth.
+
+    Parameters:
+        - text (str): Html of the page.
+    """
+    return BeautifulSoup(text, get_parser_backend())
+
+
+def _get_tag_pattern(tag: str) -> re.Pattern:
+    """Start tags of tag, or a comment or a script and style body to step over, as group 4 is only set for the tag."""
+    pattern = _tag_patterns.get(tag)
+    if pattern is None:
+        pattern = re.compile(
+            rf'{RAW_TEXT_PATTERN.pattern}|<{tag}\b((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>',
+            re.IGNORECASE | re.DOTALL
+        )
+        _tag_patterns[tag] = pattern
+
+    return pattern
+
+
+def _parse_attributes(raw: str) -> Dict[str, str]:
+    attributes = {}
+    for name, double, single, bare in ATTRIBUTE_PATTERN.findall(raw):
+        name = name.lower()
+        if name not in attributes:
+            attributes[name] = html.unescape(double or single or bare)
+
+    return attributes
+
+
+def find_attribute(text: str, tag: str, attribute: str, match: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """
+    Value of an attribute of the first tag matching, scanning the start tags only and stopping at the first hit.
+    Tags inside comments, scripts and styles are skipped, as the html parsers do. Falls back to the full tree when the scan finds nothing, e.g. on broken markup.
+
+    Parameters:
+        - text (str): Html of the page.
+        - tag (str): Tag name, e.g. 'iframe'.
+        - attribute (str): Attribute to read, e.g. 'src'.
+        - match (dict): Attributes the tag must have, e.g. {'id': 'app'}.
+
+    Returns:
+        str: The unescaped value, None if no tag matches.
+    """
+    match = match or {}
+
+    for tag_match in _get_tag_pattern(tag).finditer(text):
+        if tag_match.group(4) is not None:
+            raw_attributes = tag_match.group(4)
+
+        # The start tag of a script or style is still a tag
+        elif tag_match.group(2) is not None and tag_match.group(2).lower() == tag.lower():
+            raw_attributes = tag_match.group(1)[len(tag) + 1:-1]
+
+        else:
+            continue
+
+        attributes = _parse_attributes(raw_attributes)
+
+        if all(attributes.get(name) == value for name, value in match.items()) and attribute in attributes:
+            return attributes[attribute]
+
+    logging.info(f"Fast extraction missed <{tag} {match}>, using {get_parser_backend()}")
+    node = get_soup(text).find(tag, match)
+    return node.get(attribute) if node is not None else None
+
+
+def get_body_scripts(text: str) -> List[str]:
+    """
+    Raw content of the script tags inside body, in page order, leaving out the commented ones.
+
+    Parameters:
+        - text (str): Html of the page.
+    """
+    body = BODY_PATTERN.search(text)
+    if body is None:
+        soup = get_soup(text)
+        return [script.text for script in soup.find("body").find_all("script")] if soup.find("body") else []
+
+    return [
+        raw.group(3) for raw in RAW_TEXT_PATTERN.finditer(text, body.end())
+        if raw.group(2) is not None and raw.group(2).lower() == "script"
+    ]
+
+
+# Known selectors of the scraped sites
+def get_data_page(text: str) -> Optional[str]:
+    """Inertia page state: div#app[data-page]."""
+    return find_attribute(text, "div", "data-page", {'id': 'app'})
+
+
+def get_iframe_src(text: str) -> Optional[str]:
+    """Source of the first iframe."""
+    return find_attribute(text, "iframe", "src")
+
+
+def get_meta_content(text: str, name: str) -> Optional[str]:
+    """Content of meta[name=name], e.g. csrf-token."""
+    return find_attribute(text, "meta", "content", {'name': name})
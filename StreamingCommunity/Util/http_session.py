@@ -0,0 +1,181 @@
+# 18.10.26
+
+import atexit
+import asyncio
+import logging
+import threading
+import importlib.util
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+
+# External libraries
+import httpx
+
+
+# Internal utilities
+from StreamingCommunity.Util.headers import get_headers
+from StreamingCommunity.Util._jsonConfig import config_manager
+
+
+# Config
+MAX_TIMEOUT = config_manager.get_int("REQUESTS", "timeout")
+MAX_CONNECTIONS = config_manager.get_int("REQUESTS", "max_connections")
+KEEPALIVE_EXPIRY = config_manager.get_float("REQUESTS", "keepalive_expiry")
+USE_HTTP2 = config_manager.get_bool("REQUESTS", "use_http2")
+
+
+# Variable
+CONNECT_RETRIES = 2
+h2_installed = importlib.util.find_spec("h2") is not None
+
+
+
+class SessionRegistry:
+    def __init__(self, timeout: float = MAX_TIMEOUT, retries: int = CONNECT_RETRIES):
+        """
+        Keep-alive httpx clients shared by the scrapers and players, one for each host.
+        A client keeps the cookies of its host, so the requests that resolve an episode reuse warm connections.
+
+        Parameters:
+            - timeout (float): Default timeout of the requests, a request can pass its own.
+            - retries (int): Attempts to open a connection before failing.
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.http2 = USE_HTTP2 and h2_installed
+        self.limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        )
+
+        self._clients: Dict[Tuple[str, bool], httpx.Client] = {}
+        self._async_clients: Dict[Tuple[str, bool], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        return urlparse(str(url)).netloc.lower()
+
+    def _get_client_params(self) -> Dict:
+        return {
+            'headers': {'User-Agent': get_headers()},
+            'timeout': self.timeout
+        }
+
+    def get_client(self, url: str, verify: bool = True) -> httpx.Client:
+        """
+        Return the client of the host of url, creating it on first use.
+
+        Parameters:
+            - url (str): Any url of the host.
+            - verify (bool): Check the TLS certificate, hosts with a broken certificate get their own client.
+        """
+        key = (self._get_host(url), verify)
+
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+
+                if client is None:
+                    transport = httpx.HTTPTransport(retries=self.retries, verify=verify, http2=self.http2, limits=self.limits)
+                    client = httpx.Client(transport=transport, **self._get_client_params())
+                    self._clients[key] = client
+                    logging.info(f"New http session for {key[0]}")
+
+        return client
+
+    def get_async_client(self, url: str, verify: bool = True) -> httpx.AsyncClient:
+        """
+        Return the async client of the host of url for the running event loop.
+        The caller closes them with aclose_async_clients before its loop ends.
+
+        Parameters:
+            - url (str): Any url of the host.
+            - verify (bool): Check the TLS certificate.
+        """
+        loop = asyncio.get_running_loop()
+        key = (self._get_host(url), verify)
+
+        with self._lock:
+            entry = self._async_clients.get(key)
+
+            # An async client is bound to the loop that created it
+            if entry is None or entry[0] is not loop:
+                if entry is not None:
+                    self._discard_async_client(*entry)
+
+                transport = httpx.AsyncHTTPTransport(retries=self.retries, verify=verify, http2=self.http2, limits=self.limits)
+                entry = (loop, httpx.AsyncClient(transport=transport, **self._get_client_params()))
+                self._async_clients[key] = entry
+
+        return entry[1]
+
+    async def aclose_async_clients(self) -> None:
+        """Close the async clients of the running event loop."""
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            keys = [key for key, (client_loop, _) in self._async_clients.items() if client_loop is loop]
+            clients = [self._async_clients.pop(key)[1] for key in keys]
+
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logging.error(f"Error closing async client: {e}")
+
+    @staticmethod
+    def _discard_async_client(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+        """Close a client left open by another loop, it can only be closed from its own loop."""
+        if not loop.is_closed() and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            logging.warning("Async client dropped without aclose_async_clients, its connections leak")
+
+    def request(self, method: str, url: str, verify: bool = True, cookies: Dict = None, **kwargs) -> httpx.Response:
+        """
+        Send a request through the client of the host, the other arguments are the ones of httpx.Client.request.
+
+        Parameters:
+            - method (str): Http method.
+            - url (str): The URL to request.
+            - verify (bool): Check the TLS certificate.
+            - cookies (dict): Cookies added to the session of the host.
+        """
+        client = self.get_client(url, verify)
+
+        # httpx deprecates per request cookies, they join the session of the host
+        if cookies:
+            client.cookies.update(cookies)
+
+        return client.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close every sync client, the async ones are closed by aclose_async_clients on their loop."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+            for loop, client in self._async_clients.values():
+                self._discard_async_client(loop, client)
+            self._async_clients.clear()
+
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logging.error(f"Error closing client: {e}")
+
+
+# Shared by every site and player of the process
+session_registry = SessionRegistry()
+atexit.register(session_registry.close)
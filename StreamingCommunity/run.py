@@ -19,6 +19,7 @@ from StreamingCommunity.Util._jsonConfig import config_manager
 from StreamingCommunity.Upload.update import update as git_update
 from StreamingCommunity.Util.os import os_summary
 from StreamingCommunity.Util.logger import Logger
+from StreamingCommunity.Api.Template.Util import global_search
 
 
 # Telegram util
@@ -228,6 +229,10 @@ def main(script_id):
         '--specific_list_subtitles', type=str, help='Comma-separated list of specific subtitle languages to download (e.g., eng,spa).'
     )
 
+    parser.add_argument(
+        '--global', dest='global_search', type=str, help='Search a title on every site at the same time (e.g., --global "cars").'
+    )
+
     # Add arguments for search functions
     color_map = {
         "anime": "red",
@@ -274,6 +279,10 @@ def main(script_id):
     # Map command-line arguments to functions
     arg_to_function = {alias: func for alias, (func, _) in search_functions.items()}
 
+    if args.global_search is not None:
+        run_function(lambda: global_search(search_functions, args.global_search))
+        return
+
     # Check which argument is provided and run the corresponding function
     for arg, func in arg_to_function.items():
         if getattr(args, arg):
@@ -286,6 +295,12 @@ def main(script_id):
     # Create dynamic prompt message and choices
     choice_labels = {str(i): (alias.split("_")[0].capitalize(), use_for) for i, (alias, (_, use_for)) in enumerate(search_functions.items())}
 
+    # Last choice searches every site at once, not offered to the bot that asks one site at a time
+    if not TELEGRAM_BOT:
+        global_key = str(len(search_functions))
+        input_to_function[global_key] = lambda: global_search(search_functions)
+        choice_labels[global_key] = ("Global", "other")
+
     # Display the category legend in a single line
     legend_text = " | ".join([f"[{color}]{category.capitalize()}[/{color}]" for category, color in color_map.items()])
     console.print(f"\n[bold green]Category Legend:[/bold green] {legend_text}")
@@ -0,0 +1,93 @@
+# 18.10.26
+
+# Fix import
+import sys
+import os
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+
+# Import
+import time
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from StreamingCommunity.Lib.M3U8.libcrypto import load_libcrypto, LibCryptoAES
+from StreamingCommunity.Lib.M3U8.decryptor import sequence_to_iv
+
+
+# Variable
+N_SEGMENTS = 64
+SEGMENT_SIZE = 2 * 1024 * 1024
+N_THREADS = 4
+KEY = bytes(range(16))
+
+
+def encrypt_segments():
+    """AES-128 segments with media sequence IVs, encrypted with the openssl cli to not depend on Cryptodome."""
+    segments = []
+    for i in range(N_SEGMENTS):
+        data = os.urandom(SEGMENT_SIZE)
+        ciphertext = subprocess.check_output(
+            ['openssl', 'enc', '-aes-128-cbc', '-K', KEY.hex(), '-iv', sequence_to_iv(i).hex()],
+            input=data
+        )
+        segments.append((i, data, ciphertext))
+    return segments
+
+
+def decrypt_cryptodome(index, ciphertext):
+    from Cryptodome.Cipher import AES
+    from Cryptodome.Util.Padding import unpad
+    return unpad(AES.new(KEY, AES.MODE_CBC, iv=sequence_to_iv(index)).decrypt(ciphertext), AES.block_size)
+
+
+libcrypto = load_libcrypto()
+libcrypto_aes = LibCryptoAES(libcrypto) if libcrypto else None
+
+def decrypt_libcrypto(index, ciphertext):
+    return libcrypto_aes.decrypt("AES-128", KEY, sequence_to_iv(index), ciphertext)
+
+
+def decrypt_openssl(index, ciphertext):
+    return subprocess.check_output(
+        ['openssl', 'enc', '-d', '-aes-128-cbc', '-K', KEY.hex(), '-iv', sequence_to_iv(index).hex()],
+        input=ciphertext
+    )
+
+
+def run(name, func, segments, threads):
+    start = time.perf_counter()
+    if threads == 1:
+        results = [func(i, c) for i, _, c in segments]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(lambda s: func(s[0], s[2]), segments))
+
+    elapsed = time.perf_counter() - start
+    assert all(r == s[1] for r, s in zip(results, segments)), f"{name}: wrong plaintext"
+
+    mb = N_SEGMENTS * SEGMENT_SIZE / (1024 * 1024)
+    print(f"{name:<12} threads={threads:<2} {elapsed:8.3f} s {mb / elapsed:10.1f} MB/s")
+
+
+# Test
+if shutil.which('openssl') is None:
+    print("openssl cli is required to build the encrypted segments")
+    sys.exit(0)
+
+segments = encrypt_segments()
+backends = [("openssl", decrypt_openssl)]
+if libcrypto_aes is not None:
+    backends.append(("libcrypto", decrypt_libcrypto))
+
+try:
+    import Cryptodome
+    backends.append(("cryptodome", decrypt_cryptodome))
+except ImportError:
+    print("pycryptodomex not installed, skip")
+
+for name, func in backends:
+    for threads in (1, N_THREADS):
+        run(name, func, segments, threads)
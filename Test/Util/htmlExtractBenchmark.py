@@ -0,0 +1,75 @@
+# 18.10.26
+
+# Fix import
+import sys
+import os
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+
+# Import
+import time
+import json
+import importlib.util
+from bs4 import BeautifulSoup
+from StreamingCommunity.Util.html_extract import get_data_page, get_iframe_src, get_body_scripts, get_meta_content
+
+
+# Variable
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+REPEAT = 200
+BACKENDS = ["html.parser"] + (["lxml"] if importlib.util.find_spec("lxml") else [])
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# Extraction done by the scrapers before, one full tree for each value
+def soup_data_page(text, backend):
+    return BeautifulSoup(text, backend).find("div", {"id": "app"}).get("data-page")
+
+def soup_iframe_src(text, backend):
+    return BeautifulSoup(text, backend).find("iframe").get("src")
+
+def soup_body_script(text, backend):
+    return BeautifulSoup(text, backend).find("body").find("script").text
+
+def soup_meta_content(text, backend):
+    for html_meta in BeautifulSoup(text, backend).find_all("meta"):
+        if html_meta.get('name') == "csrf-token":
+            return html_meta.get('content')
+
+
+CASES = [
+    ("sc_title.html", "div#app[data-page]", soup_data_page, get_data_page),
+    ("sc_iframe.html", "iframe[src]", soup_iframe_src, get_iframe_src),
+    ("vix_embed.html", "body > script", soup_body_script, lambda text: get_body_scripts(text)[0]),
+    ("au_home.html", "meta[name=csrf-token]", soup_meta_content, lambda text: get_meta_content(text, "csrf-token")),
+]
+
+
+def run(function, *args):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = function(*args)
+    return (time.perf_counter() - start) / REPEAT * 1000, result
+
+
+# Test
+for name, selector, soup_function, fast_function in CASES:
+    text = read_fixture(name)
+    fast_time, fast_result = run(fast_function, text)
+
+    timings = {}
+    for backend in BACKENDS:
+        timings[backend], soup_result = run(soup_function, text, backend)
+        assert soup_result == fast_result, f"{name}: {backend} and fast extraction differ"
+
+    if name == "sc_title.html":
+        assert json.loads(fast_result)['version'], "version missing"
+
+    soup_timings = "  ".join(f"{backend}={soup_time:7.3f} ms" for backend, soup_time in timings.items())
+    print(f"{name:<15} {selector:<22} {soup_timings}  fast={fast_time:7.3f} ms  speedup={timings['html.parser'] / fast_time:6.1f}x")
@@ -0,0 +1,74 @@
+# 18.10.26
+
+# Fix import
+import sys
+import os
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+
+# Import
+import time
+import tracemalloc
+import StreamingCommunity.Lib.M3U8.parser as m3u8_parser
+from StreamingCommunity.Lib.M3U8.fast_parser import parse_media_playlist
+
+
+# Variable
+N_SEGMENTS = (1_000, 10_000, 100_000)
+KEY_EVERY = 500
+URI = "https://example.com/hls/index.m3u8"
+
+
+def build_playlist(n_segments):
+    """Media playlist with a rotating AES-128 key every KEY_EVERY segments."""
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3", "#EXT-X-TARGETDURATION:4", "#EXT-X-MEDIA-SEQUENCE:0", "#EXT-X-PLAYLIST-TYPE:VOD"]
+    for i in range(n_segments):
+        if i % KEY_EVERY == 0:
+            lines.append(f'#EXT-X-KEY:METHOD=AES-128,URI="https://example.com/keys/{i // KEY_EVERY}.key",IV=0x{i:032x}')
+        lines.append("#EXTINF:4.004000,")
+        lines.append(f"https://cdn.example.com/hls/segment-{i:06d}.ts?token=abcdef0123456789")
+    lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+def parse(text, fast):
+    m3u8_parser.FAST_PARSER = fast
+    parser = m3u8_parser.M3U8_Parser()
+    parser.parse_data(URI, text)
+    return parser
+
+
+def run(text, fast):
+    start = time.perf_counter()
+    parser = parse(text, fast)
+    return time.perf_counter() - start, parser
+
+
+def peak_memory(text, fast):
+    """Peak MB allocated while parsing, the segment lists kept by the parser are the same for both."""
+    tracemalloc.start()
+    parse(text, fast)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+# Test
+for n_segments in N_SEGMENTS:
+    text = build_playlist(n_segments)
+
+    start = time.perf_counter()
+    parse_media_playlist(text)
+    scan_time = time.perf_counter() - start
+
+    m3u8_time, slow = run(text, False)
+    fast_time, fast = run(text, True)
+
+    assert slow.segments == fast.segments, "segments differ"
+    assert slow.segment_keys == fast.segment_keys, "keys differ"
+    assert slow.duration == fast.duration, "duration differs"
+
+    print(f"segments={n_segments:<7} m3u8={m3u8_time:8.3f} s  fast={fast_time:8.3f} s  scan only={scan_time:8.3f} s  speedup={m3u8_time / fast_time:6.1f}x  "
+          f"peak m3u8={peak_memory(text, False):6.1f} MB  fast={peak_memory(text, True):6.1f} MB")
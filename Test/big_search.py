@@ -16,6 +16,7 @@ from rich.console import Console
 
 # Other import
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.Util import search_all_sites
 
 
 # Variable
@@ -81,36 +82,18 @@ def load_search_functions():
     return loaded_functions
 
 
-def search_all_sites(loaded_functions, search_string, max_sites=10):
-    total_len_database = 0
-    site_count = 0
+def search_all(loaded_functions, search_string):
+    database: MediaManager = search_all_sites(loaded_functions, search_string)
 
-    for module_alias, (search_function, use_for) in loaded_functions.items():
-        if max_sites is not None and site_count >= max_sites:
-            break
+    for element in database.media_list:
+        print(element.__dict__)
 
-        console.print(f"\n[blue]Searching in module: {module_alias} [white](Use for: {use_for})")
-        
-        try:
-            database: MediaManager = search_function(search_string, get_onylDatabase=True)
-            len_database = len(database.media_list)
-
-            for element in database.media_list:
-                print(element.__dict__)
-
-            console.print(f"[green]Database length for {module_alias}: {len_database}")
-            total_len_database += len_database 
-            site_count += 1 
-
-        except Exception as e:
-            console.print(f"[red]Error while executing search function for {module_alias}: {str(e)}")
-
-    return total_len_database
+    return database.get_length()
 
 
 # Main
 search_string = "cars"
 loaded_functions = load_search_functions()
 
-total_len = search_all_sites(loaded_functions, search_string)
+total_len = search_all(loaded_functions, search_string)
 console.print(f"\n[cyan]Total number of results from all sites: {total_len}")